@@ -1,17 +1,43 @@
 """Avangard.ru internal api client."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import itertools
 import logging
-from datetime import date
-
-from playwright.async_api import BrowserContext, Page, Playwright
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Iterator
+
+from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Locator, Page, Playwright, Response
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright.async_api import async_playwright
 
-from app.avangard_parser import AvangardPayment, parse_income_payments
+from app import metrics
+from app.avangard_parser import PAYMENTS_TABLE_CLASS, AvangardPayment, parse_income_payments_stats, payment_key
+from app.browser_state import StateVault, trim_profile_dir
+from app.network_filter import ResourceFilter
+from app.page_archive import PageArchive
+from app.statement_form import FormFields, StatementForm, parse_statement_form
+from app.watchdog import browser_marker, find_marked_pids, kill_process_tree, run_with_deadline
 
 LOGIN_START_PAGE = 'https://login.avangard.ru/'
 MAIN_PAGE = 'https://corp.avangard.ru/clbAvn/faces/facelet-pages/iday_balance.jspx'
+STATEMENT_PAGE_MARKER = f'class="{PAYMENTS_TABLE_CLASS}"'  # statement table, reports page has the same title
+PAGE_TITLE_XPATH = '//div[@class="pageTitle"]'
+REPORTS_BUTTON_XPATH = '//input[@value="Выписки и отчеты"]'
+LOGIN_FORM_XPATH = '//input[@name="login_v"]'
+LOGIN_ERROR_XPATH = '//*[contains(@class, "error") and normalize-space()]'
+CLOSE_TIMEOUT_SECONDS = 10
+
+DateWindow = tuple[date, date]
+
+
+class UnauthorizedError(RuntimeError):
+    """Bank session is not authorized or expired."""
 
 
 class AvangardApi:
@@ -21,120 +47,385 @@ class AvangardApi:
         self,
         user_dir: str,
         timeout_seconds: float,
-        slow_mo: int | None = None,
+        type_delay_ms: float | None = None,
         headless: bool = True,
         user_agent: str = None,
+        parse_executor: Executor | None = None,
+        resource_filter: ResourceFilter | None = None,
+        fast_fetch: bool = False,
+        playwright_factory: Callable[[], Awaitable[Playwright]] | None = None,
+        account: str = 'default',
+        login_page: str = LOGIN_START_PAGE,
+        main_page: str = MAIN_PAGE,
+        page_archive: PageArchive | None = None,
+        state_vault: StateVault | None = None,
+        profile_max_mb: float | None = None,
     ) -> None:
-        """Create new client."""
+        """
+        Create new client, statements are parsed in parse_executor if set or inline.
+
+        Browser actions run without artificial delays, only login form is typed with type_delay_ms between keys.
+
+        With fast_fetch statements are requested by replaying search form POST with browser cookies,
+        browser renders pages only for login and (re)capturing the form.
+        Shared playwright driver of playwright_factory is never stopped by client.
+        Bank pages urls can be changed to point client to local stand-in.
+        Fetched statements are saved to page_archive if set, unchanged statement of a window is not parsed again.
+        With state_vault browser runs lean context restored from saved storage state instead of persistent profile
+        in user_dir, otherwise profile caches are trimmed to profile_max_mb before launch.
+        """
         self.authorized: bool = False
-        self._slow_mo = slow_mo
+        self.parse_stats: dict[str, float] = {'calls': 0, 'seconds': 0, 'bytes': 0}
+        self._parse_executor = parse_executor
+        self._resource_filter = resource_filter
+        self._page_archive = page_archive
+        self._state_vault = state_vault
+        self._state_restored = False
+        self._profile_max_mb = profile_max_mb
+        self._fast_fetch = fast_fetch
+        self._statement_form: StatementForm | None = None
+        self._type_delay_ms = type_delay_ms
         self._user_agent = user_agent
         self._user_dir = user_dir
         self._headless = headless
         self._base_timeout_ms = timeout_seconds * 1000
         self._locator_timeout_ms = self._base_timeout_ms / 2
+        self._playwright_factory = playwright_factory
+        self._account = account
+        self._login_page = login_page
+        self._main_page = main_page
         self._playwright_wrapper: Playwright | None = None
+        self._lean_browser: Browser | None = None
         self._browser: BrowserContext | None = None
         self._active_page: Page | None = None
         self._initialized = False
+        self._browser_marker = browser_marker()
 
     async def setup_browser(self) -> None:
         """Init browser env."""
         if self._initialized:
             return
 
-        self._playwright_wrapper = await async_playwright().start()
-        self._browser = await self._playwright_wrapper.chromium.launch_persistent_context(
-            user_data_dir=self._user_dir,
-            user_agent=self._user_agent,
-            timeout=self._base_timeout_ms,
-            headless=self._headless,
-            slow_mo=self._slow_mo,
-        )
+        with metrics.browser_launch_seconds.time(account=self._account):
+            if self._playwright_factory:
+                playwright = await self._playwright_factory()
+            else:
+                self._playwright_wrapper = await async_playwright().start()
+                playwright = self._playwright_wrapper
+            if self._state_vault:
+                self._browser = await self._launch_lean_context(playwright, self._state_vault)
+            else:
+                self._browser = await self._launch_persistent_context(playwright)
+        if self._resource_filter:
+            await self._resource_filter.install(self._browser)
         self._initialized = True
 
     async def terminate(self) -> None:
-        """Close client and logout from bank."""
+        """Close client and logout from bank, every close step is bounded and browser processes left are killed."""
         logging.debug('close call')
         self.authorized = False
         self._initialized = False
+        self._statement_form = None
 
         if self._active_page:
-            await self._active_page.close()
+            await self._close_step('page', self._active_page.close())
             self._active_page = None
 
         if self._browser:
             logging.debug('close browser')
-            await self._browser.close()
+            await self._close_step('browser', self._browser.close())
             self._browser = None
 
+        if self._lean_browser:
+            await self._close_step('lean_browser', self._lean_browser.close())
+            self._lean_browser = None
+
         if self._playwright_wrapper:
             logging.debug('close wrapper')
-            self._playwright_wrapper.stop()
+            await self._close_step('playwright', self._playwright_wrapper.stop())
             self._playwright_wrapper = None
+        await self._kill_browser_processes()
 
-    async def login(self, login: str, password: str) -> bool:
-        """Login to internet bank."""
-        page = await self._get_page()
-        await page.goto(LOGIN_START_PAGE)
-        logging.debug(f'open start page {page.url}')
+    async def kill(self) -> None:
+        """Kill browser processes at once (hung browser does not answer close) and release client."""
+        await self._kill_browser_processes()
+        await self.terminate()
 
-        await self._fill_login_form(page, login, password)
+    def browser_pids(self) -> set[int]:
+        """Return pids of Chromium processes started by this client (found by its marker switch)."""
+        return find_marked_pids(self._browser_marker)
 
-        await page.locator('//div[@class="buttonLoginBank"]').click()
-        logging.debug('click login')
+    async def start_tracing(self) -> None:
+        """Start playwright trace recording of browser context."""
+        await self._browser.tracing.start(screenshots=True, snapshots=True)  # type: ignore
+        logging.debug('start tracing')
 
-        self.authorized = await self._check_authorized(page)
-        logging.debug(f'check login result {self.authorized}')
+    async def stop_tracing(self, path: str) -> None:
+        """Stop playwright trace recording and save it to zip file."""
+        await self._browser.tracing.stop(path=path)  # type: ignore
+        logging.debug(f'save trace {path=}')
+
+    async def login(self, login: str, password: str) -> bool:
+        """Login to internet bank, session restored from storage state is reused while it is alive."""
+        page = await self._get_page()
+        if self._state_restored and await self._check_restored_session(page):
+            return True
 
+        self.authorized = await self._submit_login_form(page, login, password)
+        if self._state_vault and self.authorized:
+            storage_state = await self._browser.storage_state()  # type: ignore
+            await asyncio.to_thread(self._state_vault.save, storage_state)
         return self.authorized
 
-    async def get_income_payments(  # noqa: WPS217
+    async def get_income_payments(
         self,
         start_date: date,
         end_date: date,
     ) -> list[AvangardPayment]:
         """Return list of income payments."""
         page = await self._get_page()
-        await page.goto(MAIN_PAGE)
-        logging.debug(f'open main page {page.url}')
+        html_source = await self._fetch_statement(page, start_date, end_date)
+        return await self._parse_window((start_date, end_date), html_source)
+
+    async def backfill_income_payments(
+        self,
+        start_date: date,
+        end_date: date,
+        window_days: int,
+        concurrency: int,
+    ) -> list[AvangardPayment]:
+        """Return unique income payments of long date range, fetched by windows over a pool of pages."""
+        windows = split_date_range(start_date, end_date, window_days)
+        async with contextlib.AsyncExitStack() as resources:
+            pages = await self._open_pages(resources, min(concurrency, len(windows)))
+            windows_payments = await asyncio.gather(*[
+                self._backfill_window(pages, window)
+                for window in windows
+            ])
+
+        unique_payments = {
+            payment_key(payment): payment
+            for payment in itertools.chain.from_iterable(windows_payments)
+        }
+        logging.debug(f'backfill {windows=} found {len(unique_payments)} payments')
+        return list(unique_payments.values())
+
+    async def _open_pages(self, resources: contextlib.AsyncExitStack, count: int) -> asyncio.Queue[Page]:
+        pages: asyncio.Queue[Page] = asyncio.Queue()
+        for _ in range(max(count, 1)):
+            page = await self._browser.new_page()  # type: ignore
+            resources.push_async_callback(page.close)
+            pages.put_nowait(page)
+        return pages
+
+    async def _backfill_window(self, pages: asyncio.Queue[Page], window: DateWindow) -> list[AvangardPayment]:
+        async with _borrow_page(pages) as page:
+            html_source = await self._fetch_statement(page, *window)
+        return await self._parse_window(window, html_source)
+
+    async def _parse_window(self, window: DateWindow, html_source: str) -> list[AvangardPayment]:
+        if self._page_archive is None:
+            return await self._parse(html_source)
+
+        statement = await asyncio.to_thread(self._page_archive.store, window, html_source)
+        payments = self._page_archive.cached_payments(window, statement)
+        if payments is not None:
+            logging.info(f'statement not changed, skip parsing {window=}')
+            metrics.parse_skipped.inc(account=self._account)
+            return payments
+
+        payments = await self._parse(html_source)
+        self._page_archive.remember(window, statement, payments)
+        return payments
+
+    async def _parse(self, html_source: str) -> list[AvangardPayment]:
+        started_at = time.perf_counter()
+        if self._parse_executor is None:
+            payments, skipped = parse_income_payments_stats(html_source)
+        else:
+            # process pool gets raw utf-8 bytes only: cheaper to pickle than str and no page objects
+            source = html_source.encode() if isinstance(self._parse_executor, ProcessPoolExecutor) else html_source
+            payments, skipped = await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor,
+                parse_income_payments_stats,
+                source,
+            )
 
-        self.authorized = await self._check_authorized(page)
+        elapsed = time.perf_counter() - started_at
+        self.parse_stats['calls'] += 1
+        self.parse_stats['seconds'] += elapsed
+        self.parse_stats['bytes'] += len(html_source)
+        metrics.parse_seconds.observe(elapsed, account=self._account)
+        metrics.page_bytes.observe(len(html_source), account=self._account)
+        metrics.parsed_rows.inc(len(payments), account=self._account, result='income')
+        for reason, rows_count in skipped.items():
+            metrics.parsed_rows.inc(rows_count, account=self._account, result=reason)
+        logging.info(f'parse statement {elapsed=:.3f} {skipped=}')
+        return payments
+
+    async def _fetch_statement(
+        self,
+        page: Page,
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        if self._statement_form:
+            html_source = await self._post_statement_form(self._statement_form, start_date, end_date)
+            if html_source is not None:
+                return html_source
+        return await self._render_statement(page, start_date, end_date)
+
+    async def _post_statement_form(self, form: StatementForm, start_date: date, end_date: date) -> str | None:
+        with self._track('fast_search'):
+            try:
+                html_source = await self._post_form(form.action, form.with_dates(start_date, end_date))
+            except PlaywrightError as exc:
+                logging.warning(f'fast fetch statement failed {exc=}')
+                html_source = ''
+
+        if STATEMENT_PAGE_MARKER not in html_source:
+            # view state expired or session lost: forget form, browser path recaptures it or fails authorization
+            logging.info('fast fetch statement unexpected response, fallback to browser')
+            self._statement_form = None
+            return None
+        logging.debug(f'fast fetch statement {len(html_source)=}')
+        return html_source
+
+    async def _post_form(self, url: str, fields: FormFields) -> str:
+        response = await self._browser.request.post(url, form=fields, timeout=self._base_timeout_ms)  # type: ignore
+        return await response.text()
+
+    async def _render_statement(  # noqa: WPS217
+        self,
+        page: Page,
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        with self._track('main_page'):
+            await page.goto(self._main_page)
+            logging.debug(f'open main page {page.url}')
+            self.authorized = await self._check_authorized(page)
         if not self.authorized:
-            raise RuntimeError('Unauthorized')
+            raise UnauthorizedError('Unauthorized')
 
-        await page.locator('//input[@value="Выписки и отчеты"]').click()
+        with self._track('reports_page'):
+            await page.locator(REPORTS_BUTTON_XPATH).click()
         logging.debug(f'open reports page {page.url}')
+        if self._fast_fetch:
+            self._statement_form = parse_statement_form(await page.content(), page.url)
+            logging.debug(f'capture statement form {self._statement_form=}')
+
+        with self._track('search_form'):
+            await self._fill_search_form(
+                page,
+                start_date.strftime('%d.%m.%Y'),
+                end_date.strftime('%d.%m.%Y'),
+            )
 
-        await self._fill_search_form(
-            page,
-            start_date.strftime('%d.%m.%Y'),
-            end_date.strftime('%d.%m.%Y'),
-        )
+        with self._track('search'):
+            try:
+                await self._search(page)
+            except PlaywrightTimeout:
+                raise RuntimeError('Search payments failed')
 
-        await page.locator('//img[@title="Показать"]').click()
-        logging.debug('click search')
+        return await page.content()
 
+    @contextlib.contextmanager
+    def _track(self, step: str) -> Iterator[None]:
+        with contextlib.ExitStack() as resources:
+            resources.enter_context(metrics.step_seconds.time(account=self._account, step=step))
+            if self._resource_filter:
+                resources.enter_context(self._resource_filter.track(step))
+            yield
+
+    async def _close_step(self, step: str, closing: Awaitable[None]) -> None:
         try:
-            await page.locator('//div[@class="pageTitle"]').wait_for(
-                timeout=self._locator_timeout_ms,
-            )
-        except PlaywrightTimeout:
-            raise RuntimeError('Search payments failed')
+            await run_with_deadline(closing, CLOSE_TIMEOUT_SECONDS, f'close {step}')
+        except Exception as exc:
+            logging.warning(f'browser close step failed {step=} {exc!r}')
+
+    async def _kill_browser_processes(self) -> None:
+        browser_pids = await asyncio.to_thread(self.browser_pids)
+        if browser_pids:
+            killed = await kill_process_tree(browser_pids)
+            metrics.browser_killed.inc(len(killed), account=self._account)
+
+    async def _launch_persistent_context(self, playwright: Playwright) -> BrowserContext:
+        if self._profile_max_mb:
+            await asyncio.to_thread(trim_profile_dir, self._user_dir, self._profile_max_mb)
+        return await playwright.chromium.launch_persistent_context(
+            user_data_dir=self._user_dir,
+            user_agent=self._user_agent,
+            timeout=self._base_timeout_ms,
+            headless=self._headless,
+            args=[self._browser_marker],
+        )
 
-        return parse_income_payments(await page.content())
+    async def _launch_lean_context(self, playwright: Playwright, state_vault: StateVault) -> BrowserContext:
+        storage_state = await asyncio.to_thread(state_vault.load)
+        self._state_restored = storage_state is not None
+        logging.debug(f'launch lean browser context {self._state_restored=}')
+        self._lean_browser = await playwright.chromium.launch(
+            timeout=self._base_timeout_ms,
+            headless=self._headless,
+            args=[self._browser_marker],
+        )
+        return await self._lean_browser.new_context(
+            user_agent=self._user_agent,
+            storage_state=storage_state,  # type: ignore
+        )
+
+    async def _check_restored_session(self, page: Page) -> bool:
+        self._state_restored = False
+        with self._track('restore_session'):
+            await page.goto(self._main_page)
+            self.authorized = await self._check_authorized(page)
+        logging.info(f'restore saved bank session {self.authorized=}')
+        return self.authorized
 
-    async def _check_authorized(self, page: Page) -> bool:
-        authorized = True
+    async def _submit_login_form(self, page: Page, login: str, password: str) -> bool:
+        with self._track('login_page'):
+            await page.goto(self._login_page)
+        logging.debug(f'open start page {page.url}')
+
+        await self._fill_login_form(page, login, password)
+
+        with self._track('login'):
+            try:
+                await self._submit(page, page.locator('//div[@class="buttonLoginBank"]'))
+            except PlaywrightTimeout:
+                logging.warning('login form submit timeout')
+                return False
+            logging.debug('click login')
+            # login page is still rendered until redirect: fail fast on error message only
+            authorized = await self._check_authorized(page, LOGIN_ERROR_XPATH)
+        logging.debug(f'check login result {authorized}')
+        return authorized
+
+    async def _check_authorized(self, page: Page, unauthorized_xpath: str = LOGIN_FORM_XPATH) -> bool:
+        markers = page.locator(f'{REPORTS_BUTTON_XPATH} | {unauthorized_xpath}')
         try:
-            await page.locator('//input[@value="Выписки и отчеты"]').wait_for(
-                timeout=self._locator_timeout_ms,
-            )
+            await markers.first.wait_for(state='attached', timeout=self._base_timeout_ms)
         except PlaywrightTimeout:
-            authorized = False
+            logging.warning('check authorized timeout')
+            return False
+        authorized = await page.locator(REPORTS_BUTTON_XPATH).count() > 0
         logging.debug(f'check authorized {authorized}')
         return authorized
 
+    async def _search(self, page: Page) -> None:
+        with self._track('search_response'):
+            await self._submit(page, page.locator('//img[@title="Показать"]'))
+        logging.debug('click search')
+        await page.locator(PAGE_TITLE_XPATH).wait_for(state='attached', timeout=self._base_timeout_ms)
+
+    async def _submit(self, page: Page, button: Locator) -> Response:
+        async with page.expect_response(_is_post_response, timeout=self._base_timeout_ms) as response_info:
+            await button.click(timeout=self._locator_timeout_ms)
+        response = await response_info.value  # noqa: WPS441
+        logging.debug(f'form submitted {response.url} {response.status}')
+        return response
+
     async def _fill_search_form(self, page: Page, start_date: str, end_date: str) -> None:
         await page.locator('//input[@name="docslist:main:startdate"]').fill(
             value=start_date,
@@ -147,12 +438,14 @@ class AvangardApi:
         logging.debug('fill search payments form')
 
     async def _fill_login_form(self, page: Page, login: str, password: str) -> None:
-        await page.locator('//input[@name="login_v"]').type(
+        await page.locator(LOGIN_FORM_XPATH).type(
             text=login,
+            delay=self._type_delay_ms,
             timeout=self._locator_timeout_ms,
         )
         await page.locator('//input[@name="passwd_v"]').type(
             text=password,
+            delay=self._type_delay_ms,
             timeout=self._locator_timeout_ms,
         )
         logging.debug('fill auth form')
@@ -168,3 +461,27 @@ class AvangardApi:
             raise RuntimeError('Browser.Page not initialized.')
 
         return self._active_page
+
+
+def split_date_range(start_date: date, end_date: date, window_days: int) -> list[DateWindow]:
+    """Split [start_date, end_date] into consecutive windows of window_days at most."""
+    window = timedelta(days=max(window_days, 1))
+    windows: list[DateWindow] = []
+    while start_date <= end_date:
+        window_end = min(start_date + window - timedelta(days=1), end_date)
+        windows.append((start_date, window_end))
+        start_date = window_end + timedelta(days=1)
+    return windows
+
+
+def _is_post_response(response: Response) -> bool:
+    return response.request.method == 'POST'
+
+
+@contextlib.asynccontextmanager
+async def _borrow_page(pages: asyncio.Queue[Page]) -> AsyncIterator[Page]:
+    page = await pages.get()
+    try:
+        yield page
+    finally:
+        pages.put_nowait(page)
@@ -4,13 +4,27 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import io
 import logging
 import re
+from collections import Counter
 from decimal import Decimal
+from typing import IO, AnyStr, Iterable, Iterator, Union
 
 from lxml import etree
 
 stringify = etree.XPath('string()')
+payment_rows_xpath = etree.XPath('//table[@class="x2f"]//tr')
+row_cells_xpath = etree.XPath('.//td[@headers]')
+spaces_re = re.compile(r'\s+')
+agent_inn_re = re.compile(r'ИНН(\d+)')
+invoice_number_re = re.compile(r'[#№]{1}(\d+)')
+payment_date_re = re.compile(r'(\d\d)\.(\d\d)\.(\d{4})')
+PAYMENTS_TABLE_CLASS = 'x2f'
+STREAM_CHUNK_SIZE = 65536
+
+HtmlStream = Union[str, bytes, IO[AnyStr], Iterable[AnyStr]]
+PaymentKey = tuple[int, datetime.date, int]
 
 
 @dataclasses.dataclass
@@ -25,45 +39,114 @@ class AvangardPayment:
     description: str
 
 
-def parse_income_payments(html_source: str) -> list[AvangardPayment]:
-    """Return income avangard payments from html source."""
-    payment_rows = etree.HTML(html_source).xpath('//table[@class="x2f"]//tr')
-    logging.debug(f'fetch payment rows {payment_rows=}')
+def payment_key(payment: AvangardPayment) -> PaymentKey:
+    """Return unique payment key."""
+    return payment.payment_number, payment.payment_date, payment.agent_inn
+
+
+def parse_income_payments(html_source: str | bytes, skipped: Counter[str] | None = None) -> list[AvangardPayment]:
+    """Return income avangard payments from html source (bytes are utf-8 encoded html), count skipped rows by reason."""
+    skipped = Counter() if skipped is None else skipped
+    html_parser = etree.HTMLParser(encoding='utf-8') if isinstance(html_source, bytes) else None
+    payment_rows = payment_rows_xpath(etree.HTML(html_source, parser=html_parser))
+    debug = logging.root.isEnabledFor(logging.DEBUG)
+    if debug:
+        logging.debug(f'fetch payment rows {payment_rows=}')
     if not payment_rows:
         return []
 
     payments_list: list[AvangardPayment] = []
     for row in payment_rows:
-        payment = _parse_income_payment_row(row)
-        logging.debug(f'parse row {row=}')
+        payment = _parse_income_payment_row(row, skipped)
+        if debug:
+            logging.debug(f'parse row {row=} result {payment=}')
         if payment:
-            logging.debug(f'parse row result {payment=}')
             payments_list.append(payment)
 
     return payments_list
 
 
-def _parse_income_payment_row(row: etree._Element) -> AvangardPayment | None:  # noqa: WPS437
-    cells = row.xpath('.//td[@headers]')
-    if len(cells) != 9:
-        logging.debug(f'Invalid columns count {cells=}')
+def parse_income_payments_stats(html_source: str | bytes) -> tuple[list[AvangardPayment], Counter[str]]:
+    """Return income avangard payments and counts of skipped rows by reason (picklable result for executors)."""
+    skipped: Counter[str] = Counter()
+    return parse_income_payments(html_source, skipped), skipped
+
+
+def iter_income_payments(html_source: HtmlStream, skipped: Counter[str] | None = None) -> Iterator[AvangardPayment]:
+    """Yield income avangard payments from html source (string, file or chunks) with flat memory usage."""
+    skipped = Counter() if skipped is None else skipped
+    parser: etree.HTMLPullParser | None = None
+    for chunk in _iter_chunks(html_source):
+        if parser is None:
+            parser = etree.HTMLPullParser(
+                events=('end',),
+                tag='tr',
+                encoding='utf-8' if isinstance(chunk, bytes) else None,
+            )
+        parser.feed(chunk)
+        yield from _read_payment_rows(parser, skipped)
+
+    if parser is not None:
+        parser.close()
+        yield from _read_payment_rows(parser, skipped)
+
+
+def _read_payment_rows(parser: etree.HTMLPullParser, skipped: Counter[str]) -> Iterator[AvangardPayment]:
+    for _, row in parser.read_events():
+        tables = [table.get('class') for table in row.iterancestors('table')]
+        if PAYMENTS_TABLE_CLASS not in tables:
+            continue
+
+        payment = _parse_income_payment_row(row, skipped)
+        if payment:
+            yield payment
+
+        if tables[0] == PAYMENTS_TABLE_CLASS:
+            # top-level payments row: drop it with already processed siblings to keep memory flat
+            row.clear(keep_tail=True)
+            while row.getprevious() is not None:
+                del row.getparent()[0]  # noqa: WPS420
+
+
+def _iter_chunks(html_source: HtmlStream) -> Iterator[AnyStr]:
+    if isinstance(html_source, (str, bytes)):
+        offsets = range(0, len(html_source), STREAM_CHUNK_SIZE)
+        yield from (html_source[offset:offset + STREAM_CHUNK_SIZE] for offset in offsets)  # type: ignore
+    elif isinstance(html_source, io.IOBase):
+        yield from iter(lambda: html_source.read(STREAM_CHUNK_SIZE), html_source.read(0))  # type: ignore
+    else:
+        yield from html_source  # type: ignore
+
+
+def _parse_income_payment_row(  # noqa: WPS212
+    row: etree._Element,  # noqa: WPS437
+    skipped: Counter[str],
+) -> AvangardPayment | None:
+    cell_elements = row_cells_xpath(row)
+    if len(cell_elements) != 9:
+        logging.debug('Invalid columns count')
+        skipped['invalid_columns'] += 1
         return None
 
-    cells = [stringify(cell) for cell in cells]
-    income_amount = _parse_payment_amount(cells[3])
+    income_amount = _parse_payment_amount(stringify(cell_elements[3]))
     if not income_amount:
         logging.debug('Skip not income payment')
+        skipped['non_income'] += 1
         return None
 
+    cells = [stringify(cell) for cell in cell_elements]
+
     description = _parse_payment_description(cells[7])
     invoice_number = _parse_invoice_number(description)
     if not invoice_number:
         logging.warning(f'Invoice number not parsed yet "{description}"')
+        skipped['no_invoice'] += 1
         return None
 
     agent_inn = _parse_agent_inn(cells[2])
     if not agent_inn:
         logging.warning(f'Agent INN not parsed yet "{cells[2]=}"')
+        skipped['no_inn'] += 1
         return None
 
     return AvangardPayment(
@@ -77,8 +160,8 @@ def _parse_income_payment_row(row: etree._Element) -> AvangardPayment | None:  #
 
 
 def _parse_agent_inn(source: str) -> int | None:
-    source = re.sub(r'\s+', '', source).strip()
-    if match := re.search(r'ИНН(\d+)', source):
+    source = spaces_re.sub('', source)
+    if match := agent_inn_re.search(source):
         return int(match.group(1))
     return None
 
@@ -88,14 +171,18 @@ def _parse_payment_description(source: str) -> str:
 
 
 def _parse_invoice_number(source: str) -> str | None:
-    source = re.sub(r'\s+', '', source).strip()
-    if match := re.search(r'[#№]{1}(\d+)', source):
+    source = spaces_re.sub('', source)
+    if match := invoice_number_re.search(source):
         return match.group(1)
     return None
 
 
 def _parse_payment_date(source: str) -> datetime.date:
     dt = source.strip().replace('"', '')
+    if match := payment_date_re.fullmatch(dt):
+        # fast path for dd.mm.yyyy without strptime
+        day, month, year = match.groups()
+        return datetime.date(int(year), int(month), int(day))
     return datetime.datetime.strptime(dt, '%d.%m.%Y').date()
 
 
@@ -0,0 +1,180 @@
+"""Long-lived avangard client session reused across sync iterations."""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+from datetime import date
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+from app.avangard_client import AvangardApi, UnauthorizedError
+from app.avangard_parser import AvangardPayment
+from app.browser_pool import BrowserPool
+from app.watchdog import process_tree, read_proc_stats
+
+PaymentsList = list[AvangardPayment]
+
+
+class AvangardSession:
+    """Keep one authorized client alive and recycle it from time to time."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        client_factory: Callable[[], AvangardApi],
+        login: str,
+        password: str,
+        max_iterations: int,
+        max_rss_mb: float,
+        browser_pool: BrowserPool | None = None,
+    ) -> None:
+        """Create new session manager, browser_pool slot is held while client browser runs."""
+        self._client_factory = client_factory
+        self._login = login
+        self._password = password
+        self._max_iterations = max_iterations
+        self._max_rss_mb = max_rss_mb
+        self._browser_pool = browser_pool
+        self._slot_held = False
+        self._client: AvangardApi | None = None
+        self._iterations = 0
+        self._trace_path: str | None = None
+
+    async def get_income_payments(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> list[AvangardPayment]:
+        """Return list of income payments using alive (or fresh) client."""
+        return await self._call(lambda client: client.get_income_payments(start_date, end_date))
+
+    async def backfill_income_payments(
+        self,
+        start_date: date,
+        end_date: date,
+        window_days: int,
+        concurrency: int,
+    ) -> list[AvangardPayment]:
+        """Return unique income payments of long date range fetched concurrently by windows."""
+        return await self._call(
+            lambda client: client.backfill_income_payments(start_date, end_date, window_days, concurrency),
+        )
+
+    def trace_next_call(self, path: str) -> None:
+        """Record playwright trace of next bank call to zip file."""
+        self._trace_path = path
+
+    async def __aenter__(self) -> AvangardSession:
+        """Enter session context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Terminate alive client on exit."""
+        await self.close()
+
+    async def reserve_browser(self) -> None:
+        """Wait for browser slot of pool, slot is kept until session is closed."""
+        if self._browser_pool and not self._slot_held:
+            await self._browser_pool.acquire()
+            self._slot_held = True
+
+    async def close(self) -> None:
+        """Terminate alive client and free its browser slot."""
+        if self._client:
+            logging.debug(f'close session after {self._iterations=}')
+            await self._client.terminate()
+            self._client = None
+        self._iterations = 0
+        self._release_browser()
+
+    async def abort(self) -> None:
+        """Kill browser of hung client without waiting it, next call starts fresh one."""
+        client = self._client
+        self._client = None
+        self._iterations = 0
+        if client:
+            logging.warning('abort avangard session')
+            await client.kill()
+        self._release_browser()
+
+    async def _call(
+        self,
+        method: Callable[[AvangardApi], Awaitable[PaymentsList]],
+    ) -> list[AvangardPayment]:
+        try:
+            payments = await self._call_client(method)
+        except Exception:
+            # page state is unknown after failure: browser is not left running half way
+            await self.close()
+            raise
+
+        if self._recycle_required():
+            await self.close()
+        return payments
+
+    async def _call_client(
+        self,
+        method: Callable[[AvangardApi], Awaitable[PaymentsList]],
+    ) -> list[AvangardPayment]:
+        client = await self._get_client()
+        self._iterations += 1
+        async with self._tracing(client):
+            try:
+                return await method(client)
+            except UnauthorizedError:
+                logging.info('avangard session expired, login again')
+                await self._authorize(client)
+                return await method(client)
+
+    @contextlib.asynccontextmanager
+    async def _tracing(self, client: AvangardApi) -> AsyncIterator[None]:
+        trace_path = self._trace_path
+        self._trace_path = None
+        if not trace_path:
+            yield
+            return
+
+        await client.start_tracing()
+        try:
+            yield
+        finally:
+            await client.stop_tracing(trace_path)
+
+    async def _get_client(self) -> AvangardApi:
+        if self._client:
+            return self._client
+
+        await self.reserve_browser()
+        # set before launch: close terminates half started browser too
+        self._client = self._client_factory()
+        await self._client.setup_browser()
+        await self._authorize(self._client)
+        return self._client
+
+    async def _authorize(self, client: AvangardApi) -> None:
+        if not await client.login(self._login, self._password):
+            raise UnauthorizedError('Login failed')
+
+    def _release_browser(self) -> None:
+        if self._browser_pool and self._slot_held:
+            self._browser_pool.release()
+            self._slot_held = False
+
+    def _recycle_required(self) -> bool:
+        if self._iterations >= self._max_iterations:
+            logging.info(f'recycle session by iterations limit {self._iterations=}')
+            return True
+
+        # own browser only: chromium of other accounts and the python process are not counted
+        rss_mb = process_tree_rss_mb(self._client.browser_pids()) if self._client else 0
+        if rss_mb > self._max_rss_mb:
+            logging.info(f'recycle session by memory limit {rss_mb=}')
+            return True
+        return False
+
+
+def process_tree_rss_mb(root_pids: Iterable[int] | None = None) -> float:
+    """Return resident memory of processes (current by default) and all their children, Mb."""
+    proc_stats = read_proc_stats()
+    tree = process_tree([os.getpid()] if root_pids is None else root_pids, proc_stats)
+    rss_pages = sum(proc_stats[tree_pid][1] for tree_pid in tree)
+    return rss_pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
@@ -0,0 +1,74 @@
+"""Shared playwright driver and bounded count of live Chromium processes for many accounts."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import AsyncIterator, Iterator
+
+from playwright.async_api import Playwright, async_playwright
+
+
+class BrowserPool:
+    """One playwright driver for all clients, at most size browsers run at once."""
+
+    def __init__(self, size: int) -> None:
+        """Create pool, driver starts on first use."""
+        self._slots = asyncio.Semaphore(max(size, 1))
+        self._waiting = 0
+        self._driver_lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+
+    async def __aenter__(self) -> BrowserPool:
+        """Enter pool context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop shared driver on exit."""
+        await self.close()
+
+    @property
+    def contended(self) -> bool:
+        """Check somebody waits for a free browser slot."""
+        return self._waiting > 0
+
+    async def playwright(self) -> Playwright:
+        """Return shared playwright driver, start it once."""
+        async with self._driver_lock:
+            if self._playwright is None:
+                logging.debug('start shared playwright driver')
+                self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def acquire(self) -> None:
+        """Wait for free browser slot, it is held while browser runs."""
+        with self._queued():
+            await self._slots.acquire()
+
+    def release(self) -> None:
+        """Free browser slot after browser is closed."""
+        self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one browser slot, browser must be closed before exit."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def close(self) -> None:
+        """Stop shared driver."""
+        if self._playwright:
+            logging.debug('stop shared playwright driver')
+            await self._playwright.stop()
+            self._playwright = None
+
+    @contextlib.contextmanager
+    def _queued(self) -> Iterator[None]:
+        self._waiting += 1
+        try:
+            yield
+        finally:
+            self._waiting -= 1
@@ -0,0 +1,159 @@
+"""Encrypted at rest browser storage state (cookies, localStorage) and size limit of persistent browser profile."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Any, Literal
+
+MAGIC = b'AVS1'
+NONCE_SIZE = 16
+TAG_SIZE = 32
+HEADER_SIZE = len(MAGIC) + NONCE_SIZE
+BYTE_ORDER: Literal['big'] = 'big'
+STATE_FILE_MODE = 0o600
+STATE_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+KDF_SALT = b'avangard-sync storage state'
+KDF_ITERATIONS = 200000
+# chromium profile dirs safe to drop: caches only, cookies and login data are kept
+PROFILE_CACHE_DIRS = frozenset((
+    'Cache',
+    'Code Cache',
+    'GPUCache',
+    'Service Worker',
+    'GrShaderCache',
+    'ShaderCache',
+    'blob_storage',
+    'optimization_guide_model_store',
+))
+
+StorageState = dict[str, Any]
+
+
+class StateVault:
+    """Keep authenticated storage state in file encrypted with key derived from secret."""
+
+    def __init__(self, path: str, secret: str, max_age_hours: float = 12) -> None:
+        """Create vault, state older than max_age_hours is not restored."""
+        self._path = path
+        self._max_age_seconds = max_age_hours * 60 * 60
+        encrypt_key, mac_key = _derive_keys(secret)
+        self._encrypt_key = encrypt_key
+        self._mac_key = mac_key
+
+    def save(self, state: StorageState) -> None:
+        """Encrypt and write state atomically, file is readable by owner only."""
+        payload = encrypt(json.dumps(state).encode(), self._encrypt_key, self._mac_key)
+        os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+        tmp_path = f'{self._path}.{os.getpid()}.tmp'
+        file_descriptor = os.open(tmp_path, STATE_FILE_FLAGS, STATE_FILE_MODE)
+        with os.fdopen(file_descriptor, 'wb') as state_file:
+            state_file.write(payload)
+        os.replace(tmp_path, self._path)
+        logging.debug(f'save storage state {self._path}')
+
+    def load(self) -> StorageState | None:
+        """Return saved state, None if it is missing, expired or can not be decrypted."""
+        try:
+            saved_at = os.path.getmtime(self._path)
+        except FileNotFoundError:
+            return None
+        if time.time() - saved_at > self._max_age_seconds:
+            logging.info(f'storage state expired {self._path}')
+            return None
+
+        with open(self._path, 'rb') as state_file:
+            payload = state_file.read()
+        try:
+            return json.loads(decrypt(payload, self._encrypt_key, self._mac_key))
+        except ValueError as exc:
+            logging.warning(f'storage state is not restored {exc=}')
+            return None
+
+    def clear(self) -> None:
+        """Remove saved state."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+def encrypt(plaintext: bytes, encrypt_key: bytes, mac_key: bytes) -> bytes:
+    """Encrypt with HMAC-SHA256 keystream and random nonce, then authenticate magic, nonce and ciphertext."""
+    nonce = os.urandom(NONCE_SIZE)
+    message = MAGIC + nonce + _xor_keystream(plaintext, encrypt_key, nonce)
+    return message + hmac.new(mac_key, message, hashlib.sha256).digest()
+
+
+def decrypt(payload: bytes, encrypt_key: bytes, mac_key: bytes) -> bytes:
+    """Check authentication tag and decrypt, ValueError for foreign, damaged or tampered payload."""
+    message = payload[:-TAG_SIZE]
+    tag = payload[-TAG_SIZE:]
+    if len(message) < HEADER_SIZE or not message.startswith(MAGIC):
+        raise ValueError('Unknown storage state format')
+    expected_tag = hmac.new(mac_key, message, hashlib.sha256).digest()
+    if not hmac.compare_digest(tag, expected_tag):
+        raise ValueError('Storage state authentication failed')
+
+    nonce = message[len(MAGIC):HEADER_SIZE]
+    return _xor_keystream(message[HEADER_SIZE:], encrypt_key, nonce)
+
+
+def trim_profile_dir(user_dir: str, max_mb: float) -> int:
+    """Drop caches of browser profile above max_mb and whole profile if it is still too big, return freed bytes."""
+    max_bytes = max_mb * 1024 * 1024
+    profile_bytes = _dir_size(user_dir)
+    if profile_bytes <= max_bytes:
+        return 0
+
+    for root, dirs, _ in os.walk(user_dir):
+        for cache_dir in PROFILE_CACHE_DIRS.intersection(dirs):
+            shutil.rmtree(os.path.join(root, cache_dir), ignore_errors=True)
+            dirs.remove(cache_dir)
+
+    trimmed_bytes = _dir_size(user_dir)
+    if trimmed_bytes > max_bytes:
+        # bank session is lost with profile: restored from storage state or by full login
+        logging.warning(f'remove browser profile {user_dir} {trimmed_bytes=}')
+        shutil.rmtree(user_dir, ignore_errors=True)
+        trimmed_bytes = 0
+
+    freed_bytes = profile_bytes - trimmed_bytes
+    logging.info(f'trim browser profile {user_dir} {freed_bytes=}')
+    return freed_bytes
+
+
+def _derive_keys(secret: str) -> tuple[bytes, bytes]:
+    master_key = hashlib.pbkdf2_hmac('sha256', secret.encode(), KDF_SALT, KDF_ITERATIONS)
+    return (
+        hmac.new(master_key, b'encrypt', hashlib.sha256).digest(),
+        hmac.new(master_key, b'authenticate', hashlib.sha256).digest(),
+    )
+
+
+def _xor_keystream(source: bytes, encrypt_key: bytes, nonce: bytes) -> bytes:
+    blocks_count = -(-len(source) // TAG_SIZE)
+    keystream = b''.join(
+        _keystream_block(encrypt_key, nonce, counter)
+        for counter in range(blocks_count)
+    )
+    keystream_number = int.from_bytes(keystream[:len(source)], BYTE_ORDER)
+    mixed = int.from_bytes(source, BYTE_ORDER) ^ keystream_number
+    return mixed.to_bytes(len(source), BYTE_ORDER)
+
+
+def _keystream_block(encrypt_key: bytes, nonce: bytes, counter: int) -> bytes:
+    counter_bytes = counter.to_bytes(8, BYTE_ORDER)
+    return hmac.new(encrypt_key, nonce + counter_bytes, hashlib.sha256).digest()
+
+
+def _dir_size(path: str) -> int:
+    total_bytes = 0
+    for root, _, files in os.walk(path):
+        for filename in files:
+            file_path = os.path.join(root, filename)
+            if not os.path.islink(file_path):
+                total_bytes += os.path.getsize(file_path)
+    return total_bytes
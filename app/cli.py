@@ -0,0 +1,131 @@
+"""Command line entry point: heavy modules and settings are loaded by subcommands only when they need them."""
+import argparse
+import contextlib
+import datetime
+import functools
+import logging
+import os
+import signal
+import sys
+from typing import IO, TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from app.settings import AppSettings  # noqa: F401
+    from app.statement_batch import FileResult  # noqa: F401
+
+LOG_FORMAT = '%(asctime)s %(levelname)-8s %(message)s'  # noqa: WPS323
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Parse arguments and run subcommand."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format=LOG_FORMAT)
+    sys.exit(args.handler(args))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return parser of all subcommands."""
+    parser = argparse.ArgumentParser(prog='avangard-sync', description='Sync avangard bank payments with moysklad orders.')
+    parser.add_argument('--debug', action='store_true', help='verbose logging')
+    subparsers = parser.add_subparsers(required=True, metavar='command')
+
+    run_parser = subparsers.add_parser('run', help='sync payments in a loop until SIGINT')
+    run_parser.add_argument('--max-iterations', type=int, help='stop after N iterations of every account')
+    run_parser.add_argument('--throttling', type=float, help='base seconds between syncs, settings value by default')
+    run_parser.set_defaults(handler=_run)
+
+    fetch_parser = subparsers.add_parser('fetch-once', help='run one sync iteration of every account and exit')
+    fetch_parser.set_defaults(handler=_fetch_once)
+
+    parse_parser = subparsers.add_parser('parse-file', help='print unique income payments of saved statement pages')
+    parse_parser.add_argument('paths', nargs='+', help='statement html files (plain or gzip) or directories of them')
+    parse_parser.add_argument('--format', choices=('jsonl', 'csv', 'columns'), default='jsonl', help='output format')
+    parse_parser.add_argument('--output', help='output file, stdout by default')
+    parse_parser.add_argument('--workers', type=int, default=os.cpu_count(), help='parser processes')
+    parse_parser.set_defaults(handler=_parse_file)
+
+    backfill_parser = subparsers.add_parser('backfill', help='print income payments of date range, sync state untouched')
+    backfill_parser.add_argument('start_date', type=datetime.date.fromisoformat, help='YYYY-MM-DD')
+    backfill_parser.add_argument('end_date', type=datetime.date.fromisoformat, help='YYYY-MM-DD')
+    backfill_parser.add_argument('--account', help='account name, first one by default')
+    backfill_parser.set_defaults(handler=_backfill)
+    return parser
+
+
+def _run(args: argparse.Namespace) -> int:
+    settings = _load_settings()
+    import asyncio
+
+    from app import sync_tool
+
+    signal.signal(signal.SIGINT, sync_tool.sigint_handler)
+    throttling = settings.throttling_time if args.throttling is None else args.throttling
+    asyncio.run(sync_tool.main(throttling, args.max_iterations))
+    return 0
+
+
+def _fetch_once(args: argparse.Namespace) -> int:
+    settings = _load_settings()
+    import asyncio
+
+    from app import sync_tool
+
+    cnt = asyncio.run(sync_tool.main(settings.throttling_time, max_iterations=1))
+    return 1 if cnt['fails'] else 0
+
+
+def _parse_file(args: argparse.Namespace) -> int:
+    from app.statement_batch import iter_statement_files, parse_statement_files, unique_payments, write_payments
+
+    paths = list(iter_statement_files(args.paths))
+    failed: list[str] = []
+    file_results = parse_statement_files(paths, args.workers)
+    payments = unique_payments(map(functools.partial(_report_file, failed), file_results))
+    with _open_output(args.output) as stream:
+        count = write_payments(payments, stream, args.format)
+    files_count = len(paths)
+    logging.info(f'parsed {files_count=} {failed=} unique payments {count=}')
+    return 1 if failed else 0
+
+
+def _backfill(args: argparse.Namespace) -> int:
+    _load_settings()
+    import asyncio
+
+    from app import sync_tool
+    from app.statement_batch import write_payments
+
+    payments = asyncio.run(sync_tool.fetch_payments(args.start_date, args.end_date, args.account))
+    write_payments(payments, sys.stdout)
+    return 0
+
+
+def _load_settings() -> 'AppSettings':
+    from app.settings import get_settings
+
+    try:
+        return get_settings()
+    except ValueError as exc:
+        # pydantic validation error: missing credentials or invalid value
+        sys.exit(f'invalid settings: {exc}')
+
+
+def _report_file(failed: list[str], file_result: 'FileResult') -> 'FileResult':
+    if file_result.error:
+        logging.error(f'{file_result.path} failed {file_result.error}')
+        failed.append(file_result.path)
+    else:
+        payments_count = len(file_result.payments)
+        skipped = dict(file_result.skipped)
+        logging.info(f'{file_result.path} payments={payments_count} {skipped=}')
+    return file_result
+
+
+def _open_output(path: Optional[str]) -> contextlib.AbstractContextManager[IO[str]]:
+    if path is None:
+        return contextlib.nullcontext(sys.stdout)
+    return open(path, 'w', encoding='utf-8', newline='')  # noqa: WPS515
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""Prometheus-style counters and histograms with text exposition over http or textfile."""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import itertools
+import logging
+import os
+import time
+from typing import Iterator, Sequence
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 60, 120)
+BYTES_BUCKETS = (1e4, 1e5, 1e6, 1e7, 1e8)
+LAG_BUCKETS = (1, 5, 15, 30, 60, 300, 900, 3600)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+ACCOUNT_LABELS = ('account',)
+SINK_LABELS = (*ACCOUNT_LABELS, 'sink')
+
+LabelValues = tuple[str, ...]
+
+
+class Metric:
+    """Base metric: name, help and label names."""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()) -> None:
+        """Create metric."""
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> list[str]:
+        """Return exposition lines."""
+        return [
+            f'# HELP {self.name} {self.description}',
+            f'# TYPE {self.name} {self.kind}',
+            *self._render_samples(),
+        ]
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _render_labels(self, label_values: LabelValues, extra: str = '') -> str:
+        pairs = list(map(_render_label, self.labelnames, label_values))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        return '{{{0}}}'.format(','.join(pairs))
+
+    def _render_samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonic counter."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()) -> None:
+        """Create counter."""
+        super().__init__(name, description, labelnames)
+        self._totals: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase counter."""
+        key = self._label_values(labels)
+        self._totals[key] = self._totals.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Return current total."""
+        return self._totals.get(self._label_values(labels), 0)
+
+    def _render_samples(self) -> Iterator[str]:
+        for label_values, total in self._totals.items():
+            labels = self._render_labels(label_values)
+            yield f'{self.name}_total{labels} {total}'
+
+
+class Histogram(Metric):
+    """Cumulative buckets histogram with sum and count."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Create histogram."""
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, amount: float, **labels: str) -> None:
+        """Add observation."""
+        key = self._label_values(labels)
+        if key not in self._counts:
+            buckets_count = len(self.buckets) + 1
+            self._counts[key] = list(itertools.repeat(0, buckets_count))
+        bucket_idx = bisect.bisect_left(self.buckets, amount)
+        self._counts[key][bucket_idx] += 1
+        self._sums[key] = self._sums.get(key, 0) + amount
+
+    @contextlib.contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe duration of block in seconds, failed blocks too."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return count of observations."""
+        counts = self._counts.get(self._label_values(labels), [])
+        return sum(counts)
+
+    def _render_samples(self) -> Iterator[str]:
+        for label_values, counts in self._counts.items():
+            cumulative = 0
+            for bucket, bucket_count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += bucket_count
+                bucket_labels = self._render_labels(label_values, f'le="{bucket}"')
+                yield f'{self.name}_bucket{bucket_labels} {cumulative}'
+            labels = self._render_labels(label_values)
+            yield from (
+                f'{self.name}_sum{labels} {self._sums[label_values]}',
+                f'{self.name}_count{labels} {cumulative}',
+            )
+
+
+class Registry:
+    """Set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Create empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add metric, names are unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f'Metric {metric.name} already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register counter."""
+        counter = Counter(name, description, labelnames)
+        self.register(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register histogram."""
+        histogram = Histogram(name, description, labelnames, buckets)
+        self.register(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Return metrics in prometheus text exposition format."""
+        metrics = self._metrics.values()
+        lines = itertools.chain.from_iterable(metric.render() for metric in metrics)
+        return '{0}\n'.format('\n'.join(lines))
+
+    def write_textfile(self, path: str) -> None:
+        """Write metrics for node_exporter textfile collector atomically."""
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(tmp_path, path)
+
+    async def serve(self, host: str, port: int) -> asyncio.AbstractServer:
+        """Serve metrics over http on any path."""
+        return await asyncio.start_server(self._on_http_connection, host=host, port=port)
+
+    async def _on_http_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        with contextlib.suppress(ConnectionError):
+            # skip request line and headers, any path returns metrics
+            line = await reader.readline()
+            while line.strip():
+                line = await reader.readline()
+
+            body = self.render().encode()
+            headers = [
+                'HTTP/1.1 200 OK',
+                f'Content-Type: {CONTENT_TYPE}',
+                f'Content-Length: {len(body)}',
+                'Connection: close',
+            ]
+            writer.write('{0}\r\n\r\n'.format('\r\n'.join(headers)).encode())
+            writer.write(body)
+            await writer.drain()
+        writer.close()
+        logging.debug('metrics scraped')
+
+
+def _render_label(name: str, label_value: str) -> str:
+    escaped = label_value.replace('\\', r'\\').replace('"', r'\"')
+    escaped = escaped.replace('\n', r'\n')
+    return f'{name}="{escaped}"'
+
+
+registry = Registry()
+
+browser_launch_seconds = registry.histogram('avangard_browser_launch_seconds', 'Chromium launch duration', ACCOUNT_LABELS)
+browser_killed = registry.counter('avangard_browser_killed', 'Chromium processes killed after close', ACCOUNT_LABELS)
+step_seconds = registry.histogram('avangard_step_seconds', 'Bank navigation step duration', (*ACCOUNT_LABELS, 'step'))
+page_bytes = registry.histogram('avangard_statement_bytes', 'Statement page size', ACCOUNT_LABELS, BYTES_BUCKETS)
+parse_seconds = registry.histogram('avangard_parse_seconds', 'Statement parse duration', ACCOUNT_LABELS)
+parse_skipped = registry.counter('avangard_parse_skipped', 'Statements not parsed as unchanged', ACCOUNT_LABELS)
+parsed_rows = registry.counter('avangard_parsed_rows', 'Statement rows by parse result', (*ACCOUNT_LABELS, 'result'))
+sync_seconds = registry.histogram('sync_cycle_seconds', 'Sync cycle duration', ACCOUNT_LABELS)
+sync_cycles = registry.counter('sync_cycles', 'Sync cycles by result', (*ACCOUNT_LABELS, 'result'))
+new_payments = registry.counter('sync_new_payments', 'New income payments found', ACCOUNT_LABELS)
+stage_seconds = registry.histogram('sync_stage_seconds', 'Sync pipeline stage duration', (*ACCOUNT_LABELS, 'stage'))
+stage_items = registry.counter('sync_stage_items', 'Sync pipeline items by result', (*ACCOUNT_LABELS, 'stage', 'result'))
+order_matches = registry.counter('sync_order_matches', 'Payments by order match status', (*ACCOUNT_LABELS, 'status'))
+sink_payments = registry.counter('sink_payments', 'Payments written to sink', SINK_LABELS)
+sink_errors = registry.counter('sink_errors', 'Failed sink write attempts', SINK_LABELS)
+sink_dropped = registry.counter('sink_dropped', 'Payments dropped from full sink buffer', SINK_LABELS)
+sink_seconds = registry.histogram('sink_write_seconds', 'Sink batch write duration', SINK_LABELS)
+sink_lag_seconds = registry.histogram('sink_lag_seconds', 'Payment wait in sink buffer', SINK_LABELS, LAG_BUCKETS)
@@ -0,0 +1,142 @@
+"""Minimal moysklad JSON api client: customer orders and their states."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import gzip
+import json
+import logging
+import re
+from typing import Any
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from app.avangard_parser import spaces_re
+
+MOYSKLAD_API_URL = 'https://api.moysklad.ru/api/remap/1.2'
+ORDERS_PATH = '/entity/customerorder'
+ORDERS_METADATA_PATH = '/entity/customerorder/metadata'
+META = 'meta'
+EXPAND_PAGE_LIMIT = 100  # moysklad limit of page size with expand
+invoice_digits_re = re.compile(r'\d+')
+
+
+class MoyskladError(RuntimeError):
+    """Moysklad api request failed."""
+
+
+@dataclasses.dataclass
+class MoyskladOrder:
+    """Customer order waiting for payment."""
+
+    href: str
+    name: str
+    invoice_number: str
+    agent_inn: int | None
+    sum_kopecks: int
+    payed_kopecks: int
+
+    @property
+    def unpaid_kopecks(self) -> int:
+        """Return amount left to pay."""
+        return self.sum_kopecks - self.payed_kopecks
+
+    def update_ref(self, **fields: Any) -> dict[str, Any]:
+        """Return entity with changed fields for bulk update request."""
+        return {META: {'href': self.href, 'type': 'customerorder'}, **fields}
+
+    @classmethod
+    def from_api(cls, order: dict[str, Any]) -> MoyskladOrder:
+        """Build order from api entity with expanded agent."""
+        inn = order.get('agent', {}).get('inn', '')
+        return cls(
+            href=order[META]['href'],
+            name=order['name'],
+            invoice_number=normalize_invoice_number(order['name']),
+            agent_inn=int(inn) if inn.isdigit() else None,
+            sum_kopecks=int(order.get('sum', 0)),
+            payed_kopecks=int(order.get('payedSum', 0)),
+        )
+
+
+def normalize_invoice_number(source: str) -> str:
+    """Return invoice number digits as payment parser does, leading zeros are kept."""
+    match = invoice_digits_re.search(spaces_re.sub('', source))
+    return match.group(0) if match else ''
+
+
+class MoyskladClient:
+    """Minimal moysklad JSON api client."""
+
+    def __init__(self, token: str, base_url: str = MOYSKLAD_API_URL, timeout_seconds: float = 25) -> None:
+        """Create client."""
+        self._token = token
+        self._base_url = base_url.rstrip('/')
+        self._timeout = timeout_seconds
+
+    async def load_orders(self, state_name: str) -> list[MoyskladOrder]:
+        """Return all orders in state, loaded by pages."""
+        orders: list[MoyskladOrder] = []
+        offset = 0
+        while True:
+            page = await self._request('GET', ORDERS_PATH, query={
+                'filter': f'state.name={state_name}',
+                'expand': 'agent',
+                'limit': EXPAND_PAGE_LIMIT,
+                'offset': offset,
+            })
+            orders.extend(MoyskladOrder.from_api(order) for order in page['rows'])
+            offset += len(page['rows'])
+            if not page['rows'] or offset >= page[META]['size']:
+                break
+        logging.debug(f'load moysklad orders {state_name=} {len(orders)=}')
+        return orders
+
+    async def find_state_meta(self, state_name: str) -> dict[str, Any]:
+        """Return meta of order state by name."""
+        metadata = await self._request('GET', ORDERS_METADATA_PATH)
+        states = {state['name']: state for state in metadata.get('states', [])}
+        state = states.get(state_name)
+        if state:
+            return state[META]
+        raise MoyskladError(f'Order state not found {state_name=}')
+
+    async def set_orders_state(self, orders: list[MoyskladOrder], state_meta: dict[str, Any], batch_size: int) -> None:
+        """Update state of orders with bulk requests."""
+        for offset in range(0, len(orders), batch_size):
+            batch = orders[offset:offset + batch_size]
+            updates = [order.update_ref(state={META: state_meta}) for order in batch]
+            await self._request('POST', ORDERS_PATH, body=updates)
+            logging.info(f'update moysklad orders state {len(batch)=}')
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, Any] | None = None,
+        body: Any = None,
+    ) -> Any:
+        url = f'{self._base_url}{path}'
+        if query:
+            url = f'{url}?{urlencode(query)}'
+        request = Request(  # noqa: S310 base url comes from settings
+            url,
+            method=method,
+            data=None if body is None else json.dumps(body).encode(),
+            headers={
+                'Authorization': f'Bearer {self._token}',
+                'Accept-Encoding': 'gzip',
+                'Content-Type': 'application/json',
+            },
+        )
+        return await asyncio.to_thread(self._send, request)
+
+    def _send(self, request: Request) -> Any:
+        try:
+            with urlopen(request, timeout=self._timeout) as response:  # noqa: S310
+                payload = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    payload = gzip.decompress(payload)
+        except OSError as exc:
+            raise MoyskladError(f'Moysklad request failed {request.full_url} {exc}') from exc
+        return json.loads(payload) if payload else None
@@ -0,0 +1,95 @@
+"""Playwright requests interception: block heavy resources and count traffic."""
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+import re
+import time
+from typing import Iterable, Iterator
+
+from playwright.async_api import BrowserContext
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Request, Route
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+# JSF form buttons are images ("Показать"), keep them loaded so they are visible and clickable
+DEFAULT_ALLOWED_URL_PATTERNS = (r'corp\.avangard\.ru/clbAvn/.*images/',)
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    r'google-analytics\.com',
+    r'googletagmanager\.com',
+    r'doubleclick\.net',
+    r'mc\.yandex\.ru',
+    r'top-fwz1\.mail\.ru',
+    r'connect\.facebook\.net',
+)
+
+
+@dataclasses.dataclass
+class NetworkStats:
+    """Traffic counters."""
+
+    requests: int = 0
+    blocked: int = 0
+    bytes: int = 0
+
+
+class ResourceFilter:
+    """Abort requests by resource type or url pattern and measure traffic of every navigation step."""
+
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        blocked_url_patterns: Iterable[str] = DEFAULT_BLOCKED_URL_PATTERNS,
+        allowed_url_patterns: Iterable[str] = DEFAULT_ALLOWED_URL_PATTERNS,
+    ) -> None:
+        """Create filter, allowed patterns win over any block rule."""
+        self.stats = NetworkStats()
+        self._blocked_types = frozenset(blocked_resource_types)
+        self._blocked_urls = [re.compile(pattern) for pattern in blocked_url_patterns]
+        self._allowed_urls = [re.compile(pattern) for pattern in allowed_url_patterns]
+
+    def is_blocked(self, resource_type: str, url: str) -> bool:
+        """Check request should be aborted."""
+        if any(pattern.search(url) for pattern in self._allowed_urls):
+            return False
+        if resource_type in self._blocked_types:
+            return True
+        return any(pattern.search(url) for pattern in self._blocked_urls)
+
+    async def install(self, context: BrowserContext) -> None:
+        """Intercept all requests of browser context."""
+        await context.route('**/*', self._route)
+        context.on('requestfinished', self._on_request_finished)
+
+    @contextlib.contextmanager
+    def track(self, step: str) -> Iterator[NetworkStats]:
+        """Log duration and traffic of navigation step, yield traffic of the step after exit."""
+        started_at = time.perf_counter()
+        before = dataclasses.replace(self.stats)
+        step_stats = NetworkStats()
+        try:
+            yield step_stats
+        finally:
+            step_stats.requests = self.stats.requests - before.requests
+            step_stats.blocked = self.stats.blocked - before.blocked
+            step_stats.bytes = self.stats.bytes - before.bytes
+            elapsed = round(time.perf_counter() - started_at, 3)
+            logging.info(f'navigation {step=} {elapsed=} {step_stats}')
+
+    async def _route(self, route: Route) -> None:
+        request = route.request
+        if self.is_blocked(request.resource_type, request.url):
+            self.stats.blocked += 1
+            await route.abort()
+            return
+        await route.continue_()
+
+    async def _on_request_finished(self, request: Request) -> None:
+        self.stats.requests += 1
+        try:
+            sizes = await request.sizes()
+        except PlaywrightError:
+            # request may be gone already with its page, counters stay approximate
+            return
+        self.stats.bytes += sizes['responseHeadersSize'] + max(sizes['responseBodySize'], 0)
@@ -0,0 +1,100 @@
+"""Match bank payments with moysklad orders waiting for payment and mark them paid in bulk."""
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections import defaultdict
+from typing import Any, Iterable, Literal
+
+from app import payment_batch
+from app.avangard_parser import AvangardPayment
+from app.moysklad_client import MoyskladClient, MoyskladOrder
+
+MatchStatus = Literal['matched', 'amount_mismatch', 'inn_mismatch', 'ambiguous', 'not_found']
+MATCHED: MatchStatus = 'matched'
+
+
+@dataclasses.dataclass
+class OrderMatch:
+    """Result of payment matching."""
+
+    payment: AvangardPayment
+    status: MatchStatus
+    order: MoyskladOrder | None = None
+
+
+class OrdersIndex:
+    """In-memory index of open orders by invoice number and agent INN."""
+
+    def __init__(self, orders: Iterable[MoyskladOrder]) -> None:
+        """Build index."""
+        self._by_invoice: dict[str, list[MoyskladOrder]] = defaultdict(list)
+        self._by_inn: dict[int, list[MoyskladOrder]] = defaultdict(list)
+        for order in orders:
+            self._by_invoice[order.invoice_number].append(order)
+            if order.agent_inn:
+                self._by_inn[order.agent_inn].append(order)
+
+    def __len__(self) -> int:
+        """Return count of open orders."""
+        return sum(len(orders) for orders in self._by_invoice.values())
+
+    def match(self, payment: AvangardPayment) -> OrderMatch:
+        """Match payment by invoice number (agent INN must be the same) or by agent INN with exact unpaid amount."""
+        amount = payment_batch.to_kopecks(payment.income_amount)
+        by_invoice = self._by_invoice.get(payment.invoice_number, [])
+        candidates = [order for order in by_invoice if order.agent_inn in {payment.agent_inn, None}]
+        if by_invoice and not candidates:
+            return OrderMatch(payment, 'inn_mismatch', by_invoice[0])
+
+        if not candidates:
+            by_inn = self._by_inn.get(payment.agent_inn, [])
+            candidates = [order for order in by_inn if order.unpaid_kopecks == amount]
+            if not candidates:
+                return OrderMatch(payment, 'not_found')
+
+        if len(candidates) > 1:
+            return OrderMatch(payment, 'ambiguous', candidates[0])
+
+        order = candidates[0]
+        if order.unpaid_kopecks != amount:
+            return OrderMatch(payment, 'amount_mismatch', order)
+
+        self._remove(order)
+        return OrderMatch(payment, MATCHED, order)
+
+    def _remove(self, order: MoyskladOrder) -> None:
+        # order can be closed by one payment only
+        self._by_invoice[order.invoice_number].remove(order)
+        if order.agent_inn:
+            self._by_inn[order.agent_inn].remove(order)
+
+
+class OrderMatcher:
+    """Close moysklad orders waiting for payment by new bank payments."""
+
+    def __init__(self, client: MoyskladClient, wait_state: str, paid_state: str, batch_size: int = 100) -> None:
+        """Create matcher."""
+        self._client = client
+        self._wait_state = wait_state
+        self._paid_state = paid_state
+        self._batch_size = batch_size
+        self._paid_state_meta: dict[str, Any] | None = None
+
+    async def process(self, payments: list[AvangardPayment]) -> list[OrderMatch]:
+        """Match payments with open orders and mark matched orders paid."""
+        if not payments:
+            return []
+
+        index = OrdersIndex(await self._client.load_orders(self._wait_state))
+        matches = [index.match(payment) for payment in payments]
+        paid_orders = [match.order for match in matches if match.status == MATCHED and match.order]
+        if paid_orders:
+            if self._paid_state_meta is None:
+                self._paid_state_meta = await self._client.find_state_meta(self._paid_state)
+            await self._client.set_orders_state(paid_orders, self._paid_state_meta, self._batch_size)
+
+        for match in matches:
+            if match.status != MATCHED:
+                logging.warning(f'payment not matched {match}')
+        return matches
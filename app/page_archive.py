@@ -0,0 +1,134 @@
+"""Compressed content-addressed archive of fetched statement pages with parse results cache by date window."""
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Iterator
+
+from app.avangard_parser import AvangardPayment
+
+DateWindow = tuple[datetime.date, datetime.date]
+CachedPayments = tuple[str, list[AvangardPayment]]
+
+STATEMENT_TABLE_START = 'class="x2f"'
+STATEMENT_TABLE_END = '</table>'
+PRUNE_INTERVAL_SECONDS = 60 * 60
+CACHED_WINDOWS = 64
+
+
+class PageArchive:
+    """Store every fetched page once by content hash, remember payments of last page per date window."""
+
+    def __init__(self, root_dir: str, max_age_days: float = 30, max_mb: float = 500) -> None:
+        """Create archive in root_dir, pages older than max_age_days or above max_mb total are pruned."""
+        self._root_dir = root_dir
+        self._max_age_seconds = max_age_days * 24 * 60 * 60
+        self._max_bytes = max_mb * 1024 * 1024
+        self._pruned_at: float = 0
+        self._last_payments: OrderedDict[DateWindow, CachedPayments] = OrderedDict()
+
+    def store(self, window: DateWindow, html_source: str) -> str:
+        """Save page if it is new, log fetch to daily index and return statement digest."""
+        html_bytes = html_source.encode()
+        content_digest = hashlib.sha256(html_bytes).hexdigest()
+        page_path = self.page_path(content_digest)
+        if os.path.exists(page_path):
+            # keep page alive for pruning while bank returns it
+            os.utime(page_path)
+        else:
+            os.makedirs(os.path.dirname(page_path), exist_ok=True)
+            tmp_path = f'{page_path}.{os.getpid()}.tmp'
+            with gzip.open(tmp_path, 'wb') as page_file:
+                page_file.write(html_bytes)
+            os.replace(tmp_path, page_path)
+
+        statement = statement_digest(html_source)
+        self._write_index(window, content_digest, statement)
+        if time.time() - self._pruned_at > PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        return statement
+
+    def page_path(self, content_digest: str) -> str:
+        """Return path of archived page."""
+        filename = f'{content_digest}.html.gz'
+        return os.path.join(self._root_dir, 'pages', content_digest[:2], filename)
+
+    def load(self, content_digest: str) -> str:
+        """Return archived page."""
+        with gzip.open(self.page_path(content_digest), 'rt', encoding='utf-8') as page_file:
+            return page_file.read()
+
+    def cached_payments(self, window: DateWindow, statement: str) -> list[AvangardPayment] | None:
+        """Return payments of previous page of the same window if statement digest is not changed."""
+        cached = self._last_payments.get(window)
+        if cached is None or cached[0] != statement:
+            return None
+        self._last_payments.move_to_end(window)
+        return list(cached[1])
+
+    def remember(self, window: DateWindow, statement: str, payments: list[AvangardPayment]) -> None:
+        """Remember parse result of window page, only recent windows are kept."""
+        self._last_payments[window] = (statement, list(payments))
+        self._last_payments.move_to_end(window)
+        while len(self._last_payments) > CACHED_WINDOWS:
+            self._last_payments.popitem(last=False)
+
+    def prune(self) -> list[str]:
+        """Remove pages and index files older than max age or above total size limit, return removed paths."""
+        self._pruned_at = time.time()
+        expired_at = self._pruned_at - self._max_age_seconds
+        archived = sorted(
+            _iter_files(self._root_dir),
+            key=lambda archived_file: archived_file.stat().st_mtime,
+            reverse=True,
+        )
+        removed = []
+        total_bytes = 0
+        for entry in archived:
+            total_bytes += entry.stat().st_size
+            if entry.stat().st_mtime < expired_at or total_bytes > self._max_bytes:
+                os.remove(entry.path)
+                removed.append(entry.path)
+        if removed:
+            logging.info(f'prune page archive {len(removed)=}')
+        return removed
+
+    def _write_index(self, window: DateWindow, content_digest: str, statement: str) -> None:
+        now = datetime.datetime.utcnow()
+        index_name = f'index-{now.date()}.jsonl'
+        index_path = os.path.join(self._root_dir, index_name)
+        record = {
+            'fetched_at': now.isoformat(),
+            'start_date': window[0].isoformat(),
+            'end_date': window[1].isoformat(),
+            'page': content_digest,
+            'statement': statement,
+        }
+        with open(index_path, 'a', encoding='utf-8') as index_file:
+            index_file.write(f'{json.dumps(record)}\n')
+
+
+def statement_digest(html_source: str) -> str:
+    """Return hash of payments table, page markup around it (state tokens, clock) does not change it."""
+    table_start = html_source.find(STATEMENT_TABLE_START)
+    # last closing tag: nested tables of rows are hashed too
+    table_end = html_source.rfind(STATEMENT_TABLE_END)
+    if table_start < 0 or table_end < table_start:
+        return hashlib.sha256(html_source.encode()).hexdigest()
+    return hashlib.sha256(html_source[table_start:table_end].encode()).hexdigest()
+
+
+def _iter_files(root_dir: str) -> Iterator[os.DirEntry[str]]:
+    if not os.path.isdir(root_dir):
+        return
+    for entry in os.scandir(root_dir):
+        if entry.is_dir():
+            yield from _iter_files(entry.path)
+        elif entry.is_file():
+            yield entry
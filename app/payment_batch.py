@@ -0,0 +1,134 @@
+"""Compact representations of parsed payments for big backfills."""
+from __future__ import annotations
+
+import datetime
+import sys
+from array import array
+from decimal import Decimal
+from typing import Iterable, Iterator, NamedTuple
+
+from app.avangard_parser import AvangardPayment, PaymentKey
+
+KOPECKS_EXP = 2
+
+
+class CompactPayment(NamedTuple):
+    """Tuple-backed immutable and hashable payment."""
+
+    payment_number: int
+    payment_date_ordinal: int
+    agent_inn: int
+    invoice_number: str
+    amount_kopecks: int
+    description: str
+
+    @classmethod
+    def from_payment(cls, payment: AvangardPayment) -> CompactPayment:
+        """Convert from payment dataclass."""
+        return cls(
+            payment_number=payment.payment_number,
+            payment_date_ordinal=payment.payment_date.toordinal(),
+            agent_inn=payment.agent_inn,
+            invoice_number=sys.intern(payment.invoice_number),
+            amount_kopecks=to_kopecks(payment.income_amount),
+            description=sys.intern(payment.description),
+        )
+
+    def to_payment(self) -> AvangardPayment:
+        """Convert back to payment dataclass."""
+        return AvangardPayment(
+            payment_number=self.payment_number,
+            payment_date=datetime.date.fromordinal(self.payment_date_ordinal),
+            agent_inn=self.agent_inn,
+            invoice_number=self.invoice_number,
+            income_amount=from_kopecks(self.amount_kopecks),
+            description=self.description,
+        )
+
+
+class PaymentBatch:
+    """Columnar payments storage: parallel integer arrays and interned strings."""
+
+    __slots__ = ('_numbers', '_date_ordinals', '_agent_inns', '_amounts', '_invoice_numbers', '_descriptions')
+
+    def __init__(self) -> None:
+        """Create empty batch."""
+        self._numbers = array('q')
+        self._date_ordinals = array('l')
+        # INN column stays a list: unparsed tails of requisites may not fit into int64
+        self._agent_inns: list[int] = []
+        self._amounts = array('q')
+        self._invoice_numbers: list[str] = []
+        self._descriptions: list[str] = []
+
+    def __len__(self) -> int:
+        """Return count of payments."""
+        return len(self._numbers)
+
+    def __getitem__(self, idx: int) -> AvangardPayment:
+        """Return payment dataclass by index."""
+        return AvangardPayment(
+            payment_number=self._numbers[idx],
+            payment_date=datetime.date.fromordinal(self._date_ordinals[idx]),
+            agent_inn=self._agent_inns[idx],
+            invoice_number=self._invoice_numbers[idx],
+            income_amount=from_kopecks(self._amounts[idx]),
+            description=self._descriptions[idx],
+        )
+
+    def __iter__(self) -> Iterator[AvangardPayment]:
+        """Iterate over payment dataclasses."""
+        return (self[idx] for idx in range(len(self)))
+
+    @classmethod
+    def from_payments(cls, payments: Iterable[AvangardPayment]) -> PaymentBatch:
+        """Build batch from payment dataclasses."""
+        batch = cls()
+        batch.extend(payments)
+        return batch
+
+    def extend(self, payments: Iterable[AvangardPayment]) -> None:
+        """Append payment dataclasses."""
+        for payment in payments:
+            self._numbers.append(payment.payment_number)
+            self._date_ordinals.append(payment.payment_date.toordinal())
+            self._agent_inns.append(payment.agent_inn)
+            self._amounts.append(to_kopecks(payment.income_amount))
+            self._invoice_numbers.append(sys.intern(payment.invoice_number))
+            self._descriptions.append(sys.intern(payment.description))
+
+    def to_payments(self) -> list[AvangardPayment]:
+        """Return list of payment dataclasses."""
+        return list(self)
+
+    def keys(self) -> Iterator[PaymentKey]:
+        """Iterate over unique payment keys without building dataclasses."""
+        columns = zip(self._numbers, self._date_ordinals, self._agent_inns)
+        return (
+            (payment_number, datetime.date.fromordinal(date_ordinal), agent_inn)
+            for payment_number, date_ordinal, agent_inn in columns
+        )
+
+    def columns(self) -> dict[str, list]:
+        """Return columns as plain lists (amounts in kopecks, dates as ordinals)."""
+        return {
+            'payment_number': self._numbers.tolist(),
+            'payment_date_ordinal': self._date_ordinals.tolist(),
+            'agent_inn': list(self._agent_inns),
+            'amount_kopecks': self._amounts.tolist(),
+            'invoice_number': list(self._invoice_numbers),
+            'description': list(self._descriptions),
+        }
+
+
+def to_kopecks(amount: Decimal) -> int:
+    """Return amount in integer kopecks, fail on fractions of kopeck."""
+    kopecks = amount.scaleb(KOPECKS_EXP)
+    if kopecks != kopecks.to_integral_value():
+        raise ValueError(f'Amount with fraction of kopeck {amount}')
+    return int(kopecks)
+
+
+def from_kopecks(kopecks: int) -> Decimal:
+    """Return decimal amount from integer kopecks."""
+    return Decimal(kopecks).scaleb(-KOPECKS_EXP)
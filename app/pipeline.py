@@ -0,0 +1,108 @@
+"""Asyncio pipeline: stages connected by bounded queues, every stage with its own concurrency."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Sequence
+
+from app import metrics
+from app.watchdog import DeadlineError, run_with_deadline
+
+StageProcess = Callable[[Any], Awaitable[Any]]
+
+
+@dataclasses.dataclass
+class Stage:
+    """Pipeline step: process result (if not None) goes to next stage, queue_size bounds entries waiting for it."""
+
+    name: str
+    process: StageProcess
+    concurrency: int = 1
+    queue_size: int = 1
+    deadline: float | None = None
+
+
+class Pipeline:
+    """Pass items through stages, full queue of slow stage blocks producer of previous one."""
+
+    def __init__(self, name: str, stages: Sequence[Stage]) -> None:
+        """Create pipeline, workers start on enter."""
+        self.failures: Counter[str] = Counter()
+        self.stuck: Counter[str] = Counter()
+        self._name = name
+        self._stages = list(stages)
+        self._queues: list[asyncio.Queue[Any]] = [asyncio.Queue(maxsize=stage.queue_size) for stage in stages]
+        self._workers: list[asyncio.Task[None]] = []
+        self._running = False
+
+    async def __aenter__(self) -> Pipeline:
+        """Start stage workers."""
+        self._running = True
+        for idx, stage in enumerate(self._stages):
+            for _ in range(max(stage.concurrency, 1)):
+                worker = asyncio.create_task(self._work(idx))
+                self._workers.append(worker)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop workers without draining."""
+        await self.close(drain_timeout=0)
+
+    async def put(self, entry: Any) -> None:
+        """Add entry to first stage, wait while its queue is full."""
+        await self._queues[0].put(entry)
+
+    async def close(self, drain_timeout: float | None = None) -> bool:
+        """Wait queued and in-flight entries up to drain_timeout seconds, stop workers and return True if drained."""
+        drained = True
+        try:
+            if self._workers and drain_timeout != 0:
+                await asyncio.wait_for(self._drain(), drain_timeout)
+        except asyncio.TimeoutError:
+            drained = False
+            queued = [queue.qsize() for queue in self._queues]
+            logging.warning(f'pipeline not drained {self._name} {queued=}')
+
+        self._running = False
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return drained
+
+    async def _drain(self) -> None:
+        # entries are passed to next queue before task_done: joined queue has no producers left
+        for queue in self._queues:
+            await queue.join()
+
+    async def _work(self, idx: int) -> None:
+        queue = self._queues[idx]
+        while self._running:
+            entry = await queue.get()
+            # stage errors are caught: task_done is skipped only for entry cancelled on close
+            await self._run_stage(idx, entry)
+            queue.task_done()
+
+    async def _run_stage(self, idx: int, entry: Any) -> None:
+        stage = self._stages[idx]
+        try:
+            with metrics.stage_seconds.time(account=self._name, stage=stage.name):
+                stage_result = await run_with_deadline(stage.process(entry), stage.deadline, stage.name)
+        except DeadlineError:
+            # entry is dropped, worker is free for the next one
+            logging.exception(f'pipeline {self._name} stage {stage.name} stuck')
+            self.failures[stage.name] += 1
+            self.stuck[stage.name] += 1
+            metrics.stage_items.inc(account=self._name, stage=stage.name, result='stuck')
+            return
+        except Exception:
+            logging.exception(f'pipeline {self._name} stage {stage.name} failed')
+            self.failures[stage.name] += 1
+            metrics.stage_items.inc(account=self._name, stage=stage.name, result='fail')
+            return
+
+        metrics.stage_items.inc(account=self._name, stage=stage.name, result='success')
+        if stage_result is not None and idx + 1 < len(self._queues):
+            await self._queues[idx + 1].put(stage_result)
@@ -0,0 +1,100 @@
+"""Local index of already processed payments."""
+from __future__ import annotations
+
+import datetime
+import logging
+import sqlite3
+
+from app.avangard_parser import AvangardPayment, PaymentKey, payment_key
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS processed_payments (
+        payment_number INTEGER NOT NULL,
+        payment_date TEXT NOT NULL,
+        agent_inn INTEGER NOT NULL,
+        processed_at TEXT NOT NULL,
+        PRIMARY KEY (payment_number, payment_date, agent_inn)
+    ) WITHOUT ROWID
+"""
+CREATE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS processed_payments_date ON processed_payments (payment_date)
+"""
+
+
+class ProcessedPayments:
+    """SQLite backed dedup index with in-memory key set for O(1) lookups."""
+
+    def __init__(self, db_path: str, retention_days: int) -> None:
+        """Open index and load keys inside retention window."""
+        self._retention = datetime.timedelta(days=retention_days)
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute(CREATE_TABLE_SQL)
+        self._connection.execute(CREATE_INDEX_SQL)
+        self._keys: set[PaymentKey] = set()
+        self.compact()
+
+        rows = self._connection.execute('SELECT payment_number, payment_date, agent_inn FROM processed_payments')
+        for payment_number, payment_date, agent_inn in rows:
+            self._keys.add((payment_number, datetime.date.fromisoformat(payment_date), agent_inn))
+        logging.debug(f'load processed payments index {len(self._keys)=}')
+
+    def __enter__(self) -> ProcessedPayments:
+        """Enter index context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close index on exit."""
+        self.close()
+
+    def __contains__(self, payment: AvangardPayment) -> bool:
+        """Check payment was processed already."""
+        return payment_key(payment) in self._keys
+
+    def __len__(self) -> int:
+        """Return count of indexed payments."""
+        return len(self._keys)
+
+    def close(self) -> None:
+        """Close index connection."""
+        self._connection.close()
+
+    def filter_unseen(self, payments: list[AvangardPayment]) -> list[AvangardPayment]:
+        """Return payments not processed yet (dups inside list and expired payments are dropped too)."""
+        cutoff = self._cutoff()
+        batch_keys: set[PaymentKey] = set()
+        unseen = []
+        for payment in payments:
+            key = payment_key(payment)
+            if key in self._keys or key in batch_keys or payment.payment_date < cutoff:
+                continue
+            batch_keys.add(key)
+            unseen.append(payment)
+        logging.debug(f'filter unseen payments {len(unseen)=}')
+        return unseen
+
+    def mark_processed(self, payments: list[AvangardPayment]) -> None:
+        """Store payments as processed."""
+        processed_at = datetime.datetime.utcnow().isoformat()
+        keys = [payment_key(payment) for payment in payments]
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO processed_payments VALUES (?, ?, ?, ?)',
+                [(number, payment_date.isoformat(), inn, processed_at) for number, payment_date, inn in keys],
+            )
+        self._keys.update(keys)
+
+    def compact(self) -> int:
+        """Drop payments older than retention window, return count of dropped."""
+        cutoff = self._cutoff()
+        with self._connection:
+            dropped = self._connection.execute(
+                'DELETE FROM processed_payments WHERE payment_date < ?',
+                (cutoff.isoformat(),),
+            ).rowcount
+        self._keys = {key for key in self._keys if key[1] >= cutoff}
+        if dropped:
+            logging.info(f'compact processed payments index {dropped=}')
+        return dropped
+
+    def _cutoff(self) -> datetime.date:
+        return datetime.datetime.utcnow().date() - self._retention
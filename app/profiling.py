@@ -0,0 +1,153 @@
+"""Opt-in profiling of single sync iterations: cProfile, stack sampling and playwright traces."""
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import datetime
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Callable, Iterator, Literal
+
+ProfileMode = Literal['cprofile', 'sampling']
+TraceHook = Callable[[str], None]
+
+
+class IterationProfiler:
+    """Profile iterations on request (signal) or always, keep dumps in size capped directory."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        output_dir: str,
+        mode: ProfileMode = 'cprofile',
+        playwright_trace: bool = True,
+        always: bool = False,
+        max_files: int = 20,
+        max_mb: float = 200,
+        sample_interval: float = 0.005,
+    ) -> None:
+        """Create profiler, nothing is profiled until request() unless always is set."""
+        self._output_dir = output_dir
+        self._mode = mode
+        self._playwright_trace = playwright_trace
+        self._always = always
+        self._max_files = max_files
+        self._max_bytes = max_mb * 1024 * 1024
+        self._sample_interval = sample_interval
+        self._requested = False
+        self._active = False
+
+    def request(self) -> None:
+        """Profile next iteration."""
+        logging.info('profiling of next iteration requested')
+        self._requested = True
+
+    @contextlib.contextmanager
+    def profile(self, label: str, trace: TraceHook | None = None) -> Iterator[None]:
+        """Profile block if requested, trace hook gets path for playwright trace of the same block."""
+        # one profile at a time: concurrent accounts share thread and profiler hooks
+        if self._active or not (self._always or self._requested):
+            yield
+            return
+
+        self._requested = False
+        self._active = True
+        os.makedirs(self._output_dir, exist_ok=True)
+        started_at = datetime.datetime.utcnow().strftime('%Y%m%dT%H%M%S')  # noqa: WPS323
+        path_prefix = os.path.join(self._output_dir, f'{started_at}-{label}')
+        if trace and self._playwright_trace:
+            trace(f'{path_prefix}-trace.zip')
+
+        try:
+            with self._profiler(path_prefix):
+                yield
+        finally:
+            self._active = False
+            logging.info(f'profile saved {path_prefix=}')
+            self.rotate()
+
+    def rotate(self) -> list[str]:
+        """Remove oldest dumps above files count or total size limits, return removed paths."""
+        if not os.path.isdir(self._output_dir):
+            return []
+
+        dumps = sorted(
+            (entry for entry in os.scandir(self._output_dir) if entry.is_file()),
+            key=lambda dump: dump.stat().st_mtime,
+            reverse=True,
+        )
+        removed = []
+        total_bytes = 0
+        for idx, entry in enumerate(dumps):
+            total_bytes += entry.stat().st_size
+            if idx and (idx >= self._max_files or total_bytes > self._max_bytes):
+                os.remove(entry.path)
+                removed.append(entry.path)
+        if removed:
+            logging.info(f'rotate profiles {removed=}')
+        return removed
+
+    @contextlib.contextmanager
+    def _profiler(self, path_prefix: str) -> Iterator[None]:
+        if self._mode == 'sampling':
+            sampler = StackSampler(self._sample_interval)
+            try:
+                with sampler:
+                    yield
+            finally:
+                sampler.dump(f'{path_prefix}.folded')
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            with profiler:
+                yield
+        finally:
+            profiler.dump_stats(f'{path_prefix}.pstats')
+
+
+class StackSampler:
+    """Sample stacks of the event loop thread from background thread, dump as folded stacks for flamegraphs."""
+
+    def __init__(self, interval: float) -> None:
+        """Create sampler of current thread."""
+        self.stacks: Counter[str] = Counter()
+        self._interval = interval
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def __enter__(self) -> StackSampler:
+        """Start sampling."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop sampling."""
+        self._stopped.set()
+        self._thread.join()
+
+    def dump(self, path: str) -> None:
+        """Write samples in folded stacks format."""
+        with open(path, 'w', encoding='utf-8') as dump_file:
+            for stack, count in self.stacks.most_common():
+                dump_file.write(f'{stack} {count}\n')
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)  # noqa: WPS437
+            if frame is not None:
+                self.stacks[_fold_stack(frame)] += 1
+
+
+def _fold_stack(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        names.append(f'{filename}:{code.co_name}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
@@ -0,0 +1,115 @@
+"""Adaptive sync schedule: business calendar, payments arrival rate, failures backoff and external triggers."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import functools
+import logging
+import os
+import random
+from typing import Callable, Iterable
+
+BUSINESS_WEEKDAYS = (0, 1, 2, 3, 4)
+
+
+class SyncScheduler:
+    """Compute delay before next sync and wait for it or for external trigger."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        business_hours: tuple[int, int] = (9, 19),
+        business_weekdays: Iterable[int] = BUSINESS_WEEKDAYS,
+        holidays: Iterable[datetime.date] = (),
+        off_hours_factor: float = 4.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.1,
+        rate_alpha: float = 0.3,
+        tz: datetime.tzinfo | None = None,
+    ) -> None:
+        """
+        Create scheduler.
+
+        Interval is base_interval in business time, multiplied by off_hours_factor outside of it,
+        shortened by recent payments arrival rate (EWMA of new payments per sync with rate_alpha weight)
+        and growing by backoff_factor after each failure in a row. Result is kept in [min_interval, max_interval]
+        and randomized by +-jitter share.
+        """
+        self.arrival_rate: float = 0
+        self.failures = 0
+        self._base_interval = base_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._business_hours = business_hours
+        self._business_weekdays = frozenset(business_weekdays)
+        self._holidays = frozenset(holidays)
+        self._off_hours_factor = off_hours_factor
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._rate_alpha = rate_alpha
+        self._tz = tz
+        self._triggered = asyncio.Event()
+        self._random = random.Random()  # noqa: S311 jitter only
+
+    def is_business_time(self, now: datetime.datetime) -> bool:
+        """Check moment is inside business hours of working day."""
+        if now.date() in self._holidays or now.weekday() not in self._business_weekdays:
+            return False
+        hour_start, hour_end = self._business_hours
+        return hour_start <= now.hour < hour_end
+
+    def next_interval(self, now: datetime.datetime | None = None) -> float:
+        """Return seconds to wait before next sync."""
+        now = now or datetime.datetime.now(self._tz)
+        if self.failures:
+            interval = self._base_interval * self._backoff_factor ** self.failures
+        elif self.is_business_time(now):
+            interval = self._base_interval / (1 + self.arrival_rate)
+        else:
+            interval = self._base_interval * self._off_hours_factor / (1 + self.arrival_rate)
+
+        interval *= 1 + self._random.uniform(-self._jitter, self._jitter)
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def record_success(self, new_payments: int) -> None:
+        """Update arrival rate by count of new payments found and reset failures backoff."""
+        self.failures = 0
+        self.arrival_rate += self._rate_alpha * (new_payments - self.arrival_rate)
+
+    def record_failure(self) -> None:
+        """Increase failures backoff."""
+        self.failures += 1
+
+    def trigger(self) -> None:
+        """Force next sync right now."""
+        logging.info('sync triggered')
+        self._triggered.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait timeout seconds or trigger, return True when triggered."""
+        try:
+            await asyncio.wait_for(self._triggered.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._triggered.clear()
+        return True
+
+
+async def serve_trigger_socket(path: str, trigger: Callable[[], None]) -> asyncio.AbstractServer:
+    """Listen local unix socket, every connection calls trigger."""
+    if os.path.exists(path):
+        os.unlink(path)
+    return await asyncio.start_unix_server(functools.partial(_on_trigger_connection, trigger), path=path)
+
+
+async def _on_trigger_connection(
+    trigger: Callable[[], None],
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    trigger()
+    writer.write(b'ok\n')
+    await writer.drain()
+    writer.close()
@@ -1,7 +1,22 @@
 """Application settings."""
+import datetime
+import functools
 import os
+from typing import Literal, Optional
 
-from pydantic import BaseSettings, Field
+from pydantic import BaseModel, BaseSettings, Field
+
+DEFAULT_ACCOUNT = 'default'
+
+
+class AvangardAccount(BaseModel):
+    """Bank account credentials and browser profile dir."""
+
+    name: str
+    login: str
+    password: str
+    user_dir: Optional[str] = None
+    moysklad_token: Optional[str] = None
 
 
 class AppSettings(BaseSettings):
@@ -11,16 +26,111 @@ class AppSettings(BaseSettings):
         default='Mozilla/5.0 (X11; x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Safari/536.36"',
     )
     throttling_time: float = Field(60.0 * 15, description='Seconds between update rate tries in seconds')
-    throttling_min_time: float = 10.0
+    throttling_min_time: float = Field(10.0, description='Min seconds between syncs')
+    throttling_max_interval: float = Field(60.0 * 60 * 2, description='Max seconds between syncs (off hours, backoff)')
     debug: bool = Field(default=False)
 
     avangard_user_dir: str = '/tmp/chromedriver_save_dir'
+    avangard_login_page: str = Field('https://login.avangard.ru/', description='Bank login page url')
+    avangard_main_page: str = Field('https://corp.avangard.ru/clbAvn/faces/facelet-pages/iday_balance.jspx', description='Bank main page url')
     avangard_http_timeout: int = Field(25, description='avangard request timeout in seconds')
-    avangard_human_slow_factor: int = 75
+    avangard_human_slow_factor: int = Field(75, description='Delay between key presses in login form, ms')
+    avangard_block_resources: bool = Field(default=True, description='Abort heavy/tracking requests in browser')
+    avangard_block_resource_types: Optional[list[str]] = Field(None, description='Playwright resource types, None for defaults')
+    avangard_block_url_patterns: Optional[list[str]] = Field(None, description='Url regexps to block, None for defaults')
+    avangard_allow_url_patterns: Optional[list[str]] = Field(None, description='Url regexps never blocked, None for defaults')
+    avangard_fast_fetch: bool = Field(default=False, description='Replay statement form POST instead of rendering pages')
+    avangard_archive_dir: Optional[str] = Field(None, description='Keep fetched statement pages, skip parsing unchanged ones')
+    avangard_archive_max_days: float = Field(30, description='Prune archived pages older than N days')
+    avangard_archive_max_mb: float = Field(500, description='Prune oldest archived pages above total size, Mb')
+    avangard_state_dir: Optional[str] = Field(None, description='Save encrypted bank session, browser runs without profile')
+    avangard_state_secret: Optional[str] = Field(None, description='Secret of saved bank session encryption')
+    avangard_state_max_age_hours: float = Field(12, description='Do not restore saved bank session older than N hours')
+    avangard_profile_max_mb: Optional[float] = Field(300, description='Trim persistent browser profile above size, Mb')
+    avangard_session_max_iterations: int = Field(20, description='Recycle browser after N sync iterations')
+    avangard_parse_executor: Literal['inline', 'thread', 'process'] = Field('thread', description='Where to parse statements')
+    avangard_parse_workers: int = 2
+    avangard_session_max_rss_mb: float = Field(1024.0, description='Recycle browser when memory usage exceeds it, Mb')
     avangard_login: str
+    avangard_accounts: list[AvangardAccount] = Field(default_factory=list, description='Accounts to sync, JSON list')
+    avangard_browser_pool_size: int = Field(2, description='Max Chromium processes running at once for all accounts')
+
+    metrics_host: str = '127.0.0.1'
+    metrics_port: Optional[int] = Field(None, description='Serve prometheus metrics on http port')
+    metrics_textfile: Optional[str] = Field(None, description='Write prometheus metrics to file after each sync')
+
+    profile_dir: str = Field('/tmp/avangard_profiles', description='Profiles of iterations, send SIGUSR2 to profile next one')
+    profile_mode: Literal['cprofile', 'sampling'] = 'cprofile'
+    profile_always: bool = Field(default=False, description='Profile every iteration')
+    profile_playwright_trace: bool = Field(default=True, description='Record playwright trace of profiled iteration')
+    profile_sample_interval: float = Field(0.005, description='Stack sampling interval in seconds')
+    profile_max_files: int = 20
+    profile_max_mb: float = 200
+
+    moysklad_token: Optional[str] = Field(None, description='Api token, orders are not updated without it')
+    moysklad_api_url: str = 'https://api.moysklad.ru/api/remap/1.2'
+    moysklad_timeout: float = Field(25, description='Moysklad request timeout in seconds')
+    moysklad_wait_state: str = Field('Ожидает оплаты', description='State of orders waiting for payment')
+    moysklad_paid_state: str = Field('Оплачен', description='State to set on paid orders')
+    moysklad_batch_size: int = Field(100, description='Max orders per update request')
+
+    sync_db_path: str = Field('/tmp/avangard_sync.sqlite3', description='Local sync state storage')
+    sync_overlap_days: int = Field(1, description='Re-request days before last synced date')
+    sync_backfill_days: int = Field(7, description='Days to fetch on cold start')
+    sync_backfill_chunk_days: int = Field(7, description='Max days per one statement request')
+    sync_backfill_concurrency: int = Field(3, description='Max statement requests in flight while backfill')
+    sync_business_hour_start: int = 9
+    sync_business_hour_end: int = 19
+    sync_business_weekdays: list[int] = Field([0, 1, 2, 3, 4], description='Mon is 0')
+    sync_holidays: list[datetime.date] = Field(default_factory=list, description='Non working dates')
+    sync_utc_offset_hours: int = Field(3, description='Business calendar timezone')
+    sync_off_hours_factor: float = Field(4.0, description='Interval multiplier outside business hours')
+    sync_backoff_factor: float = Field(2.0, description='Interval multiplier per failure in a row')
+    sync_jitter: float = Field(0.1, description='Random interval deviation share')
+    sync_arrival_rate_alpha: float = Field(0.3, description='Weight of last sync in payments arrival rate')
+    sync_trigger_socket: Optional[str] = Field(None, description='Unix socket path, connect to force sync')
+    sync_queue_size: int = Field(2, description='Max fetched batches waiting for every pipeline stage')
+    sync_update_concurrency: int = Field(1, description='Max batches updating orders at once per account')
+    sync_drain_timeout: float = Field(60, description='Seconds to finish queued batches on shutdown, below stopwaitsecs')
+    sync_cycle_deadline: Optional[float] = Field(300, description='Max seconds of bank fetch, hung browser is killed after it')
+    sync_stage_deadline: Optional[float] = Field(120, description='Max seconds of dedup, update and sink stage per batch')
+    sync_sinks: list[str] = Field(default_factory=list, description='New payments outputs: jsonl:, sqlite:, spool: path or http(s) webhook url')
+    sync_sink_batch_size: int = Field(100, description='Max payments per sink write')
+    sync_sink_flush_seconds: float = Field(30, description='Max seconds payment waits in sink buffer')
+    sync_sink_retries: int = Field(3, description='Sink write attempts')
+    sync_sink_timeout: float = Field(10, description='Webhook sink request timeout in seconds')
+    processed_retention_days: int = Field(90, description='Keep processed payments index for N days')
     avangard_password: str
 
+    def sync_accounts(self) -> list[AvangardAccount]:
+        """Return accounts to sync (avangard_login/password one if list is empty) with browser profile dirs."""
+        if not self.avangard_accounts:
+            return [AvangardAccount(
+                name=DEFAULT_ACCOUNT,
+                login=self.avangard_login,
+                password=self.avangard_password,
+                user_dir=self.avangard_user_dir,
+                moysklad_token=self.moysklad_token,
+            )]
+        accounts = []
+        for account in self.avangard_accounts:
+            accounts.append(account.copy(update={
+                'user_dir': account.user_dir or f'{self.avangard_user_dir}_{account.name}',
+                'moysklad_token': account.moysklad_token or self.moysklad_token,
+            }))
+        return accounts
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings() -> AppSettings:
+    """Build settings from env and .env file once."""
+    return AppSettings(
+        _env_file=os.path.join(os.path.dirname(__file__), '..', '.env'),
+    )
+
 
-app_settings = AppSettings(
-    _env_file=os.path.join(os.path.dirname(__file__), '..', '.env'),
-)
+def __getattr__(name: str) -> AppSettings:  # noqa: WPS413
+    """Build app_settings on first access, so importing module requires no credentials."""
+    if name == 'app_settings':
+        return get_settings()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,297 @@
+"""Batched payment sinks: jsonl file, sqlite table, webhook and spool dir queue, writes are idempotent by payment key."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any
+from urllib.request import Request, urlopen
+
+from app import metrics
+from app.avangard_parser import AvangardPayment
+from app.statement_batch import payment_record
+
+SinkRecord = dict[str, Any]
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS sink_payments (
+        idempotency_key TEXT PRIMARY KEY,
+        account TEXT NOT NULL,
+        record TEXT NOT NULL,
+        written_at TEXT NOT NULL
+    ) WITHOUT ROWID
+"""
+INSERT_SQL = "INSERT OR IGNORE INTO sink_payments VALUES (?, ?, ?, datetime('now'))"
+SPOOL_READY_DIR = 'new'
+SPOOL_TMP_DIR = 'tmp'
+IDEMPOTENCY_KEY = 'idempotency_key'
+
+
+class SinkError(RuntimeError):
+    """Sink write failed after retries."""
+
+
+def idempotency_key(payment: AvangardPayment) -> str:
+    """Return stable payment key: payment number, date and payer inn."""
+    payment_date = payment.payment_date.isoformat()
+    return f'{payment.payment_number}-{payment_date}-{payment.agent_inn}'
+
+
+def batch_key(records: list[SinkRecord]) -> str:
+    """Return key of batch, the same for retries of the same records."""
+    keys = sorted(record[IDEMPOTENCY_KEY] for record in records)
+    return hashlib.sha256('\n'.join(keys).encode()).hexdigest()
+
+
+class PaymentSink:
+    """Buffer payments and write them by batch_size batches, oldest payment waits flush_seconds at most."""
+
+    kind = 'sink'
+
+    def __init__(  # noqa: WPS211
+        self,
+        account: str,
+        batch_size: int = 100,
+        flush_seconds: float = 30,
+        retries: int = 3,
+        retry_delay: float = 1,
+        max_buffered: int = 10000,
+    ) -> None:
+        """Create sink, payments above max_buffered are dropped oldest first while writes fail."""
+        self._account = account
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._max_buffered = max_buffered
+        self._buffer: list[tuple[float, SinkRecord]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start background flush: buffered payments are written by time even if nothing is sent."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def send(self, payments: list[AvangardPayment]) -> int:
+        """Buffer payments, write them when batch is full or flush interval passed, return written count."""
+        now = time.monotonic()
+        self._buffer.extend((now, self._record(payment)) for payment in payments)
+        dropped = len(self._buffer) - self._max_buffered
+        if dropped > 0:
+            logging.warning(f'sink buffer is full {self.kind} {dropped=}')
+            metrics.sink_dropped.inc(dropped, account=self._account, sink=self.kind)
+            self._buffer = self._buffer[dropped:]
+
+        if len(self._buffer) >= self._batch_size or self._flush_due(now):
+            return await self.flush()
+        return 0
+
+    async def flush(self) -> int:
+        """Write buffered payments by batches, batch stays buffered if it is failed."""
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self._batch_size]
+                await self._write_with_retries([record for _, record in batch])
+                self._buffer = self._buffer[len(batch):]
+                written += len(batch)
+                self._observe_written(batch)
+        return written
+
+    async def close(self) -> None:
+        """Stop background flush, flush buffered payments and release sink resources."""
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            await self.flush()
+        except SinkError:
+            lost = len(self._buffer)
+            logging.exception(f'sink payments lost on close {self.kind} {lost=}')
+        self._close()
+
+    async def _write(self, records: list[SinkRecord]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        """Release sink resources."""
+
+    def _record(self, payment: AvangardPayment) -> SinkRecord:
+        return {
+            IDEMPOTENCY_KEY: idempotency_key(payment),
+            'account': self._account,
+            **payment_record(payment),
+        }
+
+    def _message(self, records: list[SinkRecord]) -> str:
+        return json.dumps({'account': self._account, 'payments': records}, ensure_ascii=False)
+
+    def _flush_due(self, now: float) -> bool:
+        if not self._buffer:
+            return False
+        oldest_buffered_at = self._buffer[0][0]
+        return now - oldest_buffered_at >= self._flush_seconds
+
+    async def _flush_periodically(self) -> None:
+        while True:  # stopped by cancel on close
+            await asyncio.sleep(self._flush_delay(time.monotonic()))
+            if not self._flush_due(time.monotonic()):
+                continue
+            try:
+                await self.flush()
+            except SinkError:
+                # failed batch stays buffered, next flush retries it
+                logging.exception(f'sink background flush failed {self.kind}')
+
+    def _flush_delay(self, now: float) -> float:
+        if not self._buffer:
+            return self._flush_seconds
+        oldest_buffered_at = self._buffer[0][0]
+        return max(oldest_buffered_at + self._flush_seconds - now, 0)
+
+    def _observe_written(self, batch: list[tuple[float, SinkRecord]]) -> None:
+        written_at = time.monotonic()
+        metrics.sink_payments.inc(len(batch), account=self._account, sink=self.kind)
+        for buffered_at, _ in batch:
+            lag = written_at - buffered_at
+            metrics.sink_lag_seconds.observe(lag, account=self._account, sink=self.kind)
+
+    async def _write_with_retries(self, records: list[SinkRecord]) -> None:
+        for attempt in range(1, self._retries + 1):
+            try:
+                await self._timed_write(records)
+            except Exception as exc:
+                metrics.sink_errors.inc(account=self._account, sink=self.kind)
+                if attempt >= self._retries:
+                    raise SinkError(f'Sink write failed {self.kind} {self._account}') from exc
+                logging.warning(f'sink write failed {self.kind} {attempt=}', exc_info=exc)
+                await asyncio.sleep(self._retry_delay * attempt)
+                continue
+            return
+
+    async def _timed_write(self, records: list[SinkRecord]) -> None:
+        with metrics.sink_seconds.time(account=self._account, sink=self.kind):
+            await self._write(records)
+
+
+class JsonlSink(PaymentSink):
+    """Append payment records to json lines file, readers dedup repeated lines by idempotency_key."""
+
+    kind = 'jsonl'
+
+    def __init__(self, path: str, account: str, **options: Any) -> None:
+        """Create sink writing to path."""
+        super().__init__(account, **options)
+        self._path = path
+
+    async def _write(self, records: list[SinkRecord]) -> None:
+        lines = [f'{json.dumps(record, ensure_ascii=False)}\n' for record in records]
+        await asyncio.to_thread(self._append, ''.join(lines))
+
+    def _append(self, lines: str) -> None:
+        os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+        with open(self._path, 'a', encoding='utf-8') as jsonl_file:
+            jsonl_file.write(lines)
+            jsonl_file.flush()
+            os.fsync(jsonl_file.fileno())
+
+
+class SqliteSink(PaymentSink):
+    """Insert payment records to sqlite table, repeated keys are ignored."""
+
+    kind = 'sqlite'
+
+    def __init__(self, db_path: str, account: str, **options: Any) -> None:
+        """Open database and create table, connection is used by worker threads one write at a time."""
+        super().__init__(account, **options)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute(CREATE_TABLE_SQL)
+
+    async def _write(self, records: list[SinkRecord]) -> None:
+        rows = [
+            (record[IDEMPOTENCY_KEY], self._account, json.dumps(record, ensure_ascii=False))
+            for record in records
+        ]
+        await asyncio.to_thread(self._insert, rows)
+
+    def _insert(self, rows: list[tuple[str, str, str]]) -> None:
+        with self._connection:
+            self._connection.executemany(INSERT_SQL, rows)
+
+    def _close(self) -> None:
+        self._connection.close()
+
+
+class WebhookSink(PaymentSink):
+    """POST batches as json, Idempotency-Key header is the same for retries of batch."""
+
+    kind = 'webhook'
+
+    def __init__(self, url: str, account: str, timeout_seconds: float = 10, **options: Any) -> None:
+        """Create sink posting to url."""
+        super().__init__(account, **options)
+        self._url = url
+        self._timeout = timeout_seconds
+
+    async def _write(self, records: list[SinkRecord]) -> None:
+        request = Request(  # noqa: S310 url comes from settings
+            self._url,
+            method='POST',
+            data=self._message(records).encode(),
+            headers={
+                'Content-Type': 'application/json',
+                'Idempotency-Key': batch_key(records),
+            },
+        )
+        await asyncio.to_thread(self._send, request)
+
+    def _send(self, request: Request) -> None:
+        with urlopen(request, timeout=self._timeout) as response:  # noqa: S310
+            response.read()
+
+
+class SpoolSink(PaymentSink):
+    """Local message queue stand-in: every batch is json file in spool_dir/new named by batch key, consumer removes it."""
+
+    kind = 'spool'
+
+    def __init__(self, spool_dir: str, account: str, **options: Any) -> None:
+        """Create sink writing to spool_dir."""
+        super().__init__(account, **options)
+        self._spool_dir = spool_dir
+
+    async def _write(self, records: list[SinkRecord]) -> None:
+        await asyncio.to_thread(self._put, records)
+
+    def _put(self, records: list[SinkRecord]) -> None:
+        message_name = f'{batch_key(records)}.json'
+        tmp_path = os.path.join(self._spool_dir, SPOOL_TMP_DIR, message_name)
+        os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+        os.makedirs(os.path.join(self._spool_dir, SPOOL_READY_DIR), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as message_file:
+            message_file.write(self._message(records))
+        # consumers see complete messages only, retried batch replaces the same message
+        os.replace(tmp_path, os.path.join(self._spool_dir, SPOOL_READY_DIR, message_name))
+
+
+def create_sink(url: str, account: str, **options: Any) -> PaymentSink:
+    """Create sink by url: jsonl:, sqlite: or spool: path ({account} is replaced) and http(s) webhook."""
+    scheme, _, location = url.partition(':')
+    location = location.replace('{account}', account)
+    if scheme in {'http', 'https'}:
+        return WebhookSink(url, account, **options)
+
+    options.pop('timeout_seconds', None)
+    if scheme == 'jsonl':
+        return JsonlSink(location, account, **options)
+    if scheme == 'sqlite':
+        return SqliteSink(location, account, **options)
+    if scheme == 'spool':
+        return SpoolSink(location, account, **options)
+    raise ValueError(f'Unknown sink {url=}')
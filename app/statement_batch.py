@@ -0,0 +1,128 @@
+"""Batch parsing of saved statement pages (plain or gzip html) over a process pool with merged output."""
+from __future__ import annotations
+
+import csv
+import dataclasses
+import gzip
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Iterable, Iterator, Literal
+
+from app.avangard_parser import AvangardPayment, iter_income_payments, payment_key
+
+OutputFormat = Literal['jsonl', 'csv', 'columns']
+STATEMENT_SUFFIXES = ('.html', '.htm', '.html.gz', '.htm.gz')
+GZIP_MAGIC = b'\x1f\x8b'
+PAYMENT_FIELDS = tuple(field.name for field in dataclasses.fields(AvangardPayment))
+
+
+@dataclasses.dataclass
+class FileResult:
+    """Payments of one statement file with skipped rows by reason."""
+
+    path: str
+    payments: list[AvangardPayment]
+    skipped: Counter[str]
+    error: str | None = None
+
+
+def iter_statement_files(paths: Iterable[str]) -> Iterator[str]:
+    """Yield statement files, directories are walked recursively in sorted order."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            yield from (
+                os.path.join(root, filename)
+                for filename in sorted(files)
+                if filename.endswith(STATEMENT_SUFFIXES)
+            )
+
+
+def parse_statement_file(path: str) -> FileResult:
+    """Parse statement file, gzip is detected by content, errors are reported in result."""
+    skipped: Counter[str] = Counter()
+    try:
+        payments = _read_payments(path, skipped)
+    except Exception as exc:
+        return FileResult(path, [], skipped, repr(exc))
+    return FileResult(path, payments, skipped)
+
+
+def parse_statement_files(paths: Iterable[str], workers: int = 1) -> Iterator[FileResult]:
+    """Yield parse results in paths order, files are parsed by workers processes if more than one."""
+    if workers <= 1:
+        yield from map(parse_statement_file, paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_statement_file, paths)
+
+
+def unique_payments(file_results: Iterable[FileResult]) -> Iterator[AvangardPayment]:
+    """Yield payments of all results, payment seen in previous files is skipped."""
+    seen = set()
+    for file_result in file_results:
+        for payment in file_result.payments:
+            key = payment_key(payment)
+            if key not in seen:
+                seen.add(key)
+                yield payment
+
+
+def payment_record(payment: AvangardPayment) -> dict[str, Any]:
+    """Return json-compatible payment fields: dates and amounts as strings."""
+    return {
+        field_name: field_value if isinstance(field_value, (int, str)) else str(field_value)
+        for field_name, field_value in dataclasses.asdict(payment).items()
+    }
+
+
+def write_payments(payments: Iterable[AvangardPayment], stream: IO[str], output_format: OutputFormat = 'jsonl') -> int:
+    """Write payments as json lines, csv or json object of columns, return count of payments."""
+    records = map(payment_record, payments)
+    if output_format == 'csv':
+        return _write_csv(records, stream)
+    if output_format == 'columns':
+        return _write_columns(records, stream)
+    return _write_jsonl(records, stream)
+
+
+def _read_payments(path: str, skipped: Counter[str]) -> list[AvangardPayment]:
+    with open(path, 'rb') as raw_file:
+        is_gzip = raw_file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    with gzip.open(path) if is_gzip else open(path, 'rb') as statement_file:  # noqa: WPS515
+        return list(iter_income_payments(statement_file, skipped))
+
+
+def _write_jsonl(records: Iterable[dict[str, Any]], stream: IO[str]) -> int:
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def _write_csv(records: Iterable[dict[str, Any]], stream: IO[str]) -> int:
+    writer = csv.DictWriter(stream, fieldnames=PAYMENT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def _write_columns(records: Iterable[dict[str, Any]], stream: IO[str]) -> int:
+    columns: dict[str, list[Any]] = {field_name: [] for field_name in PAYMENT_FIELDS}
+    for record in records:
+        for field_name, column in columns.items():
+            column.append(record[field_name])
+    json.dump(columns, stream, ensure_ascii=False)
+    stream.write('\n')
+    return len(columns[PAYMENT_FIELDS[0]])
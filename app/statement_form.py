@@ -0,0 +1,75 @@
+"""JSF (Oracle ADF Faces) statement search form, replayed without browser rendering."""
+from __future__ import annotations
+
+import dataclasses
+import re
+from datetime import date
+from typing import Union
+from urllib.parse import urljoin
+
+from lxml import etree
+
+START_DATE_FIELD = 'docslist:main:startdate'
+FINISH_DATE_FIELD = 'docslist:main:finishdate'
+
+search_form_xpath = etree.XPath(f'//form[.//input[@name="{START_DATE_FIELD}"]]')
+form_inputs_xpath = etree.XPath('.//input[@name]')
+form_selects_xpath = etree.XPath('.//select[@name]')
+selected_option_xpath = etree.XPath('.//option[@selected]/@value')
+option_xpath = etree.XPath('.//option/@value')
+search_button_xpath = etree.XPath('.//a[.//img[@title="Показать"]]/@onclick')
+submit_params_re = re.compile(r"(\w+):'([^']*)'")
+UNCHECKED_INPUT_TYPES = frozenset(('checkbox', 'radio'))
+SKIPPED_INPUT_TYPES = frozenset(('button', 'submit', 'image', 'reset', 'file'))
+
+# value types of playwright APIRequestContext form
+FormFields = dict[str, Union[str, float, bool]]
+
+
+@dataclasses.dataclass
+class StatementForm:
+    """Statement search form captured from rendered reports page: action url and fields with view state."""
+
+    action: str
+    fields: FormFields
+
+    def with_dates(self, start_date: date, end_date: date) -> FormFields:
+        """Return form fields to post for given date range."""
+        return {
+            **self.fields,
+            START_DATE_FIELD: start_date.strftime('%d.%m.%Y'),
+            FINISH_DATE_FIELD: end_date.strftime('%d.%m.%Y'),
+        }
+
+
+def parse_statement_form(html_source: str, page_url: str) -> StatementForm | None:
+    """Return statement search form of reports page or None if page has no such form."""
+    forms = search_form_xpath(etree.HTML(html_source))
+    if not forms:
+        return None
+    form = forms[0]
+
+    fields = _input_values(form)
+    for select in form_selects_xpath(form):
+        selected = selected_option_xpath(select) or option_xpath(select)
+        fields[select.get('name')] = selected[0] if selected else ''
+
+    # "Показать" is a link calling submitForm('docslist',1,{source:'...'}), js puts params into hidden inputs
+    onclick = search_button_xpath(form)
+    if not onclick:
+        return None
+    fields.update(submit_params_re.findall(onclick[0]))
+
+    return StatementForm(action=urljoin(page_url, form.get('action', '')), fields=fields)
+
+
+def _input_values(form: etree._Element) -> FormFields:  # noqa: WPS437
+    fields: FormFields = {}
+    for field in form_inputs_xpath(form):
+        input_type = field.get('type', 'text').lower()
+        if input_type in SKIPPED_INPUT_TYPES:
+            continue
+        if input_type in UNCHECKED_INPUT_TYPES and field.get('checked') is None:
+            continue
+        fields[field.get('name')] = field.get('value', '')
+    return fields
@@ -0,0 +1,113 @@
+"""Local storage of sync progress (high-water mark of fetched payments)."""
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import sqlite3
+
+from app.avangard_client import DateWindow, split_date_range
+from app.avangard_parser import AvangardPayment
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS sync_state (
+        name TEXT PRIMARY KEY,
+        synced_until TEXT NOT NULL,
+        last_payment_date TEXT,
+        last_payment_number INTEGER
+    )
+"""
+
+
+@dataclasses.dataclass
+class SyncMark:
+    """Last synced date and last seen payment."""
+
+    synced_until: datetime.date
+    last_payment_date: datetime.date | None = None
+    last_payment_number: int | None = None
+
+
+class SyncState:
+    """SQLite backed high-water mark of already fetched payments."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        db_path: str,
+        overlap_days: int,
+        backfill_days: int,
+        backfill_chunk_days: int,
+        name: str = 'default',
+    ) -> None:
+        """Open (and create if needed) sync state storage."""
+        self._overlap = datetime.timedelta(days=overlap_days)
+        self._backfill = datetime.timedelta(days=backfill_days)
+        self._chunk_days = backfill_chunk_days
+        self._name = name
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute(CREATE_TABLE_SQL)
+
+    def __enter__(self) -> SyncState:
+        """Enter storage context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close storage on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close storage connection."""
+        self._connection.close()
+
+    def get_mark(self) -> SyncMark | None:
+        """Return current high-water mark or None on cold start."""
+        row = self._connection.execute(
+            'SELECT synced_until, last_payment_date, last_payment_number FROM sync_state WHERE name = ?',
+            (self._name,),
+        ).fetchone()
+        if not row:
+            return None
+
+        return SyncMark(
+            synced_until=datetime.date.fromisoformat(row[0]),
+            last_payment_date=datetime.date.fromisoformat(row[1]) if row[1] else None,
+            last_payment_number=row[2],
+        )
+
+    def fetch_windows(self, today: datetime.date) -> list[DateWindow]:
+        """Return date windows to request next, split into bounded chunks."""
+        mark = self.get_mark()
+        if mark:
+            start_date = min(mark.synced_until - self._overlap, today)
+        else:
+            start_date = today - self._backfill
+            logging.info(f'sync state not found, backfill from {start_date}')
+        return split_date_range(start_date, today, self._chunk_days)
+
+    def update_mark(self, synced_until: datetime.date, payments: list[AvangardPayment]) -> SyncMark:
+        """Move high-water mark after payments of windows up to synced_until were processed."""
+        mark = self.get_mark() or SyncMark(synced_until=synced_until)
+        mark.synced_until = max(mark.synced_until, synced_until)
+        for payment in payments:
+            if not mark.last_payment_date or _is_newer(payment, mark.last_payment_date, mark.last_payment_number):
+                mark.last_payment_date = payment.payment_date
+                mark.last_payment_number = payment.payment_number
+
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)',
+                (
+                    self._name,
+                    mark.synced_until.isoformat(),
+                    mark.last_payment_date.isoformat() if mark.last_payment_date else None,
+                    mark.last_payment_number,
+                ),
+            )
+        logging.debug(f'update sync mark {mark=}')
+        return mark
+
+
+def _is_newer(payment: AvangardPayment, last_date: datetime.date, last_number: int | None) -> bool:
+    if payment.payment_date != last_date:
+        return payment.payment_date > last_date
+    return payment.payment_number > (last_number or 0)
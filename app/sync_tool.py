@@ -1,17 +1,38 @@
 """This module periodically fetch actual payments from avangard and update orders on moysklad."""
 
 import asyncio
+import contextlib
+import dataclasses
 import datetime
+import functools
 import logging
+import os
 import signal
+import time
 from collections import Counter
-from typing import Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, Optional
 
-from app.avangard_client import AvangardApi
-from app.avangard_parser import AvangardPayment
-from app.settings import app_settings
+from app import metrics, network_filter
+from app.avangard_client import AvangardApi, split_date_range
+from app.avangard_parser import AvangardPayment, PaymentKey, payment_key
+from app.avangard_session import AvangardSession
+from app.browser_pool import BrowserPool
+from app.browser_state import StateVault
+from app.moysklad_client import MoyskladClient
+from app.order_matching import OrderMatcher
+from app.page_archive import PageArchive
+from app.pipeline import Pipeline, Stage
+from app.processed_payments import ProcessedPayments
+from app.profiling import IterationProfiler
+from app.scheduler import SyncScheduler, serve_trigger_socket
+from app.settings import DEFAULT_ACCOUNT, AvangardAccount, app_settings
+from app.sinks import PaymentSink, create_sink
+from app.sync_state import DateWindow, SyncState
+from app.watchdog import DeadlineError, run_with_deadline
 
 FORCE_SHUTDOWN = False
+CYCLE_SUCCESS = 'success'
 
 
 def sigint_handler(current_signal, frame) -> None:  # type: ignore
@@ -20,7 +41,7 @@ def sigint_handler(current_signal, frame) -> None:  # type: ignore
     FORCE_SHUTDOWN = True  # noqa: WPS442
 
 
-async def main(  # noqa: WPS231
+async def main(  # noqa: WPS210
     throttling_max_time: float,
     max_iterations: Optional[int] = None,
 ) -> Counter:
@@ -31,67 +52,519 @@ async def main(  # noqa: WPS231
     - get wait-orders from moysklad
     - close orders by payments from bank
 
+    throttling_max_time is base interval between syncs, scheduler adapts it.
+    All accounts are synced concurrently on shared browser pool, max_iterations limits every account.
     """
+    async with contextlib.AsyncExitStack() as resources:
+        parse_executor = _create_parse_executor()
+        if parse_executor:
+            resources.enter_context(parse_executor)
+        browser_pool = await resources.enter_async_context(BrowserPool(app_settings.avangard_browser_pool_size))
+        sync_accounts = [
+            await _open_sync_account(resources, account, throttling_max_time, parse_executor, browser_pool)
+            for account in app_settings.sync_accounts()
+        ]
+        profiler = _create_profiler()
+        await _install_sync_triggers([sync_account.scheduler for sync_account in sync_accounts], resources)
+        _install_profiling_trigger(profiler, resources)
+        await _install_metrics_server(resources)
+
+        accounts_cnt = await asyncio.gather(*[
+            _sync_account_loop(sync_account, browser_pool, profiler, throttling_max_time, max_iterations)
+            for sync_account in sync_accounts
+        ])
+
     cnt: Counter = Counter(
         iteration=0,
         fails=0,
         success=0,
+        stuck=0,
+        recovered=0,
     )
-    throttling_timer: float = 0
-    throttling_timer_chunk: float = min(app_settings.throttling_min_time, throttling_max_time)
-    while not max_iterations or cnt['iteration'] < max_iterations:
-        if FORCE_SHUTDOWN:
-            break
-
-        if cnt['iteration']:
-            if throttling_timer < throttling_max_time:
-                logging.debug(f'sleep chunk time {throttling_timer=} {throttling_max_time}')
-                throttling_timer += throttling_timer_chunk
-                await asyncio.sleep(throttling_timer_chunk)
-                continue
-            else:
-                logging.debug('sleep time end')
-                throttling_timer = 0
-
-        cnt['iteration'] += 1
-        logging.info(f'Current iteration {cnt=}')
-
-        ok = await _process_payments_sync()
-        cnt['success' if ok else 'fails'] += 1
-
+    for account_cnt in accounts_cnt:
+        cnt.update(account_cnt)
     logging.info(f'shutdown {cnt=}')
     return cnt
 
 
-async def _process_payments_sync() -> bool:
-    await _get_income_payments()
-    # todo filter already processed payments
-    # todo search orders on moysklad
-    # todo check pairs
-    # todo update orders by new payments
+async def fetch_payments(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    account_name: Optional[str] = None,
+) -> list[AvangardPayment]:
+    """Fetch income payments of date range for one account (first if not set), sync state is not touched."""
+    accounts = {account.name: account for account in app_settings.sync_accounts()}
+    if account_name and account_name not in accounts:
+        raise ValueError(f'Unknown account {account_name}')
+    account = accounts[account_name] if account_name else next(iter(accounts.values()))
+    windows = split_date_range(start_date, end_date, app_settings.sync_backfill_chunk_days)
+    async with _create_avangard_session(account=account) as avangard_session:
+        return await _get_income_payments(avangard_session, windows)
+
+
+@dataclasses.dataclass(eq=False)
+class FetchedBatch:
+    """Payments of fetched date windows, new ones are set by dedup stage."""
+
+    windows: list[DateWindow]
+    payments: list[AvangardPayment]
+    new_payments: list[AvangardPayment] = dataclasses.field(default_factory=list)
+    failed_updates_seen: int = 0
+    applied: bool = False
+
+
+@dataclasses.dataclass
+class SyncAccount:
+    """Account session with its own sync progress, dedup index and schedule."""
+
+    name: str
+    session: AvangardSession
+    sync_state: SyncState
+    processed_payments: ProcessedPayments
+    scheduler: SyncScheduler
+    order_matcher: Optional[OrderMatcher] = None
+    in_flight: set[PaymentKey] = dataclasses.field(default_factory=set)
+    sinks: list[PaymentSink] = dataclasses.field(default_factory=list)
+    cycle_stats: Counter = dataclasses.field(default_factory=Counter)
+    recovering: bool = False
+    updating: list[FetchedBatch] = dataclasses.field(default_factory=list)
+    failed_updates: int = 0
+
+
+async def _open_sync_account(
+    resources: contextlib.AsyncExitStack,
+    account: AvangardAccount,
+    throttling_max_time: float,
+    parse_executor: Optional[Executor],
+    browser_pool: BrowserPool,
+) -> SyncAccount:
+    db_path = _account_db_path(account.name)
+    return SyncAccount(
+        name=account.name,
+        session=await resources.enter_async_context(_create_avangard_session(parse_executor, account, browser_pool)),
+        sync_state=resources.enter_context(_create_sync_state(account.name, db_path)),
+        processed_payments=resources.enter_context(ProcessedPayments(db_path, app_settings.processed_retention_days)),
+        scheduler=_create_scheduler(throttling_max_time),
+        order_matcher=_create_order_matcher(account.moysklad_token),
+        sinks=[_open_sink(resources, sink_url, account.name) for sink_url in app_settings.sync_sinks],
+    )
+
+
+def _open_sink(resources: contextlib.AsyncExitStack, sink_url: str, account_name: str) -> PaymentSink:
+    sink = create_sink(
+        sink_url,
+        account_name,
+        batch_size=app_settings.sync_sink_batch_size,
+        flush_seconds=app_settings.sync_sink_flush_seconds,
+        retries=app_settings.sync_sink_retries,
+        timeout_seconds=app_settings.sync_sink_timeout,
+    )
+    # closed after pipeline is drained: buffered payments are flushed on shutdown
+    resources.push_async_callback(sink.close)
+    sink.start()
+    return sink
+
+
+async def _sync_account_loop(
+    sync_account: SyncAccount,
+    browser_pool: BrowserPool,
+    profiler: IterationProfiler,
+    throttling_max_time: float,
+    max_iterations: Optional[int],
+) -> Counter:
+    cnt: Counter = Counter(
+        iteration=0,
+        fails=0,
+        success=0,
+    )
+    async with _create_sync_pipeline(sync_account) as pipeline:
+        while not max_iterations or cnt['iteration'] < max_iterations:
+            if cnt['iteration']:
+                wait_chunk = min(app_settings.throttling_min_time, throttling_max_time)
+                await _wait_next_sync(sync_account.scheduler, wait_chunk)
+            if FORCE_SHUTDOWN:
+                break
+
+            cnt['iteration'] += 1
+            logging.info(f'Current iteration {sync_account.name} {cnt=}')
+            batch = await _fetch_in_slot(sync_account, browser_pool, profiler)
+            cnt['fails' if batch is None else 'success'] += 1
+            if batch is not None:
+                # waits while dedup and update stages are behind: bank is not polled faster than orders are updated
+                await pipeline.put(batch)
+        await pipeline.close(app_settings.sync_drain_timeout)
+        cnt.update(_pipeline_stats(pipeline))
+    cnt.update(sync_account.cycle_stats)
+    logging.info(f'shutdown {sync_account.name} {cnt=}')
+    return cnt
+
+
+def _pipeline_stats(pipeline: Pipeline) -> Counter:
+    stats: Counter = Counter()
+    for failed_stage, fails in pipeline.failures.items():
+        stats[f'{failed_stage}_fails'] = fails
+    for stuck_stage, stuck in pipeline.stuck.items():
+        stats[f'{stuck_stage}_stuck'] = stuck
+    return stats
+
+
+def _create_sync_pipeline(sync_account: SyncAccount) -> Pipeline:
+    stages = [
+        Stage(
+            'dedup',
+            functools.partial(_dedup_stage, sync_account),
+            queue_size=app_settings.sync_queue_size,
+            deadline=app_settings.sync_stage_deadline,
+        ),
+        Stage(
+            'update',
+            functools.partial(_update_stage, sync_account),
+            concurrency=app_settings.sync_update_concurrency,
+            queue_size=app_settings.sync_queue_size,
+            deadline=app_settings.sync_stage_deadline,
+        ),
+    ]
+    if sync_account.sinks:
+        stages.append(Stage(
+            'sink',
+            functools.partial(_sink_stage, sync_account),
+            queue_size=app_settings.sync_queue_size,
+            deadline=app_settings.sync_stage_deadline,
+        ))
+    return Pipeline(sync_account.name, stages)
+
+
+async def _fetch_in_slot(
+    sync_account: SyncAccount,
+    browser_pool: BrowserPool,
+    profiler: IterationProfiler,
+) -> Optional[FetchedBatch]:
+    # slot is held by session until its browser is closed, waiting for it does not count against fetch deadline
+    await sync_account.session.reserve_browser()
+    with profiler.profile(f'sync-{sync_account.name}', trace=sync_account.session.trace_next_call):
+        batch = await _fetch_batch(sync_account)
+    if browser_pool.contended:
+        # give chromium slot to waiting account, session logs in again next time
+        await sync_account.session.close()
+    return batch
+
+
+async def _fetch_batch(sync_account: SyncAccount) -> Optional[FetchedBatch]:
+    windows = sync_account.sync_state.fetch_windows(datetime.datetime.utcnow().date())
+    batch: Optional[FetchedBatch] = None
+    cycle_result = 'fail'
+    try:
+        batch = FetchedBatch(windows, await _fetch_with_deadline(sync_account, windows))
+    except DeadlineError:
+        logging.exception(f'sync payments stuck {sync_account.name}')
+        cycle_result = 'stuck'
+        # hung browser does not answer close: it is killed, next cycle starts fresh one
+        await sync_account.session.abort()
+    except Exception:
+        logging.exception(f'sync payments failed {sync_account.name}')
+    else:
+        cycle_result = CYCLE_SUCCESS
+
+    _record_cycle(sync_account, cycle_result)
+    return batch
+
+
+async def _fetch_with_deadline(sync_account: SyncAccount, windows: list[DateWindow]) -> list[AvangardPayment]:
+    fetching = _get_income_payments(sync_account.session, windows)
+    with metrics.sync_seconds.time(account=sync_account.name):
+        return await run_with_deadline(fetching, app_settings.sync_cycle_deadline, 'fetch')
+
+
+def _record_cycle(sync_account: SyncAccount, cycle_result: str) -> None:
+    if cycle_result == CYCLE_SUCCESS and sync_account.recovering:
+        logging.info(f'sync recovered {sync_account.name}')
+        sync_account.cycle_stats['recovered'] += 1
+        sync_account.recovering = False
+    elif cycle_result == 'stuck':
+        sync_account.cycle_stats['stuck'] += 1
+        sync_account.recovering = True
+    if cycle_result != CYCLE_SUCCESS:
+        sync_account.scheduler.record_failure()
+
+    metrics.sync_cycles.inc(account=sync_account.name, result=cycle_result)
+    if app_settings.metrics_textfile:
+        metrics.registry.write_textfile(app_settings.metrics_textfile)
+
+
+async def _dedup_stage(sync_account: SyncAccount, batch: FetchedBatch) -> FetchedBatch:
+    # windows of next fetch overlap previous ones: payments of batches still updating are not new
+    batch.new_payments = [
+        payment
+        for payment in sync_account.processed_payments.filter_unseen(batch.payments)
+        if payment_key(payment) not in sync_account.in_flight
+    ]
+    new_count = len(batch.new_payments)
+    sync_account.in_flight.update(map(payment_key, batch.new_payments))
+    sync_account.updating.append(batch)
+    batch.failed_updates_seen = sync_account.failed_updates
+    logging.info(f'new payments found {sync_account.name} {new_count=}')
+    metrics.new_payments.inc(new_count, account=sync_account.name)
+    sync_account.scheduler.record_success(new_count)
+    return batch
+
+
+async def _update_stage(sync_account: SyncAccount, batch: FetchedBatch) -> FetchedBatch:
+    with _finish_update(sync_account, batch):
+        await _apply_batch(sync_account, batch)
+    return batch
+
+
+async def _sink_stage(sync_account: SyncAccount, batch: FetchedBatch) -> None:
+    # empty batches are sent too: sinks flush payments waiting longer than flush interval
+    sends = [sink.send(batch.new_payments) for sink in sync_account.sinks]
+    await asyncio.gather(*sends)
+
+
+@contextlib.contextmanager
+def _finish_update(sync_account: SyncAccount, batch: FetchedBatch) -> Iterator[None]:
+    try:
+        yield
+    finally:
+        # payments of failed batch are not marked processed and found new again by next fetch
+        sync_account.in_flight.difference_update(map(payment_key, batch.new_payments))
+        sync_account.updating.remove(batch)
+        if not batch.applied:
+            sync_account.failed_updates += 1
 
-    return True
 
+async def _apply_batch(sync_account: SyncAccount, batch: FetchedBatch) -> None:
+    if sync_account.order_matcher:
+        for match in await sync_account.order_matcher.process(batch.new_payments):
+            metrics.order_matches.inc(account=sync_account.name, status=match.status)
 
-async def _get_income_payments() -> list[AvangardPayment]:
-    avangard_client = AvangardApi(
-        user_dir=app_settings.avangard_user_dir,
+    sync_account.processed_payments.mark_processed(batch.new_payments)
+    sync_account.processed_payments.compact()
+    synced_until = _safe_synced_until(sync_account, batch)
+    if synced_until:
+        sync_account.sync_state.update_mark(synced_until, batch.payments)
+    batch.applied = True
+
+
+def _safe_synced_until(sync_account: SyncAccount, batch: FetchedBatch) -> Optional[datetime.date]:
+    if batch.failed_updates_seen != sync_account.failed_updates:
+        # deduped while failed batch was in flight: its payments were skipped here and are not processed
+        return None
+    # mark never passes windows of batch still updating, it may fail
+    synced_until = batch.windows[-1][1]
+    for other in sync_account.updating:
+        if other is not batch:
+            synced_until = min(synced_until, other.windows[0][0])
+    return synced_until
+
+
+async def _wait_next_sync(scheduler: SyncScheduler, chunk_seconds: float) -> None:
+    interval = scheduler.next_interval()
+    logging.debug(f'wait next sync {interval=:.1f}')
+    deadline = time.monotonic() + interval
+    # wake up by chunks to check shutdown flag set by sync signal handler
+    while not FORCE_SHUTDOWN:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or await scheduler.wait(min(chunk_seconds, remaining)):
+            return
+
+
+async def _install_sync_triggers(schedulers: list[SyncScheduler], resources: contextlib.AsyncExitStack) -> None:
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGUSR1, _trigger_all, schedulers)
+    resources.callback(loop.remove_signal_handler, signal.SIGUSR1)
+
+    if app_settings.sync_trigger_socket:
+        server = await serve_trigger_socket(app_settings.sync_trigger_socket, functools.partial(_trigger_all, schedulers))
+        resources.push_async_callback(server.wait_closed)
+        resources.callback(server.close)
+
+
+def _trigger_all(schedulers: list[SyncScheduler]) -> None:
+    for scheduler in schedulers:
+        scheduler.trigger()
+
+
+def _install_profiling_trigger(profiler: IterationProfiler, resources: contextlib.AsyncExitStack) -> None:
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGUSR2, profiler.request)
+    resources.callback(loop.remove_signal_handler, signal.SIGUSR2)
+
+
+async def _install_metrics_server(resources: contextlib.AsyncExitStack) -> None:
+    if app_settings.metrics_port is None:
+        return
+
+    server = await metrics.registry.serve(app_settings.metrics_host, app_settings.metrics_port)
+    resources.push_async_callback(server.wait_closed)
+    resources.callback(server.close)
+    logging.info(f'serve metrics on {app_settings.metrics_host}:{app_settings.metrics_port}')
+
+
+async def _get_income_payments(
+    avangard_session: AvangardSession,
+    windows: list[DateWindow],
+) -> list[AvangardPayment]:
+    if len(windows) == 1:
+        payments = await avangard_session.get_income_payments(*windows[0])
+    else:
+        payments = await avangard_session.backfill_income_payments(
+            start_date=windows[0][0],
+            end_date=windows[-1][1],
+            window_days=app_settings.sync_backfill_chunk_days,
+            concurrency=app_settings.sync_backfill_concurrency,
+        )
+    logging.debug(f'fetch {len(payments)=}')
+    return payments
+
+
+def _create_scheduler(base_interval: float) -> SyncScheduler:
+    return SyncScheduler(
+        base_interval=base_interval,
+        min_interval=min(app_settings.throttling_min_time, base_interval),
+        max_interval=max(app_settings.throttling_max_interval, base_interval),
+        business_hours=(app_settings.sync_business_hour_start, app_settings.sync_business_hour_end),
+        business_weekdays=app_settings.sync_business_weekdays,
+        holidays=app_settings.sync_holidays,
+        off_hours_factor=app_settings.sync_off_hours_factor,
+        backoff_factor=app_settings.sync_backoff_factor,
+        jitter=app_settings.sync_jitter,
+        rate_alpha=app_settings.sync_arrival_rate_alpha,
+        tz=datetime.timezone(datetime.timedelta(hours=app_settings.sync_utc_offset_hours)),
+    )
+
+
+def _create_order_matcher(moysklad_token: Optional[str]) -> Optional[OrderMatcher]:
+    if not moysklad_token:
+        return None
+    return OrderMatcher(
+        client=MoyskladClient(moysklad_token, app_settings.moysklad_api_url, app_settings.moysklad_timeout),
+        wait_state=app_settings.moysklad_wait_state,
+        paid_state=app_settings.moysklad_paid_state,
+        batch_size=app_settings.moysklad_batch_size,
+    )
+
+
+def _create_profiler() -> IterationProfiler:
+    return IterationProfiler(
+        output_dir=app_settings.profile_dir,
+        mode=app_settings.profile_mode,
+        playwright_trace=app_settings.profile_playwright_trace,
+        always=app_settings.profile_always,
+        max_files=app_settings.profile_max_files,
+        max_mb=app_settings.profile_max_mb,
+        sample_interval=app_settings.profile_sample_interval,
+    )
+
+
+def _create_sync_state(account_name: str, db_path: str) -> SyncState:
+    return SyncState(
+        db_path=db_path,
+        overlap_days=app_settings.sync_overlap_days,
+        backfill_days=app_settings.sync_backfill_days,
+        backfill_chunk_days=app_settings.sync_backfill_chunk_days,
+        name=account_name,
+    )
+
+
+def _account_db_path(account_name: str) -> str:
+    if account_name == DEFAULT_ACCOUNT:
+        return app_settings.sync_db_path
+    root, ext = os.path.splitext(app_settings.sync_db_path)
+    return f'{root}_{account_name}{ext}'
+
+
+def _create_parse_executor() -> Optional[Executor]:
+    workers = app_settings.avangard_parse_workers
+    if app_settings.avangard_parse_executor == 'process':
+        return ProcessPoolExecutor(max_workers=workers)
+    if app_settings.avangard_parse_executor == 'thread':
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parser')
+    return None
+
+
+def _create_avangard_session(
+    parse_executor: Optional[Executor] = None,
+    account: Optional[AvangardAccount] = None,
+    browser_pool: Optional[BrowserPool] = None,
+) -> AvangardSession:
+    account = account or app_settings.sync_accounts()[0]
+    # archive and vault outlive recycled clients: state is kept after browser restart and key derived once
+    client_factory = functools.partial(
+        _create_avangard_client,
+        parse_executor,
+        account,
+        browser_pool,
+        page_archive=_create_page_archive(account.name),
+        state_vault=_create_state_vault(account.name),
+    )
+    return AvangardSession(
+        client_factory=client_factory,
+        login=account.login,
+        password=account.password,
+        max_iterations=app_settings.avangard_session_max_iterations,
+        max_rss_mb=app_settings.avangard_session_max_rss_mb,
+        browser_pool=browser_pool,
+    )
+
+
+def _create_avangard_client(
+    parse_executor: Optional[Executor],
+    account: AvangardAccount,
+    browser_pool: Optional[BrowserPool],
+    page_archive: Optional[PageArchive] = None,
+    state_vault: Optional[StateVault] = None,
+) -> AvangardApi:
+    return AvangardApi(
+        user_dir=account.user_dir or app_settings.avangard_user_dir,
         timeout_seconds=app_settings.avangard_http_timeout,
-        slow_mo=app_settings.avangard_human_slow_factor,
+        type_delay_ms=app_settings.avangard_human_slow_factor,
         headless=not app_settings.debug,
         user_agent=app_settings.http_user_agent,
+        parse_executor=parse_executor,
+        resource_filter=_create_resource_filter(),
+        fast_fetch=app_settings.avangard_fast_fetch,
+        playwright_factory=browser_pool.playwright if browser_pool else None,
+        account=account.name,
+        login_page=app_settings.avangard_login_page,
+        main_page=app_settings.avangard_main_page,
+        page_archive=page_archive,
+        state_vault=state_vault,
+        profile_max_mb=app_settings.avangard_profile_max_mb,
     )
-    await avangard_client.setup_browser()
 
-    await avangard_client.login(app_settings.avangard_login, app_settings.avangard_password)
-    end_dt = datetime.datetime.utcnow().date()
-    start_dt = end_dt - datetime.timedelta(days=7)
 
-    payments = await avangard_client.get_income_payments(start_dt, end_dt)
-    logging.debug(f'fetch {len(payments)=}')
+def _create_state_vault(account_name: str) -> Optional[StateVault]:
+    if not app_settings.avangard_state_dir or not app_settings.avangard_state_secret:
+        return None
+    return StateVault(
+        path=os.path.join(app_settings.avangard_state_dir, f'{account_name}.state'),
+        secret=app_settings.avangard_state_secret,
+        max_age_hours=app_settings.avangard_state_max_age_hours,
+    )
 
-    await avangard_client.terminate()
-    return payments
+
+def _create_page_archive(account_name: str) -> Optional[PageArchive]:
+    if not app_settings.avangard_archive_dir:
+        return None
+    return PageArchive(
+        root_dir=os.path.join(app_settings.avangard_archive_dir, account_name),
+        max_age_days=app_settings.avangard_archive_max_days,
+        max_mb=app_settings.avangard_archive_max_mb,
+    )
+
+
+def _create_resource_filter() -> Optional[network_filter.ResourceFilter]:
+    if not app_settings.avangard_block_resources:
+        return None
+
+    block_types = app_settings.avangard_block_resource_types
+    block_urls = app_settings.avangard_block_url_patterns
+    allow_urls = app_settings.avangard_allow_url_patterns
+    return network_filter.ResourceFilter(
+        blocked_resource_types=network_filter.DEFAULT_BLOCKED_RESOURCE_TYPES if block_types is None else block_types,
+        blocked_url_patterns=network_filter.DEFAULT_BLOCKED_URL_PATTERNS if block_urls is None else block_urls,
+        allowed_url_patterns=network_filter.DEFAULT_ALLOWED_URL_PATTERNS if allow_urls is None else allow_urls,
+    )
 
 
 if __name__ == '__main__':
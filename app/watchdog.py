@@ -0,0 +1,137 @@
+"""Deadlines of sync stages and kill of hung Chromium processes found by command line marker."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import time
+import uuid
+from typing import Awaitable, Iterable, TypeVar
+
+PROC_DIR = '/proc'
+STATE_FIELD = 0  # fields index of /proc/<pid>/stat after process name
+PPID_FIELD = 1
+RSS_FIELD = 21
+ZOMBIE_STATE = 'Z'
+BROWSER_MARKER_SWITCH = '--avangard-sync-client'
+KILL_GRACE_SECONDS = 2
+KILL_POLL_SECONDS = 0.1
+
+StageResult = TypeVar('StageResult')
+ProcStats = dict[int, tuple[int, int]]  # parent pid and rss pages by pid
+
+
+class DeadlineError(RuntimeError):
+    """Stage did not finish before its deadline."""
+
+
+async def run_with_deadline(awaitable: Awaitable[StageResult], seconds: float | None, stage: str) -> StageResult:
+    """Await stage, cancel it and raise DeadlineError when it runs longer than seconds (None is no deadline)."""
+    try:
+        return await asyncio.wait_for(awaitable, seconds)
+    except asyncio.TimeoutError as exc:
+        raise DeadlineError(f'{stage} missed deadline of {seconds}s') from exc
+
+
+def browser_marker() -> str:
+    """Return unique Chromium switch, processes of one client are found by it."""
+    return f'{BROWSER_MARKER_SWITCH}={uuid.uuid4().hex}'
+
+
+def find_marked_pids(marker: str) -> set[int]:
+    """Return pids of processes started with marker argument."""
+    marker_arg = marker.encode()
+    marked = set()
+    for proc_name in _iter_pid_names():
+        try:
+            with open(os.path.join(PROC_DIR, proc_name, 'cmdline'), 'rb') as cmdline_file:
+                cmdline_args = cmdline_file.read().split(b'\0')
+        except OSError:
+            continue
+        if marker_arg in cmdline_args:
+            marked.add(int(proc_name))
+    return marked
+
+
+async def kill_process_tree(root_pids: Iterable[int], grace_seconds: float = KILL_GRACE_SECONDS) -> set[int]:
+    """Terminate processes with descendants, kill survivors after grace period and reap own children."""
+    pids = process_tree(root_pids, read_proc_stats())
+    if not pids:
+        return pids
+
+    logging.warning(f'terminate hung processes {sorted(pids)}')
+    _send_signal(pids, signal.SIGTERM)
+    deadline = time.monotonic() + grace_seconds
+    while _alive(pids) and time.monotonic() < deadline:
+        await asyncio.sleep(KILL_POLL_SECONDS)
+
+    survivors = _alive(pids)
+    if survivors:
+        logging.warning(f'kill hung processes {sorted(survivors)}')
+        _send_signal(survivors, signal.SIGKILL)
+    _reap(pids)
+    return pids
+
+
+def process_tree(root_pids: Iterable[int], proc_stats: ProcStats) -> set[int]:
+    """Return running root pids and all their descendants."""
+    tree = set(root_pids).intersection(proc_stats)
+    for pid in sorted(proc_stats):
+        parent_pid = proc_stats[pid][0]
+        while parent_pid and parent_pid not in tree:
+            parent_pid = proc_stats.get(parent_pid, (0, 0))[0]
+        if parent_pid:
+            tree.add(pid)
+    return tree
+
+
+def read_proc_stats() -> ProcStats:
+    """Return (parent pid, rss pages) by pid from procfs."""
+    proc_stats = {}
+    for proc_name in _iter_pid_names():
+        stat_fields = _read_stat_fields(proc_name)
+        if stat_fields:
+            parent_pid, rss_pages = stat_fields[PPID_FIELD], stat_fields[RSS_FIELD]
+            proc_stats[int(proc_name)] = (int(parent_pid), int(rss_pages))
+    return proc_stats
+
+
+def _iter_pid_names() -> list[str]:
+    if not os.path.isdir(PROC_DIR):
+        return []
+    return list(filter(str.isdigit, os.listdir(PROC_DIR)))
+
+
+def _read_stat_fields(proc_name: str) -> list[str]:
+    try:
+        with open(os.path.join(PROC_DIR, proc_name, 'stat')) as stat_file:
+            return stat_file.read().rsplit(')', 1)[1].split()
+    except OSError:
+        return []
+
+
+def _alive(pids: set[int]) -> set[int]:
+    alive = set()
+    for pid in pids:
+        stat_fields = _read_stat_fields(str(pid))
+        if stat_fields and stat_fields[STATE_FIELD] != ZOMBIE_STATE:
+            alive.add(pid)
+    return alive
+
+
+def _send_signal(pids: set[int], signal_number: int) -> None:
+    for pid in pids:
+        try:
+            os.kill(pid, signal_number)
+        except ProcessLookupError:
+            logging.debug(f'process already exited {pid=}')
+
+
+def _reap(pids: set[int]) -> None:
+    # only own children can be reaped here, chromium processes are reaped by playwright driver
+    for pid in pids:
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            logging.debug(f'process is not a child {pid=}')
@@ -0,0 +1 @@
+"""Avangard sync tool benchmarks."""
@@ -0,0 +1,39 @@
+"""Wall time of cli startup in fresh interpreters, compared with eager import of app.sync_tool.
+
+Usage: python -m benchmarks.cli_startup [--repeat 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+
+PAGE_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'test_avangard_parser', 'pages', 'full_payments_page.html')
+CASES = (
+    ('interpreter', ['-c', 'pass']),
+    ('cli --help', ['-m', 'app.cli', '--help']),
+    ('cli parse-file', ['-m', 'app.cli', 'parse-file', PAGE_PATH]),
+    ('import app.sync_tool', ['-c', 'import app.sync_tool']),
+)
+
+
+def main() -> None:
+    """Run benchmark and print median startup time per case."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    # credentials are required by eager settings only, dummy ones are enough
+    env = {**os.environ, 'avangard_login': 'login', 'avangard_password': 'password'}
+
+    for case_name, case_args in CASES:
+        timings = []
+        for _ in range(args.repeat):
+            started_at = time.perf_counter()
+            subprocess.run([sys.executable, *case_args], env=env, check=True, capture_output=True)  # noqa: S603
+            timings.append(time.perf_counter() - started_at)
+        print(f'{case_name:<22} median={statistics.median(timings) * 1000:>7.1f}ms min={min(timings) * 1000:>7.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
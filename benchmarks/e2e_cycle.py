@@ -0,0 +1,85 @@
+"""End-to-end sync cycle throughput against local fake bank: real Chromium, navigation, parsing.
+
+Usage: python -m benchmarks.e2e_cycle [--cycles 20] [--rows 1000] [--latency 0.2] [--fast-fetch]
+
+Prints seconds per cycle (statement fetch and parse after login) and cycles per minute.
+"""
+import argparse
+import asyncio
+import datetime
+import logging
+import statistics
+import tempfile
+import time
+
+from app import metrics
+from app.avangard_client import AvangardApi
+from app.sync_tool import _create_resource_filter  # noqa: WPS450
+from benchmarks.fake_bank import FakeBank
+
+STEPS = (
+    'restore_session',
+    'login_page',
+    'login',
+    'main_page',
+    'reports_page',
+    'search_form',
+    'search',
+    'search_response',
+    'fast_search',
+)
+
+
+def main() -> None:
+    """Run benchmark and print cycle timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=1000, help='payment rows in every statement')
+    parser.add_argument('--latency', type=float, default=0.2, help='bank statement response delay, seconds')
+    parser.add_argument('--fast-fetch', action='store_true', help='replay statement form POST after first cycle')
+    parser.add_argument('--no-block-resources', action='store_true', help='do not abort heavy requests')
+    parser.add_argument('--headed', action='store_true', help='show browser window')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with FakeBank(rows=args.rows, latency=args.latency) as bank, tempfile.TemporaryDirectory() as user_dir:
+        client = AvangardApi(
+            user_dir=user_dir,
+            timeout_seconds=10,
+            headless=not args.headed,
+            resource_filter=None if args.no_block_resources else _create_resource_filter(),
+            fast_fetch=args.fast_fetch,
+            login_page=bank.login_page,
+            main_page=bank.main_page,
+        )
+        timings = asyncio.run(_run_cycles(client, bank, args.cycles))
+
+    mean = statistics.mean(timings)
+    print(f'rows={args.rows} latency={args.latency} fast_fetch={args.fast_fetch} cycles={len(timings)}')
+    print(f'seconds/cycle mean={mean:.3f} p50={statistics.median(timings):.3f} max={max(timings):.3f}')
+    print(f'cycles/min {60 / mean:.1f}')
+    for step in STEPS:
+        count = metrics.step_seconds.count(account='default', step=step)
+        if count:
+            print(f'step {step:<13} {count:>4} calls')
+
+
+async def _run_cycles(client: AvangardApi, bank: FakeBank, cycles: int) -> list[float]:
+    end_date = datetime.date.today()
+    start_date = end_date - datetime.timedelta(days=30)
+    timings = []
+    await client.setup_browser()
+    try:
+        if not await client.login(*bank.credentials):
+            raise RuntimeError('fake bank login failed')
+        for _ in range(cycles):
+            started_at = time.perf_counter()
+            await client.get_income_payments(start_date, end_date)
+            timings.append(time.perf_counter() - started_at)
+    finally:
+        await client.terminate()
+    return timings
+
+
+if __name__ == '__main__':
+    main()
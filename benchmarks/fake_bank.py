@@ -0,0 +1,246 @@
+"""Local stand-in of avangard internet bank: login form, main page, reports form and synthetic statements.
+
+Usage: python -m benchmarks.fake_bank [--port 8090] [--rows 1000] [--latency 0.2]
+
+Point client to it with avangard_login_page=http://127.0.0.1:8090/ and
+avangard_main_page=http://127.0.0.1:8090/clbAvn/faces/facelet-pages/iday_balance.jspx
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import http.cookies
+import logging
+import secrets
+import threading
+import time
+import urllib.parse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from benchmarks.statement_generator import generate_statement
+
+LOGIN_PATH = '/'
+LOGIN_FORM_PATH = '/login'
+MAIN_PATH = '/clbAvn/faces/facelet-pages/iday_balance.jspx'
+REPORTS_PATH = '/clbAvn/faces/facelet-pages/docs_list.jspx'
+SHOW_IMAGE_PATH = '/clbAvn/adf/images/cache/ru/show.gif'
+SESSION_COOKIE = 'JSESSIONID'
+DATE_FORMAT = '%d.%m.%Y'
+HTML_CONTENT_TYPE = 'text/html; charset=utf-8'
+# 1x1 transparent gif
+SHOW_IMAGE = bytes.fromhex('47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b')
+
+PAGE_TEMPLATE = """<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8"></head>
+<body>{body}</body></html>"""
+
+LOGIN_BODY = """<form name="login" method="POST" action="{action}">
+<div class="error">{error}</div>
+<input type="text" name="login_v"><input type="password" name="passwd_v">
+<div class="buttonLoginBank" onclick="document.forms.login.submit();">Войти</div>
+</form>"""
+
+MAIN_BODY = """<div class="pageTitle">Остатки на счетах</div>
+<input type="button" value="Выписки и отчеты" onclick="location.href='{reports}';">"""
+
+REPORTS_BODY = """<script>
+function submitForm(name, validate, params) {{
+  var form = document.forms[name];
+  for (var key in params) {{ form.elements[key].value = params[key]; }}
+  form.submit();
+}}
+</script>
+<form id="docslist" name="docslist" style="margin:0px" method="POST" action="{action}">
+<div class="pageTitle">Выписки и отчеты</div>
+<input id="docslist:main:startdate" name="docslist:main:startdate" type="text" value="{start}">
+<input id="docslist:main:finishdate" name="docslist:main:finishdate" type="text" value="{end}">
+<select id="docslist:main:acc" name="docslist:main:acc"><option value="0" selected>Все счета</option></select>
+<a href="#" onclick="submitForm('docslist',1,{{source:'docslist:main:_id95'}});return false;"><img src="{image}" \
+title="Показать" alt="Показать" border="0" width="70" height="16"></a>
+<input type="hidden" name="oracle.adf.faces.FORM" value="docslist">
+<input type="hidden" name="oracle.adf.faces.STATE_TOKEN" value="{token}">
+<input type="hidden" name="event">
+<input type="hidden" name="source">
+</form>"""
+
+
+class FakeBank(ThreadingHTTPServer):
+    """Bank stand-in serving in background thread, statement of any period has rows rows after latency seconds."""
+
+    daemon_threads = True
+
+    def __init__(  # noqa: WPS211
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        rows: int = 100,
+        latency: float = 0,
+        login: str = 'login',
+        password: str = 'password',
+    ) -> None:
+        """Bind server, port 0 picks free one."""
+        super().__init__((host, port), FakeBankHandler)
+        self.rows = rows
+        self.latency = latency
+        self.credentials = (login, password)
+        self.sessions: set[str] = set()
+        self.requests: list[tuple[str, str]] = []
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-bank', daemon=True)
+
+    def __enter__(self) -> FakeBank:
+        """Start serving in background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop serving."""
+        self.shutdown()
+        self.server_close()
+
+    @property
+    def base_url(self) -> str:
+        """Return server root url."""
+        host, port = self.server_address[:2]
+        return f'http://{host!s}:{port}'
+
+    @property
+    def login_page(self) -> str:
+        """Return login page url."""
+        return f'{self.base_url}{LOGIN_PATH}'
+
+    @property
+    def main_page(self) -> str:
+        """Return main page url."""
+        return f'{self.base_url}{MAIN_PATH}'
+
+    def create_session(self, login: str, password: str) -> str | None:
+        """Return new session id for valid credentials."""
+        if (login, password) != self.credentials:
+            return None
+        session_id = secrets.token_hex(16)
+        self.sessions.add(session_id)
+        return session_id
+
+
+class FakeBankHandler(BaseHTTPRequestHandler):
+    """Request handler of FakeBank."""
+
+    server: FakeBank
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve pages."""
+        path = self._track_request()
+        if path == LOGIN_PATH:
+            self._send_page(LOGIN_BODY.format(action=LOGIN_FORM_PATH, error=''))
+        elif path == SHOW_IMAGE_PATH:
+            self._send(HTTPStatus.OK, SHOW_IMAGE, 'image/gif')
+        elif not self._authorized():
+            self._redirect(LOGIN_PATH)
+        elif path == MAIN_PATH:
+            self._send_page(MAIN_BODY.format(reports=REPORTS_PATH))
+        elif path == REPORTS_PATH:
+            self._send_reports_page()
+        else:
+            self._send(HTTPStatus.NOT_FOUND, b'')
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Handle login and statement forms."""
+        path = self._track_request()
+        form = self._read_form()
+        if path == LOGIN_FORM_PATH:
+            self._login(form)
+        elif not self._authorized():
+            self._redirect(LOGIN_PATH)
+        elif path == REPORTS_PATH:
+            self._send_statement(form)
+        else:
+            self._send(HTTPStatus.NOT_FOUND, b'')
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: WPS125
+        """Log requests at debug level."""
+        logging.debug(f'fake bank {self.address_string()} {format % args}')  # noqa: WPS323
+
+    def _track_request(self) -> str:
+        path = urllib.parse.urlsplit(self.path).path
+        self.server.requests.append((self.command, path))
+        return path
+
+    def _login(self, form: dict[str, str]) -> None:
+        session_id = self.server.create_session(form.get('login_v', ''), form.get('passwd_v', ''))
+        if session_id is None:
+            self._send_page(LOGIN_BODY.format(action=LOGIN_FORM_PATH, error='Неверный логин или пароль'))
+            return
+        self._redirect(MAIN_PATH, f'{SESSION_COOKIE}={session_id}; Path=/; HttpOnly')
+
+    def _send_reports_page(self) -> None:
+        today = datetime.date.today()
+        self._send_page(REPORTS_BODY.format(
+            action=REPORTS_PATH,
+            start=today.replace(day=1).strftime(DATE_FORMAT),
+            end=today.strftime(DATE_FORMAT),
+            image=SHOW_IMAGE_PATH,
+            token=secrets.randbelow(100),
+        ))
+
+    def _send_statement(self, form: dict[str, str]) -> None:
+        try:
+            start_date = datetime.datetime.strptime(form['docslist:main:startdate'], DATE_FORMAT).date()
+        except (KeyError, ValueError):
+            self._send_reports_page()
+            return
+
+        time.sleep(self.server.latency)
+        statement = generate_statement(self.server.rows, seed=start_date.toordinal(), start_date=start_date)
+        self._send(HTTPStatus.OK, statement.encode())
+
+    def _authorized(self) -> bool:
+        cookies = http.cookies.SimpleCookie(self.headers.get('Cookie', ''))
+        session = cookies.get(SESSION_COOKIE)
+        return session is not None and session.value in self.server.sessions
+
+    def _read_form(self) -> dict[str, str]:
+        length = int(self.headers.get('Content-Length', 0))
+        form_data = self.rfile.read(length).decode()
+        return dict(urllib.parse.parse_qsl(form_data, keep_blank_values=True))
+
+    def _redirect(self, location: str, cookie: str | None = None) -> None:
+        self.send_response(HTTPStatus.SEE_OTHER)
+        self.send_header('Location', location)
+        if cookie:
+            self.send_header('Set-Cookie', cookie)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _send_page(self, body: str) -> None:
+        self._send(HTTPStatus.OK, PAGE_TEMPLATE.format(body=body).encode())
+
+    def _send(self, status: HTTPStatus, payload: bytes, content_type: str = HTML_CONTENT_TYPE) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def main() -> None:
+    """Serve fake bank until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--rows', type=int, default=1000, help='payment rows in every statement')
+    parser.add_argument('--latency', type=float, default=0.2, help='statement response delay, seconds')
+    parser.add_argument('--login', default='login')
+    parser.add_argument('--password', default='password')
+    args = parser.parse_args()
+
+    bank = FakeBank(args.host, args.port, args.rows, args.latency, args.login, args.password)
+    print(f'login page {bank.login_page}\nmain page {bank.main_page}')
+    try:
+        bank.serve_forever()
+    except KeyboardInterrupt:
+        bank.server_close()
+
+
+if __name__ == '__main__':
+    main()
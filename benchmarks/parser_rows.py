@@ -0,0 +1,44 @@
+"""Rows/sec of avangard statement parsers on captured test pages.
+
+Usage: python -m benchmarks.parser_rows [--repeat N]
+"""
+import argparse
+import logging
+import os
+import time
+from typing import Callable
+
+from lxml import etree
+
+from app.avangard_parser import iter_income_payments, parse_income_payments
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'test_avangard_parser', 'pages')
+PAGES = ('full_payments_page', 'payments_not_found_page')
+
+
+def main() -> None:
+    """Run benchmark and print rows/sec per parser and page."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    parsers: dict[str, Callable] = {
+        'parse_income_payments': parse_income_payments,
+        'iter_income_payments': lambda html: list(iter_income_payments(html)),
+    }
+    for page_name in PAGES:
+        with open(os.path.join(PAGES_DIR, f'{page_name}.html'), encoding='utf-8') as page_file:
+            html_source = page_file.read()
+        rows = len(etree.HTML(html_source).xpath('//table[@class="x2f"]//tr'))
+
+        for parser_name, parse in parsers.items():
+            started_at = time.perf_counter()
+            for _ in range(args.repeat):
+                parse(html_source)
+            elapsed = time.perf_counter() - started_at
+            print(f'{page_name:<25} {parser_name:<22} {rows * args.repeat / elapsed:>10.0f} rows/sec')
+
+
+if __name__ == '__main__':
+    main()
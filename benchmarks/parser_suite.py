@@ -0,0 +1,168 @@
+"""Parser throughput/memory benchmark on synthetic statements with regression check.
+
+Usage:
+    python -m benchmarks.parser_suite --output bench.json
+    python -m benchmarks.parser_suite --baseline bench.json --threshold 0.2
+
+Every case runs in a fresh process, so peak RSS is not shared between cases.
+"""
+import argparse
+import datetime
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from app.avangard_parser import iter_income_payments, parse_income_payments
+from benchmarks.statement_generator import count_expected_payments, iter_statement_chunks
+
+DEFAULT_SIZES = '10,1000,10000,100000'
+DEFAULT_PARSERS = 'parse_income_payments,iter_income_payments'
+MIN_ROWS_PER_RUN = 20000
+SEED = 42
+
+CaseResult = dict[str, Any]
+
+
+def main() -> None:
+    """Run benchmark suite, store results and compare them with baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='comma separated statement sizes, rows')
+    parser.add_argument('--parsers', default=DEFAULT_PARSERS, help='comma separated parser names')
+    parser.add_argument('--repeat', type=int, default=5, help='take best time of N runs')
+    parser.add_argument('--output', help='write json results to file')
+    parser.add_argument('--baseline', help='json results of previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2, help='max allowed throughput drop, 0.2 = 20%%')
+    args = parser.parse_args()
+
+    results = {
+        'meta': _meta(),
+        'results': [
+            _run_isolated(parser_name, int(rows), args.repeat)
+            for rows in args.sizes.split(',')
+            for parser_name in args.parsers.split(',')
+        ],
+    }
+    for case in results['results']:
+        print(
+            f"{case['parser']:<22} {case['rows']:>7} rows {case['rows_per_sec']:>10.0f} rows/sec "
+            + f"rss {case['peak_rss_mb']:>8.1f} Mb alloc {case['py_alloc_peak_mb']:>8.1f} Mb",
+        )
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(baseline['results'], results['results'], args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        sys.exit(1 if regressions else 0)
+
+
+def compare(baseline: list[CaseResult], current: list[CaseResult], threshold: float) -> list[str]:
+    """Return descriptions of cases whose throughput dropped more than threshold."""
+    baseline_by_case = {(case['parser'], case['rows']): case for case in baseline}
+    regressions = []
+    for case in current:
+        base_case = baseline_by_case.get((case['parser'], case['rows']))
+        if not base_case:
+            continue
+        ratio = case['rows_per_sec'] / base_case['rows_per_sec']
+        if ratio < 1 - threshold:
+            regressions.append(
+                f"{case['parser']} {case['rows']} rows: "
+                + f"{base_case['rows_per_sec']:.0f} -> {case['rows_per_sec']:.0f} rows/sec ({ratio - 1:+.1%})",
+            )
+    return regressions
+
+
+def run_case(parser_name: str, rows: int, repeat: int) -> CaseResult:
+    """Measure one parser on one statement size (call it in a fresh process)."""
+    logging.disable(logging.WARNING)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.html') as statement_file:
+        statement_file.writelines(iter_statement_chunks(rows, seed=SEED))
+        statement_file.flush()
+        return _measure(_parser(parser_name, statement_file.name), parser_name, rows, repeat)
+
+
+def _measure(parse: Callable[[], int], parser_name: str, rows: int, repeat: int) -> CaseResult:
+    number = max(1, MIN_ROWS_PER_RUN // rows)
+
+    best_time = float('inf')
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):  # noqa: WPS440
+            payments_count = parse()
+        best_time = min(best_time, (time.perf_counter() - started_at) / number)
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    parse()
+    _, py_alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if payments_count != count_expected_payments(rows, seed=SEED):
+        raise RuntimeError(f'{parser_name} parsed {payments_count} payments of {rows} rows, unexpected')
+
+    return {
+        'parser': parser_name,
+        'rows': rows,
+        'payments': payments_count,
+        'seconds': best_time,
+        'rows_per_sec': rows / best_time,
+        'peak_rss_mb': peak_rss_kb / 1024,
+        'py_alloc_peak_mb': py_alloc_peak / 1024 / 1024,
+    }
+
+
+def _parser(parser_name: str, statement_path: str) -> Callable[[], int]:
+    if parser_name == 'parse_income_payments':
+        # whole page in memory, as returned by page.content()
+        with open(statement_path, encoding='utf-8') as statement_file:
+            html_source = statement_file.read()
+        return lambda: len(parse_income_payments(html_source))
+
+    if parser_name == 'iter_income_payments':
+        return lambda: _iter_file(statement_path)
+    raise ValueError(f'Unknown parser {parser_name}')
+
+
+def _iter_file(statement_path: str) -> int:
+    with open(statement_path, 'rb') as statement_file:
+        return sum(1 for _ in iter_income_payments(statement_file))
+
+
+def _run_isolated(parser_name: str, rows: int, repeat: int) -> CaseResult:
+    with multiprocessing.get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(run_case, (parser_name, rows, repeat))
+
+
+def _meta() -> dict[str, Any]:
+    try:
+        commit = subprocess.check_output(  # noqa: S603, S607
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'created_at': datetime.datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Synthetic avangard statement pages with the same markup as real ones."""
+import datetime
+import random
+from typing import Iterator
+
+ROW_KINDS = (
+    ('income', 60),
+    ('outgoing', 25),
+    ('no_invoice', 6),
+    ('no_inn', 5),
+    ('invalid_columns', 4),
+)
+
+PAGE_HEADER = """<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8"></head><body>
+<form id="form" name="form" style="margin:0px" method="POST" action="/clbAvn/faces/facelet-pages/con_acc_stat_v.jspx">
+<div class="pageTitle">Выписка консолидированная</div>
+<div style="padding:0px 0px 2px 0px;text-align:center;"><div id="form:_id428">
+<table class="x2f" cellpadding="1" cellspacing="0" border="0" width="100%"><tbody><tr>
+<th id="_id0" width="1%" nowrap="" class="x2z">Выбрать</th>
+<th id="form:_id428:_id430" width="150" class="x2z x5o">Организация</th>
+<th id="form:_id428:_id434" width="200" class="x2x x5o">Контрагент</th>
+<th id="form:_id428:_id439" width="100" class="x2y x5o">Приход</th>
+<th id="form:_id428:_id443" width="100" class="x2y x5o">Расход</th>
+<th id="form:_id428:_id447" width="70" class="x2z x5o">Дата</th>
+<th id="form:_id428:_id450" width="60" class="x2z x5o">№</th>
+<th id="form:_id428:_id454" width="250" class="x2x x5o">Назначение платежа</th>
+<th id="form:_id428:_id457" width="60px" class="x2z x5o"></th></tr>
+"""
+
+PAGE_FOOTER = """</tbody></table></div></div>
+<input type="hidden" name="oracle.adf.faces.FORM" value="form">
+<input type="hidden" name="oracle.adf.faces.STATE_TOKEN" value="10">
+</form></body></html>
+"""
+
+ROW_TEMPLATE = (
+    '<tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:{idx}:_id429" '
+    + 'title="Выбрать" type="checkbox" value="{idx}"><input type="hidden" name="form:_id428:_us" value="{idx}"></td>'
+    + '<td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"'
+    + '<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td>'
+    + '<td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">{agent}'
+    + '<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>'
+    + 'БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td>'
+    + '<td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">{income}</span>'
+    + '<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td>'
+    + '<td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">{outgoing}</span>'
+    + '<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td>'
+    + '<td headers="form:_id428:_id447" class="x2r x62">{date}<div></div>'
+    + '<img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td>'
+    + '{number_cell}'
+    + '<td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">{description}</div></td>'
+    + '<td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" '
+    + 'style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm(\'form\',0,'
+    + '{{source:\'form:_id428:{idx}:_id459\'}});return false;" class="xl" href="#"><img title="Просмотр документа" '
+    + 'alt="Просмотр документа" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" '
+    + 'width="24"></a></td></tr></tbody></table></td></tr>\n'
+)
+NUMBER_CELL_TEMPLATE = (
+    '<td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;">'
+    + '<span style="white-space: nowrap;">{number}</span></div></td>'
+)
+
+
+def generate_statement(rows: int, seed: int = 0, start_date: datetime.date = datetime.date(2020, 1, 1)) -> str:
+    """Return statement page with given count of payment rows."""
+    return ''.join(iter_statement_chunks(rows, seed, start_date))
+
+
+def iter_statement_chunks(
+    rows: int,
+    seed: int = 0,
+    start_date: datetime.date = datetime.date(2020, 1, 1),
+) -> Iterator[str]:
+    """Yield statement page by rows, so huge pages never live in memory at once."""
+    rnd = random.Random(seed)
+    kinds = [kind for kind, _ in ROW_KINDS]
+    weights = [weight for _, weight in ROW_KINDS]
+
+    yield PAGE_HEADER
+    for idx in range(rows):
+        payment_date = start_date + datetime.timedelta(days=idx * 365 // max(rows, 1))
+        yield _render_row(rnd, rnd.choices(kinds, weights)[0], idx, payment_date)
+    yield PAGE_FOOTER
+
+
+def count_expected_payments(rows: int, seed: int = 0) -> int:
+    """Return count of income payments parser should find in generated statement."""
+    rnd = random.Random(seed)
+    kinds = [kind for kind, _ in ROW_KINDS]
+    weights = [weight for _, weight in ROW_KINDS]
+    expected = 0
+    for _ in range(rows):
+        expected += rnd.choices(kinds, weights)[0] == 'income'
+        _random_row_values(rnd)
+    return expected
+
+
+def _render_row(rnd: random.Random, kind: str, idx: int, payment_date: datetime.date) -> str:
+    inn, invoice, amount = _random_row_values(rnd)
+    agent = f'ООО "Контрагент {inn % 1000}" ИНН {inn} КПП 440101001'
+    description = f'Оплата по счету № {invoice:06d} от {payment_date:%d.%m.%Y} за товар. НДС не облагается'
+    income, outgoing = f'{amount:,.2f}'.replace(',', ' '), ''
+
+    if kind == 'outgoing':
+        income, outgoing = outgoing, income
+        description = 'Комиссия за ведение банковского счета'
+    elif kind == 'no_invoice':
+        description = f'Заявка на внесение наличных N {invoice} по кэш-карте'
+    elif kind == 'no_inn':
+        agent = f'70601 810 8 0620 {inn % 10000000}'
+
+    number_cell = '' if kind == 'invalid_columns' else NUMBER_CELL_TEMPLATE.format(number=idx + 1)
+    return ROW_TEMPLATE.format(
+        idx=idx,
+        agent=agent,
+        income=income,
+        outgoing=outgoing,
+        date=f'{payment_date:%d.%m.%Y}',
+        number_cell=number_cell,
+        description=description,
+    )
+
+
+def _random_row_values(rnd: random.Random) -> tuple[int, int, float]:
+    return (
+        rnd.randint(1000000000, 9999999999),
+        rnd.randint(1, 99999),
+        rnd.randint(100, 500000) + rnd.randint(0, 99) / 100,
+    )
@@ -13,6 +13,13 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def sync_db_path(tmp_path, monkeypatch) -> str:
+    db_path = str(tmp_path / 'sync.sqlite3')
+    monkeypatch.setattr(app_settings, 'sync_db_path', db_path)
+    return db_path
+
+
 @pytest.fixture
 async def avangard_client() -> AvangardApi:
     client = AvangardApi(
@@ -0,0 +1,66 @@
+import asyncio
+import datetime
+
+import pytest
+
+from app.avangard_client import AvangardApi, UnauthorizedError, split_date_range
+from tests.utils import read_page
+
+
+@pytest.fixture
+def offline_client(mocker) -> AvangardApi:
+    client = AvangardApi('/tmp', 10)
+    client._initialized = True
+    client._browser = mocker.AsyncMock()
+    client._browser.new_page.side_effect = lambda: mocker.AsyncMock()
+    return client
+
+
+async def test_backfill_income_payments_happy_path(offline_client: AvangardApi, mocker):
+    pages = [read_page('full_payments_page'), read_page('payments_not_found_page')]
+    in_flight = []
+
+    async def fetch_statement_mock(page, start_date, end_date):
+        in_flight.append(page)
+        await asyncio.sleep(0.01)
+        assert in_flight.count(page) == 1
+        in_flight.remove(page)
+        return pages[start_date.day % 2]
+
+    fetch_mock = mocker.patch.object(offline_client, '_fetch_statement', side_effect=fetch_statement_mock)
+
+    res = await offline_client.backfill_income_payments(
+        datetime.date(year=2020, month=1, day=1),
+        datetime.date(year=2020, month=1, day=31),
+        window_days=3,
+        concurrency=2,
+    )
+
+    assert fetch_mock.call_count == 11
+    assert offline_client._browser.new_page.call_count == 2
+    assert len(res) == 8
+    assert len({payment.payment_number for payment in res}) == 8
+
+
+async def test_backfill_income_payments_unauthorized(offline_client: AvangardApi, mocker):
+    mocker.patch.object(offline_client, '_fetch_statement', side_effect=UnauthorizedError('Unauthorized'))
+
+    with pytest.raises(UnauthorizedError):
+        await offline_client.backfill_income_payments(
+            datetime.date(year=2020, month=1, day=1),
+            datetime.date(year=2020, month=1, day=31),
+            window_days=7,
+            concurrency=3,
+        )
+
+
+@pytest.mark.parametrize('start_date, end_date, window_days, expected', [
+    (datetime.date(2020, 1, 1), datetime.date(2020, 1, 1), 7, [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 1))]),
+    (datetime.date(2020, 1, 1), datetime.date(2020, 1, 10), 5, [
+        (datetime.date(2020, 1, 1), datetime.date(2020, 1, 5)),
+        (datetime.date(2020, 1, 6), datetime.date(2020, 1, 10)),
+    ]),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 1), 5, []),
+])
+def test_split_date_range(start_date, end_date, window_days, expected):
+    assert split_date_range(start_date, end_date, window_days) == expected
@@ -0,0 +1,30 @@
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from app.avangard_client import LOGIN_ERROR_XPATH, REPORTS_BUTTON_XPATH, AvangardApi
+
+
+@pytest.fixture
+def page(mocker):
+    page = mocker.MagicMock()
+    page.locator.return_value.first.wait_for = mocker.AsyncMock()
+    page.locator.return_value.count = mocker.AsyncMock(return_value=0)
+    return page
+
+
+@pytest.mark.parametrize('reports_buttons, expected', [(1, True), (0, False)])
+async def test_check_authorized(page, reports_buttons: int, expected: bool):
+    page.locator.return_value.count.return_value = reports_buttons
+
+    res = await AvangardApi('/tmp', 10)._check_authorized(page, LOGIN_ERROR_XPATH)
+
+    assert res is expected
+    assert page.locator.call_args_list[0].args == (f'{REPORTS_BUTTON_XPATH} | {LOGIN_ERROR_XPATH}',)
+    page.locator.return_value.first.wait_for.assert_awaited_once_with(state='attached', timeout=10000)
+
+
+async def test_check_authorized_timeout(page):
+    page.locator.return_value.first.wait_for.side_effect = PlaywrightTimeout('timeout')
+
+    assert await AvangardApi('/tmp', 10)._check_authorized(page) is False
+    assert not page.locator.return_value.count.called
@@ -0,0 +1,49 @@
+import datetime
+import time
+
+import pytest
+
+from app.avangard_client import AvangardApi
+from benchmarks.fake_bank import REPORTS_PATH, FakeBank
+from benchmarks.statement_generator import count_expected_payments
+from tests.utils import chromium_installed
+
+pytestmark = pytest.mark.skipif(not chromium_installed(), reason='requires installed playwright chromium')
+
+
+@pytest.fixture
+async def bank_client(tmp_path) -> tuple[AvangardApi, FakeBank]:
+    with FakeBank(rows=30) as bank:
+        client = AvangardApi(
+            str(tmp_path),
+            10,
+            fast_fetch=True,
+            login_page=bank.login_page,
+            main_page=bank.main_page,
+        )
+        await client.setup_browser()
+        yield client, bank
+        await client.terminate()
+
+
+async def test_sync_cycles_against_fake_bank(bank_client):
+    client, bank = bank_client
+    start_date = datetime.date(2020, 1, 1)
+
+    assert await client.login('login', 'password')
+    for _ in range(2):
+        payments = await client.get_income_payments(start_date, datetime.date(2020, 1, 31))
+        assert len(payments) == count_expected_payments(30, seed=start_date.toordinal())
+
+    # second cycle replays statement form without rendering reports page
+    assert bank.requests.count(('GET', REPORTS_PATH)) == 1
+    assert bank.requests.count(('POST', REPORTS_PATH)) == 2
+
+
+async def test_login_failed_against_fake_bank(bank_client):
+    client, _ = bank_client
+    started_at = time.perf_counter()
+
+    assert not await client.login('login', 'invalid')
+    # detected by error message, not by timeout
+    assert time.perf_counter() - started_at < 5
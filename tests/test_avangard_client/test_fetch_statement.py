@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+
+from app.avangard_client import AvangardApi
+from app.statement_form import StatementForm
+from tests.utils import read_page
+
+START_DATE = datetime.date(year=2020, month=1, day=1)
+END_DATE = datetime.date(year=2020, month=1, day=31)
+
+
+@pytest.fixture
+def fast_client(mocker) -> AvangardApi:
+    client = AvangardApi('/tmp', 10, fast_fetch=True)
+    client._statement_form = StatementForm(action='https://corp.avangard.ru/docs_list.jspx', fields={'source': 'id'})
+    mocker.patch.object(client, '_render_statement', return_value=read_page('payments_not_found_page'))
+    return client
+
+
+async def test_fetch_statement_fast_path(fast_client: AvangardApi, mocker):
+    post_mock = mocker.patch.object(fast_client, '_post_form', return_value=read_page('full_payments_page'))
+
+    res = await fast_client._fetch_statement(mocker.Mock(), START_DATE, END_DATE)
+
+    assert res == read_page('full_payments_page')
+    assert post_mock.call_args.args[1]['docslist:main:startdate'] == '01.01.2020'
+    assert not fast_client._render_statement.called
+    assert fast_client._statement_form
+
+
+async def test_fetch_statement_fast_path_fallback(fast_client: AvangardApi, mocker):
+    mocker.patch.object(fast_client, '_post_form', return_value='<html>Session expired</html>')
+
+    res = await fast_client._fetch_statement(mocker.Mock(), START_DATE, END_DATE)
+
+    assert res == read_page('payments_not_found_page')
+    assert fast_client._render_statement.called
+    assert fast_client._statement_form is None
+
+
+async def test_fetch_statement_fast_path_reports_page_fallback(fast_client: AvangardApi, mocker):
+    mocker.patch.object(fast_client, '_post_form', return_value=read_page('reports_page'))
+
+    res = await fast_client._fetch_statement(mocker.Mock(), START_DATE, END_DATE)
+
+    assert res == read_page('payments_not_found_page')
+    assert fast_client._render_statement.called
+    assert fast_client._statement_form is None
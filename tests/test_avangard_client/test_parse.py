@@ -0,0 +1,39 @@
+import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from app.avangard_client import AvangardApi
+from app.page_archive import PageArchive
+from tests.utils import read_page
+
+
+@pytest.mark.parametrize('executor_class', [None, ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_parse_executor(executor_class):
+    html_source = read_page('full_payments_page')
+    executor = executor_class(max_workers=1) if executor_class else None
+    client = AvangardApi('/tmp', 10, parse_executor=executor)
+
+    res = await client._parse(html_source)
+
+    if executor:
+        executor.shutdown()
+    assert len(res) == 8
+    assert res[0].description.startswith('Оплата')
+    assert client.parse_stats['calls'] == 1
+    assert client.parse_stats['bytes'] == len(html_source)
+    assert client.parse_stats['seconds'] > 0
+
+
+async def test_parse_window_unchanged_statement(tmp_path):
+    window = (datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+    html_source = read_page('full_payments_page')
+    client = AvangardApi('/tmp', 10, page_archive=PageArchive(str(tmp_path)))
+
+    first = await client._parse_window(window, html_source)
+    second = await client._parse_window(window, html_source.replace('STATE_TOKEN" value="', 'STATE_TOKEN" value="1'))
+    other_window = await client._parse_window((window[0], window[0]), html_source)
+
+    assert len(first) == len(second) == len(other_window) == 8
+    assert second == first
+    assert client.parse_stats['calls'] == 2
@@ -0,0 +1,40 @@
+import pytest
+
+from app.avangard_client import AvangardApi
+from app.browser_state import StateVault
+
+
+@pytest.fixture
+def vault_client(tmp_path, mocker) -> AvangardApi:
+    client = AvangardApi('/tmp', 10, state_vault=StateVault(str(tmp_path / 'default.state'), 'secret'))
+    client._initialized = True
+    client._browser = mocker.AsyncMock()
+    client._browser.storage_state.return_value = {'cookies': [], 'origins': []}
+    return client
+
+
+async def test_login_restored_session(vault_client: AvangardApi, mocker):
+    vault_client._state_restored = True
+    mocker.patch.object(vault_client, '_check_authorized', return_value=True)
+    submit_mock = mocker.patch.object(vault_client, '_submit_login_form')
+
+    assert await vault_client.login('login', 'password')
+    assert vault_client.authorized
+    assert not submit_mock.called
+
+
+async def test_login_restored_session_expired(vault_client: AvangardApi, mocker):
+    vault_client._state_restored = True
+    mocker.patch.object(vault_client, '_check_authorized', return_value=False)
+    submit_mock = mocker.patch.object(vault_client, '_submit_login_form', return_value=True)
+
+    assert await vault_client.login('login', 'password')
+    assert submit_mock.call_count == 1
+    assert vault_client._state_vault.load() == {'cookies': [], 'origins': []}
+
+
+async def test_login_failed_keeps_no_state(vault_client: AvangardApi, mocker):
+    mocker.patch.object(vault_client, '_submit_login_form', return_value=False)
+
+    assert not await vault_client.login('login', 'password')
+    assert vault_client._state_vault.load() is None
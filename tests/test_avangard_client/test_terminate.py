@@ -0,0 +1,34 @@
+import asyncio
+
+from app.avangard_client import AvangardApi
+
+
+async def test_terminate_after_failed_close(mocker):
+    client = AvangardApi('/tmp', 10)
+    browser = client._browser = mocker.AsyncMock()
+    browser.close.side_effect = RuntimeError('browser has been closed')
+    wrapper = client._playwright_wrapper = mocker.AsyncMock()
+    kill_mock = mocker.patch('app.avangard_client.kill_process_tree')
+
+    await client.terminate()
+
+    wrapper.stop.assert_awaited_once()
+    assert client._browser is None
+    assert not kill_mock.called
+
+
+async def test_terminate_hung_browser(mocker):
+    async def hang():
+        await asyncio.sleep(10)
+
+    client = AvangardApi('/tmp', 10)
+    client._browser = mocker.AsyncMock()
+    client._browser.close.side_effect = hang
+    mocker.patch('app.avangard_client.CLOSE_TIMEOUT_SECONDS', 0.01)
+    mocker.patch('app.avangard_client.find_marked_pids', return_value={123})
+    kill_mock = mocker.patch('app.avangard_client.kill_process_tree', return_value={123, 124})
+
+    await client.terminate()
+
+    kill_mock.assert_awaited_once_with({123})
+    assert client._browser is None
@@ -0,0 +1,13 @@
+import pytest
+
+from tests.utils import read_page
+
+
+@pytest.fixture
+def full_payments_page() -> str:
+    return read_page('full_payments_page')
+
+
+@pytest.fixture
+def payments_not_found_page() -> str:
+    return read_page('payments_not_found_page')
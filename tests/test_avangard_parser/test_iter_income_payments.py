@@ -0,0 +1,31 @@
+import io
+
+import pytest
+
+from app.avangard_parser import iter_income_payments, parse_income_payments
+
+
+@pytest.mark.parametrize('as_source', [
+    lambda page: page,
+    lambda page: page.encode(),
+    lambda page: io.BytesIO(page.encode()),
+    lambda page: io.StringIO(page),
+    lambda page: (page[offset:offset + 100] for offset in range(0, len(page), 100)),
+])
+def test_iter_income_payments_happy_path(full_payments_page: str, as_source):
+    res = list(iter_income_payments(as_source(full_payments_page)))
+
+    assert len(res) == 8
+    assert res == parse_income_payments(full_payments_page)
+
+
+def test_iter_income_payments_not_found(payments_not_found_page: str):
+    res = list(iter_income_payments(payments_not_found_page))
+
+    assert res == []
+
+
+def test_iter_income_payments_empty():
+    res = list(iter_income_payments(''))
+
+    assert res == []
@@ -3,81 +3,13 @@ from decimal import Decimal
 
 import pytest
 
-from app.avangard_parser import parse_income_payments, _parse_invoice_number, _parse_agent_inn
-
-
-@pytest.fixture
-def full_payments_page() -> str:
-    return """<form id="form" name="form" style="margin:0px" onkeypress="return _submitOnEnter(event,'form');" method="POST" action="/clbAvn/faces/facelet-pages/con_acc_stat_v.jspx"><table cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr><td>
-                        <div style="position:absolute;left:961px;margin-top:20px;background-color: #e6e7e9; border: solid 1px #a5a8aa; width: 160px;vertical-align:middle;"><a onclick="submitForm('form',1,{source:'form:_id213'});return false;" onmouseover="this.style.cursor='pointer'" class="xl" style="vertical-align:middle;text-decoration:none;color:black;" href="#"><span style="font-size:8.0pt;padding-left: 4px; padding-right:20px;vertical-align:middle;">Сохранить документы</span><img title="Сохранить документы" alt="Сохранить документы" style="border-width:0px;" src="/clbAvn/images/ico_pdf_24.gif" border="0" height="15" width="15"></a>
-                        </div></td></tr></tbody></table>
-                <br>
-                <div class="pageTitle">
-                    Выписка консолидированная
-                </div><div style="margin-top:10px"></div>
-            <div class="panelFull panelDark" style="">
-                    <div style="float: right; vertical-align:middle;"><a href="#" onclick="submitForm('form',1,{source:'form:_id390'});return false;"><img src="/clbAvn/adf/images/cache/ru/cd070b5dQ-1.gif" title="Назад" alt="Назад" border="0" align="absmiddle" width="54" height="16"></a>
-                    </div><span style="font-weight:bold;">ПАО АКБ Авангард</span>
-                    <br><div style="margin-top:20px"></div>
-                    <div style="float: right; vertical-align:middle;text-align:right;">Входящий остаток:<img src="/clbAvn/adf/images/t.gif" alt="" width="5" height="1"><span style="font-weight: bold;">44 892.63</span>
-
-                        <br>Исходящий остаток:<img src="/clbAvn/adf/images/t.gif" alt="" width="5" height="1"><span style="font-weight: bold;">17 999.68</span><div style="margin-top:15px"></div><table id="form:selSort__xc_" cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr><td class="xe" valign="middle" nowrap=""><span class="xc"><label for="form:selSort">Сортировать по</label></span></td><td width="12"><img src="/clbAvn/adf/images/t.gif" alt="" width="12"></td><td valign="middle" nowrap=""><script>var _pprUpdateMode=false;function _adfspu(f,v,e,s,o){_pprUpdateMode=true;if(!o)o=new Object();o.event=(e)?e:'update';if(s)o.source=s;_submitPartialChange(f,v,o);}</script><select id="form:selSort" name="form:selSort" onchange="_adfspu('form',1,'form:selSort','form:selSort');return true;" class="x6"><option value="0">счету, дате, сумме</option><option value="1">счету, убывающей дате, сумме</option><option value="2" selected="">дате, сумме</option><option value="3">дате, возрастающей сумме</option><option value="4">убывающей дате, сумме</option><option value="5">контрагенту, дате, сумме</option><option value="6">контрагенту, убывающей дате, сумме</option></select></td></tr></tbody></table>
-                    </div>Консолидированная выписка по счетам:
-                    <br>
-                    <table cellspacing="0" cellpadding="0">
-                            <tbody><tr>
-                                <td><span style="font-weight:bold">40702 810 0 0620 0028227</span>
-                                </td>
-                                <td style="width:350px;"><span style="padding-right:5px;padding-left:5px;font-weight:bold">ООО "ДАКРА"</span>
-                                </td>
-                                <td>
-                                </td>
-                            </tr>
-                    </tbody></table><div style="margin-top:20px"></div><table cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr><td>С</td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td><span style="font-weight: bold;">01.01.2020</span></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td>по</td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td><span style="font-weight: bold;">31.12.2020</span></td></tr></tbody></table><table class="Error"></table>
-            </div><div style="margin-top:5px"></div>
-                <div style="padding:0px 0px 2px 0px;text-align:center;"><div id="form:_id428"><table cellpadding="0" cellspacing="0" border="0" width="100%" summary=""><tbody><tr><td><table cellpadding="0" cellspacing="0" border="0" width="100%" summary="" class="x2l"><tbody><tr><td nowrap="" valign="middle"><a class="x54" onclick="_uixt_form__id428.multiSelect(true)" href="#">Выделить все</a>&nbsp;|&nbsp;<a class="x54" onclick="_uixt_form__id428.multiSelect(false)" href="#">Отмена выбора</a><script>CollectionComponent.defineMultiSelect('_s','_sm',false);</script></td></tr></tbody></table></td></tr></tbody></table><table class="x2f" cellpadding="1" cellspacing="0" border="0" width="100%"><tbody><tr><th id="_id0" width="1%" nowrap="" class="x2z">Выбрать</th><th id="form:_id428:_id430" width="150" class="x2z x5o">Организация</th><th id="form:_id428:_id434" width="200" class="x2x x5o">Контрагент</th><th id="form:_id428:_id439" width="100" class="x2y x5o">Приход</th><th id="form:_id428:_id443" width="100" class="x2y x5o">Расход</th><th id="form:_id428:_id447" width="70" class="x2z x5o">Дата</th><th id="form:_id428:_id450" width="60" class="x2z x5o">№</th><th id="form:_id428:_id454" width="250" class="x2x x5o">Назначение платежа</th><th id="form:_id428:_id457" width="60px" class="x2z x5o"></th></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:0:_id429" title="Выбрать" type="checkbox" value="0"><input type="hidden" name="form:_id428:_us" value="0"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">27561456</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за декабрь 2019 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:0:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:1:_id429" title="Выбрать" type="checkbox" value="1"><input type="hidden" name="form:_id428:_us" value="1"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">14 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">3</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 14000.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:1:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:2:_id429" title="Выбрать" type="checkbox" value="2"><input type="hidden" name="form:_id428:_us" value="2"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Индивидуальный предприниматель Грибанов Олег Георгиевич ИНН 332707298400<div></div><span style="white-space: nowrap;">40802 810 8 1000 0013187</span><div></div>БИК 041708602 ВЛАДИМИРСКОЕ ОТДЕЛЕНИЕ N8611 ПАО СБЕРБАНК г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">14 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">1</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету, Сумма 14000, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:2:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:3:_id429" title="Выбрать" type="checkbox" value="3"><input type="hidden" name="form:_id428:_us" value="3"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ИП Зайцев Алексей Валентинович ИНН 760502274683<div></div><span style="white-space: nowrap;">40802 810 1 1068 0006915</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">13 500.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">4</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">оплата счету Сумма 13500.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:3:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:4:_id429" title="Выбрать" type="checkbox" value="4"><input type="hidden" name="form:_id428:_us" value="4"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">718.84</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">5</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 718.84, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:4:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:5:_id429" title="Выбрать" type="checkbox" value="5"><input type="hidden" name="form:_id428:_us" value="5"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">3</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:5:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:6:_id429" title="Выбрать" type="checkbox" value="6"><input type="hidden" name="form:_id428:_us" value="6"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">5</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:6:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:7:_id429" title="Выбрать" type="checkbox" value="7"><input type="hidden" name="form:_id428:_us" value="7"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">1</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:7:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:8:_id429" title="Выбрать" type="checkbox" value="8"><input type="hidden" name="form:_id428:_us" value="8"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">09.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">4</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:8:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:9:_id429" title="Выбрать" type="checkbox" value="9"><input type="hidden" name="form:_id428:_us" value="9"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 5 0620 0000003</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">50 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">52</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 1 от 20.01.2020 по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:9:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:10:_id429" title="Выбрать" type="checkbox" value="10"><input type="hidden" name="form:_id428:_us" value="10"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">АО "ТРЦ "СЕРЕБРЯНЫЙ ГОРОД" ИНН 3702230145 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0002087</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">40 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">14</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Аренда по договору 478-09/14-3Б  Сумма 40000.00, в т.ч. НДС (20.00%) - 6666.67</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:10:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:11:_id429" title="Выбрать" type="checkbox" value="11"><input type="hidden" name="form:_id428:_us" value="11"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">2 515.54</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">8</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОПС за 4 кв.2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:11:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:12:_id429" title="Выбрать" type="checkbox" value="12"><input type="hidden" name="form:_id428:_us" value="12"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">2 399.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">2</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету  Сумма 2399.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:12:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:13:_id429" title="Выбрать" type="checkbox" value="13"><input type="hidden" name="form:_id428:_us" value="13"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1 355.93</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">13</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 1355.93, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:13:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:14:_id429" title="Выбрать" type="checkbox" value="14"><input type="hidden" name="form:_id428:_us" value="14"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">974.70</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">12</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету  Сумма 974.70, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:14:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:15:_id429" title="Выбрать" type="checkbox" value="15"><input type="hidden" name="form:_id428:_us" value="15"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">743.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">7</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за декабрь 2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:15:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:16:_id429" title="Выбрать" type="checkbox" value="16"><input type="hidden" name="form:_id428:_us" value="16"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">743.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">6</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за декабрь 2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:16:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:17:_id429" title="Выбрать" type="checkbox" value="17"><input type="hidden" name="form:_id428:_us" value="17"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">583.14</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">9</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОМС за 4 кв. 2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:17:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:18:_id429" title="Выбрать" type="checkbox" value="18"><input type="hidden" name="form:_id428:_us" value="18"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">331.60</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">10</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОСС за 4кв. 2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:18:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:19:_id429" title="Выбрать" type="checkbox" value="19"><input type="hidden" name="form:_id428:_us" value="19"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">11</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 11</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:19:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:20:_id429" title="Выбрать" type="checkbox" value="20"><input type="hidden" name="form:_id428:_us" value="20"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">14</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 14</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:20:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:21:_id429" title="Выбрать" type="checkbox" value="21"><input type="hidden" name="form:_id428:_us" value="21"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">8</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 8</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:21:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:22:_id429" title="Выбрать" type="checkbox" value="22"><input type="hidden" name="form:_id428:_us" value="22"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">13</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 13</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:22:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:23:_id429" title="Выбрать" type="checkbox" value="23"><input type="hidden" name="form:_id428:_us" value="23"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">6</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 6</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:23:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:24:_id429" title="Выбрать" type="checkbox" value="24"><input type="hidden" name="form:_id428:_us" value="24"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">10</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 10</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:24:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:25:_id429" title="Выбрать" type="checkbox" value="25"><input type="hidden" name="form:_id428:_us" value="25"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">2</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 2</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:25:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:26:_id429" title="Выбрать" type="checkbox" value="26"><input type="hidden" name="form:_id428:_us" value="26"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">12</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 12</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:26:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:27:_id429" title="Выбрать" type="checkbox" value="27"><input type="hidden" name="form:_id428:_us" value="27"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">7</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 7</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:27:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:28:_id429" title="Выбрать" type="checkbox" value="28"><input type="hidden" name="form:_id428:_us" value="28"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">9</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 9</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:28:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:29:_id429" title="Выбрать" type="checkbox" value="29"><input type="hidden" name="form:_id428:_us" value="29"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">50.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">14</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N1</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:29:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:30:_id429" title="Выбрать" type="checkbox" value="30"><input type="hidden" name="form:_id428:_us" value="30"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">30.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">14</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 14 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:30:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:31:_id429" title="Выбрать" type="checkbox" value="31"><input type="hidden" name="form:_id428:_us" value="31"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">12</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:31:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:32:_id429" title="Выбрать" type="checkbox" value="32"><input type="hidden" name="form:_id428:_us" value="32"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">2</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:32:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:33:_id429" title="Выбрать" type="checkbox" value="33"><input type="hidden" name="form:_id428:_us" value="33"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">13</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:33:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:34:_id429" title="Выбрать" type="checkbox" value="34"><input type="hidden" name="form:_id428:_us" value="34"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">14</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:34:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:35:_id429" title="Выбрать" type="checkbox" value="35"><input type="hidden" name="form:_id428:_us" value="35"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">22.86</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">11</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 4кв. 2019г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:35:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:36:_id429" title="Выбрать" type="checkbox" value="36"><input type="hidden" name="form:_id428:_us" value="36"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1.89</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">8</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 8 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:36:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:37:_id429" title="Выбрать" type="checkbox" value="37"><input type="hidden" name="form:_id428:_us" value="37"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1.80</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">2</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 2 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:37:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:38:_id429" title="Выбрать" type="checkbox" value="38"><input type="hidden" name="form:_id428:_us" value="38"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1.02</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">13</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 13 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:38:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:39:_id429" title="Выбрать" type="checkbox" value="39"><input type="hidden" name="form:_id428:_us" value="39"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">0.66</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">12</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 12 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:39:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:40:_id429" title="Выбрать" type="checkbox" value="40"><input type="hidden" name="form:_id428:_us" value="40"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">0.56</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">6</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 6 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:40:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:41:_id429" title="Выбрать" type="checkbox" value="41"><input type="hidden" name="form:_id428:_us" value="41"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">0.25</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.01.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">10</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 10 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:41:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:42:_id429" title="Выбрать" type="checkbox" value="42"><input type="hidden" name="form:_id428:_us" value="42"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">27945031</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за январь 2020 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:42:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:43:_id429" title="Выбрать" type="checkbox" value="43"><input type="hidden" name="form:_id428:_us" value="43"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "СОРТЕКС-УЮТ" ИНН 7713264418 КПП 500101001<div></div><span style="white-space: nowrap;">40702 810 4 0289 0001375</span><div></div>БИК 044525593 АО "АЛЬФА-БАНК", г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">9 968.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">03.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">63</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету №1110 от 02.12.2019 за визовую поддержку Германия. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:43:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:43:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:44:_id429" title="Выбрать" type="checkbox" value="44"><input type="hidden" name="form:_id428:_us" value="44"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 1 0620 0000005</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">80 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">11</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 3 от 05.02.2020. по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:44:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:45:_id429" title="Выбрать" type="checkbox" value="45"><input type="hidden" name="form:_id428:_us" value="45"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 1 0620 0000005</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">12</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 5 от 05.02.2020. по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:45:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:46:_id429" title="Выбрать" type="checkbox" value="46"><input type="hidden" name="form:_id428:_us" value="46"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ГРИНВИЧ" ИНН 7707421824 КПП 770701001<div></div><span style="white-space: nowrap;">40702 810 4 0110 0016349</span><div></div>БИК 044525593 АО "АЛЬФА-БАНК" г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">71 569.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">23</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету 514370239-1 Сумма 71569.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:46:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:47:_id429" title="Выбрать" type="checkbox" value="47"><input type="hidden" name="form:_id428:_us" value="47"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Индивидуальный предприниматель Грибанов Олег Георгиевич ИНН 332707298400<div></div><span style="white-space: nowrap;">40802 810 8 1000 0013187</span><div></div>БИК 041708602 ВЛАДИМИРСКОЕ ОТДЕЛЕНИЕ N8611 ПАО СБЕРБАНК г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">14 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">19</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету, Сумма 14000, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:47:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:48:_id429" title="Выбрать" type="checkbox" value="48"><input type="hidden" name="form:_id428:_us" value="48"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">9 043.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">20</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 9043.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:48:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:49:_id429" title="Выбрать" type="checkbox" value="49"><input type="hidden" name="form:_id428:_us" value="49"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">7 078.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">16</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету  Сумма 7078.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:49:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:50:_id429" title="Выбрать" type="checkbox" value="50"><input type="hidden" name="form:_id428:_us" value="50"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">2 993.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">17</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 2993.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:50:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:51:_id429" title="Выбрать" type="checkbox" value="51"><input type="hidden" name="form:_id428:_us" value="51"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">АО "ТРЦ "СЕРЕБРЯНЫЙ ГОРОД" ИНН 3702230145 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0002087</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">15</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Аренда по договору 478-09/14-3Б  Сумма 1000.00, в т.ч. НДС (20.00%) - 166.67</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:51:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:52:_id429" title="Выбрать" type="checkbox" value="52"><input type="hidden" name="form:_id428:_us" value="52"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">830.53</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">22</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 830.53, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:52:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:53:_id429" title="Выбрать" type="checkbox" value="53"><input type="hidden" name="form:_id428:_us" value="53"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">80.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">23</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N3</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:53:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:54:_id429" title="Выбрать" type="checkbox" value="54"><input type="hidden" name="form:_id428:_us" value="54"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">53.68</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">23</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 23 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:54:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:55:_id429" title="Выбрать" type="checkbox" value="55"><input type="hidden" name="form:_id428:_us" value="55"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">23</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N5</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:55:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:56:_id429" title="Выбрать" type="checkbox" value="56"><input type="hidden" name="form:_id428:_us" value="56"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">17</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:56:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:57:_id429" title="Выбрать" type="checkbox" value="57"><input type="hidden" name="form:_id428:_us" value="57"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">19</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:57:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:58:_id429" title="Выбрать" type="checkbox" value="58"><input type="hidden" name="form:_id428:_us" value="58"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">16</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:58:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:59:_id429" title="Выбрать" type="checkbox" value="59"><input type="hidden" name="form:_id428:_us" value="59"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">22</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:59:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:60:_id429" title="Выбрать" type="checkbox" value="60"><input type="hidden" name="form:_id428:_us" value="60"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">15</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:60:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:61:_id429" title="Выбрать" type="checkbox" value="61"><input type="hidden" name="form:_id428:_us" value="61"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">20</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:61:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:62:_id429" title="Выбрать" type="checkbox" value="62"><input type="hidden" name="form:_id428:_us" value="62"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">23</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:62:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:63:_id429" title="Выбрать" type="checkbox" value="63"><input type="hidden" name="form:_id428:_us" value="63"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">19</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 19 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:63:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:64:_id429" title="Выбрать" type="checkbox" value="64"><input type="hidden" name="form:_id428:_us" value="64"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">5.31</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">16</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 16 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:64:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:65:_id429" title="Выбрать" type="checkbox" value="65"><input type="hidden" name="form:_id428:_us" value="65"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1.44</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">17</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 17 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:65:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:66:_id429" title="Выбрать" type="checkbox" value="66"><input type="hidden" name="form:_id428:_us" value="66"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">0.75</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">15</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 15 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:66:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:67:_id429" title="Выбрать" type="checkbox" value="67"><input type="hidden" name="form:_id428:_us" value="67"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">0.62</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">05.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">22</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 22 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:67:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:68:_id429" title="Выбрать" type="checkbox" value="68"><input type="hidden" name="form:_id428:_us" value="68"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ЗЕТТА СТРАХОВАНИЕ" ИНН 7710280644<div></div><span style="white-space: nowrap;">40701 810 0 0004 0000063</span><div></div>БИК 044525187 БАНК ВТБ (ПАО), г. Москва</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 676.29</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">07.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">18087</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">ВОЗНАГРАЖДЕНИЕ ПО ДОГОВОРУ №АГД-370-026332/14 СОГЛАСНО АКТА АВРР-370-2145504/20С УММА 1676-29БЕЗ НАЛОГА (НДС)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:68:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:68:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:69:_id429" title="Выбрать" type="checkbox" value="69"><input type="hidden" name="form:_id428:_us" value="69"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО АРСЕНАЛ-УРАЛ ИНН 3702067403 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 5 0751 0002187</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО), г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">229</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">По счету №1122 от 13.02.20 визовая поддержка США, без налога (НДС).</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:69:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:69:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:70:_id429" title="Выбрать" type="checkbox" value="70"><input type="hidden" name="form:_id428:_us" value="70"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">2 750.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">27</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОПС за 1 кв.2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:70:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:71:_id429" title="Выбрать" type="checkbox" value="71"><input type="hidden" name="form:_id428:_us" value="71"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">29</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за январь 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:71:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:72:_id429" title="Выбрать" type="checkbox" value="72"><input type="hidden" name="form:_id428:_us" value="72"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">28</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за январь 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:72:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:73:_id429" title="Выбрать" type="checkbox" value="73"><input type="hidden" name="form:_id428:_us" value="73"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">637.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">26</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОМС за 1 кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:73:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:74:_id429" title="Выбрать" type="checkbox" value="74"><input type="hidden" name="form:_id428:_us" value="74"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">362.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">25</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОСС за 1кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:74:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:75:_id429" title="Выбрать" type="checkbox" value="75"><input type="hidden" name="form:_id428:_us" value="75"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">24</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 1кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:75:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:76:_id429" title="Выбрать" type="checkbox" value="76"><input type="hidden" name="form:_id428:_us" value="76"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ИНТЕР" ИНН 3702223420 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 0751 0001546</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО), г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">8 400.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">19.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">79</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету №1123 от 18.02.2020 за услуги Без НДС</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:76:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:76:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:77:_id429" title="Выбрать" type="checkbox" value="77"><input type="hidden" name="form:_id428:_us" value="77"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "ИНТЕР" ИНН 3702223420 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 0751 0001546</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО), г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1 296.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">19.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">82</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету №1124 от 18.02.2020 за услуги Без НДС</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:77:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:77:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:78:_id429" title="Выбрать" type="checkbox" value="78"><input type="hidden" name="form:_id428:_us" value="78"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 8 0620 0000004</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">60 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">21.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">15</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 6 от 21.02.2020. по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:78:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:79:_id429" title="Выбрать" type="checkbox" value="79"><input type="hidden" name="form:_id428:_us" value="79"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 8 0620 0000004</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">21.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">16</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 7 от 21.02.2020. по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:79:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:80:_id429" title="Выбрать" type="checkbox" value="80"><input type="hidden" name="form:_id428:_us" value="80"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">60.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">21.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">31</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N6</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:80:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:81:_id429" title="Выбрать" type="checkbox" value="81"><input type="hidden" name="form:_id428:_us" value="81"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">21.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">31</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N7</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:81:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:82:_id429" title="Выбрать" type="checkbox" value="82"><input type="hidden" name="form:_id428:_us" value="82"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ТЕХНОСИСТЕМ" ИНН 7704483526 КПП 770401001<div></div><span style="white-space: nowrap;">40702 810 8 1009 0004232</span><div></div>БИК 044525922 АО "БАНК ИНТЕЗА" г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">66 227.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">31</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 66227.00, в т.ч. НДС (20.00%) - 8148</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:82:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:83:_id429" title="Выбрать" type="checkbox" value="83"><input type="hidden" name="form:_id428:_us" value="83"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ИП Зайцев Алексей Валентинович ИНН 760502274683<div></div><span style="white-space: nowrap;">40802 810 1 1068 0006915</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">13 500.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">32</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">оплата счету Сумма 13500.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:83:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:84:_id429" title="Выбрать" type="checkbox" value="84"><input type="hidden" name="form:_id428:_us" value="84"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">3 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">33</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 3000, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:84:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:85:_id429" title="Выбрать" type="checkbox" value="85"><input type="hidden" name="form:_id428:_us" value="85"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">31</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:85:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:86:_id429" title="Выбрать" type="checkbox" value="86"><input type="hidden" name="form:_id428:_us" value="86"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">33</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:86:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:87:_id429" title="Выбрать" type="checkbox" value="87"><input type="hidden" name="form:_id428:_us" value="87"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">26.02.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">32</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:87:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:88:_id429" title="Выбрать" type="checkbox" value="88"><input type="hidden" name="form:_id428:_us" value="88"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">28326644</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за февраль 2020 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:88:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:89:_id429" title="Выбрать" type="checkbox" value="89"><input type="hidden" name="form:_id428:_us" value="89"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "ЦЕНТРРЕГИОНСЕРВИС" ИНН 7616008465 КПП 761601001<div></div><span style="white-space: nowrap;">40702 810 9 0200 0063245</span><div></div>БИК 047888760 ЯРОСЛАВСКИЙ Ф-Л ПАО "ПРОМСВЯЗЬБАНК" г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">04.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">34</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 10000.00, в т.ч. НДС (20.00%) - 1666.67</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:89:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:90:_id429" title="Выбрать" type="checkbox" value="90"><input type="hidden" name="form:_id428:_us" value="90"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">04.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">34</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:90:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:91:_id429" title="Выбрать" type="checkbox" value="91"><input type="hidden" name="form:_id428:_us" value="91"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 5 0620 0000003</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">106 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">9</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 8 от 10.03.2020 по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:91:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:92:_id429" title="Выбрать" type="checkbox" value="92"><input type="hidden" name="form:_id428:_us" value="92"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ГРИНВИЧ" ИНН 7707421824 КПП 770701001<div></div><span style="white-space: nowrap;">40702 810 4 0110 0016349</span><div></div>БИК 044525593 АО "АЛЬФА-БАНК" г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">85 689.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">35</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету  Сумма 85689.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:92:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:93:_id429" title="Выбрать" type="checkbox" value="93"><input type="hidden" name="form:_id428:_us" value="93"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ИП Зайцев Алексей Валентинович ИНН 760502274683<div></div><span style="white-space: nowrap;">40802 810 1 1068 0006915</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">13 500.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">37</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">оплата счету Сумма 13500.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:93:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:94:_id429" title="Выбрать" type="checkbox" value="94"><input type="hidden" name="form:_id428:_us" value="94"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "АРТ ИНВЕСТ" ИНН 3328422023 КПП 332801001<div></div><span style="white-space: nowrap;">40702 810 9 0026 0004641</span><div></div>БИК 044525600 ПАО "МИНБАНК" г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">36</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">оплата по счету Сумма 1000.00, в т.ч. НДС (20.00%) - 166.67</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:94:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:95:_id429" title="Выбрать" type="checkbox" value="95"><input type="hidden" name="form:_id428:_us" value="95"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">64.27</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">35</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 35 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:95:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:96:_id429" title="Выбрать" type="checkbox" value="96"><input type="hidden" name="form:_id428:_us" value="96"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">36</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:96:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:97:_id429" title="Выбрать" type="checkbox" value="97"><input type="hidden" name="form:_id428:_us" value="97"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">35</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:97:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:98:_id429" title="Выбрать" type="checkbox" value="98"><input type="hidden" name="form:_id428:_us" value="98"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">37</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:98:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:99:_id429" title="Выбрать" type="checkbox" value="99"><input type="hidden" name="form:_id428:_us" value="99"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10.13</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">37</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 37 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:99:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:100:_id429" title="Выбрать" type="checkbox" value="100"><input type="hidden" name="form:_id428:_us" value="100"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">0.42</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">11.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">36</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 36 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:100:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:101:_id429" title="Выбрать" type="checkbox" value="101"><input type="hidden" name="form:_id428:_us" value="101"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">2 750.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">38</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОПС за 1 кв.2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:101:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:102:_id429" title="Выбрать" type="checkbox" value="102"><input type="hidden" name="form:_id428:_us" value="102"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">43</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за февраль 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:102:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:103:_id429" title="Выбрать" type="checkbox" value="103"><input type="hidden" name="form:_id428:_us" value="103"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">42</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за февраль 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:103:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:104:_id429" title="Выбрать" type="checkbox" value="104"><input type="hidden" name="form:_id428:_us" value="104"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">637.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">39</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОМС за 1 кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:104:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:105:_id429" title="Выбрать" type="checkbox" value="105"><input type="hidden" name="form:_id428:_us" value="105"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">362.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">40</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОСС за 1кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:105:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:106:_id429" title="Выбрать" type="checkbox" value="106"><input type="hidden" name="form:_id428:_us" value="106"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">13.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">41</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 1кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:106:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:107:_id429" title="Выбрать" type="checkbox" value="107"><input type="hidden" name="form:_id428:_us" value="107"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">20202 810 8 0620 0000004</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">30 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">52</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Заявка на внесение наличных N 9 от 17.03.2020 по кэш-карте N6273690500500900</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:107:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:108:_id429" title="Выбрать" type="checkbox" value="108"><input type="hidden" name="form:_id428:_us" value="108"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Индивидуальный предприниматель Грибанов Олег Георгиевич ИНН 332707298400<div></div><span style="white-space: nowrap;">40802 810 8 1000 0013187</span><div></div>БИК 041708602 ВЛАДИМИРСКОЕ ОТДЕЛЕНИЕ N8611 ПАО СБЕРБАНК г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">14 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">45</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету, Сумма 14000, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:108:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:109:_id429" title="Выбрать" type="checkbox" value="109"><input type="hidden" name="form:_id428:_us" value="109"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">44</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 12000.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:109:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:110:_id429" title="Выбрать" type="checkbox" value="110"><input type="hidden" name="form:_id428:_us" value="110"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 741.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">46</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 1741 НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:110:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:111:_id429" title="Выбрать" type="checkbox" value="111"><input type="hidden" name="form:_id428:_us" value="111"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">44</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 44</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:111:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:112:_id429" title="Выбрать" type="checkbox" value="112"><input type="hidden" name="form:_id428:_us" value="112"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">46</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 46</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:112:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:113:_id429" title="Выбрать" type="checkbox" value="113"><input type="hidden" name="form:_id428:_us" value="113"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">45</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 45</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:113:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:114:_id429" title="Выбрать" type="checkbox" value="114"><input type="hidden" name="form:_id428:_us" value="114"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0000 2720241</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">30.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">44</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за прием наличных средств по заявке N9</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:114:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:115:_id429" title="Выбрать" type="checkbox" value="115"><input type="hidden" name="form:_id428:_us" value="115"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">44</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:115:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:116:_id429" title="Выбрать" type="checkbox" value="116"><input type="hidden" name="form:_id428:_us" value="116"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">45</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:116:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:117:_id429" title="Выбрать" type="checkbox" value="117"><input type="hidden" name="form:_id428:_us" value="117"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">46</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:117:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:118:_id429" title="Выбрать" type="checkbox" value="118"><input type="hidden" name="form:_id428:_us" value="118"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">10.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">45</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 45 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:118:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:119:_id429" title="Выбрать" type="checkbox" value="119"><input type="hidden" name="form:_id428:_us" value="119"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">8.47</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">44</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 44 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:119:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:120:_id429" title="Выбрать" type="checkbox" value="120"><input type="hidden" name="form:_id428:_us" value="120"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 4 0620 2740203</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1.31</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.03.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">46</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия по п/п N 46 за пользование платными средствами</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:120:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:121:_id429" title="Выбрать" type="checkbox" value="121"><input type="hidden" name="form:_id428:_us" value="121"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.04.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">28702578</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за март 2020 г.</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:121:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:122:_id429" title="Выбрать" type="checkbox" value="122"><input type="hidden" name="form:_id428:_us" value="122"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Индивидуальный предприниматель Панюшкин Юрий Александрович ИНН 372001389851 КПП 0<div></div><span style="white-space: nowrap;">40802 810 6 0850 0008340</span><div></div>БИК 044525999 ТОЧКА ПАО БАНКА "ФК ОТКРЫТИЕ", г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">3 088.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">06.04.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">1</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Перевод по договору займа без НДС</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:122:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:122:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:123:_id429" title="Выбрать" type="checkbox" value="123"><input type="hidden" name="form:_id428:_us" value="123"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">3 088.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">22.04.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">49</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 3088.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:123:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:124:_id429" title="Выбрать" type="checkbox" value="124"><input type="hidden" name="form:_id428:_us" value="124"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">22.04.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">49</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:124:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:125:_id429" title="Выбрать" type="checkbox" value="125"><input type="hidden" name="form:_id428:_us" value="125"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">29068846</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за апрель 2020 г.</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:125:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:126:_id429" title="Выбрать" type="checkbox" value="126"><input type="hidden" name="form:_id428:_us" value="126"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Индивидуальный предприниматель Панюшкин Юрий Александрович ИНН 372001389851 КПП 0<div></div><span style="white-space: nowrap;">40802 810 6 0850 0008340</span><div></div>БИК 044525999 ТОЧКА ПАО БАНКА "ФК ОТКРЫТИЕ", г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 980.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">12.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">2</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Перевод по договору займа без НДС</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:126:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:126:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:127:_id429" title="Выбрать" type="checkbox" value="127"><input type="hidden" name="form:_id428:_us" value="127"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1 980.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">52</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 1980.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:127:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:128:_id429" title="Выбрать" type="checkbox" value="128"><input type="hidden" name="form:_id428:_us" value="128"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 1 0000 2740204</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">75.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">14.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">52</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за  продление времени приема текущей датой п/п N 52</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:128:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:129:_id429" title="Выбрать" type="checkbox" value="129"><input type="hidden" name="form:_id428:_us" value="129"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">52</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:129:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:130:_id429" title="Выбрать" type="checkbox" value="130"><input type="hidden" name="form:_id428:_us" value="130"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Межрегиональное операционное УФК (КАЗНАЧЕЙСТВО РОССИИ) ИНН 7707083893<div></div><span style="white-space: nowrap;">47422 810 0 0000 9999900</span><div></div>БИК 044525225 ПАО СБЕРБАНК, г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">36 390.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.05.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">486364</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Государственная субсидия по поручению Президента России (постановление Правительства от 24.04.20 №576) по реестру №160 от 19.05.20)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:130:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:131:_id429" title="Выбрать" type="checkbox" value="131"><input type="hidden" name="form:_id428:_us" value="131"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">29391498</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за май 2020 г.</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:131:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:132:_id429" title="Выбрать" type="checkbox" value="132"><input type="hidden" name="form:_id428:_us" value="132"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ЗЕТТА СТРАХОВАНИЕ" ИНН 7710280644<div></div><span style="white-space: nowrap;">40701 810 0 0004 0000063</span><div></div>БИК 044525187 БАНК ВТБ (ПАО), г. Москва</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">11 142.13</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">03.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">76150</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">ВОЗНАГРАЖДЕНИЕ ПО ДОГОВОРУ №АГД-370-026332/14 СОГЛАСНО АКТА АВРР-370-2314722/20С УММА 11142-13БЕЗ НАЛОГА (НДС)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:132:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:132:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:133:_id429" title="Выбрать" type="checkbox" value="133"><input type="hidden" name="form:_id428:_us" value="133"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">АО "ТРЦ "СЕРЕБРЯНЫЙ ГОРОД" ИНН 3702230145 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0002087</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">10 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">54</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Аренда по договору 478-09/14-3Б с учетом перерасчета Сумма 10000.00, в т.ч. НДС (20.00%) - 1666.67</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:133:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:134:_id429" title="Выбрать" type="checkbox" value="134"><input type="hidden" name="form:_id428:_us" value="134"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 852.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">53</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету 54 Сумма 1852.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:134:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:135:_id429" title="Выбрать" type="checkbox" value="135"><input type="hidden" name="form:_id428:_us" value="135"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">48</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за март 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:135:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:136:_id429" title="Выбрать" type="checkbox" value="136"><input type="hidden" name="form:_id428:_us" value="136"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">47</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за март 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:136:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:137:_id429" title="Выбрать" type="checkbox" value="137"><input type="hidden" name="form:_id428:_us" value="137"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">51</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за апрель 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:137:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:138:_id429" title="Выбрать" type="checkbox" value="138"><input type="hidden" name="form:_id428:_us" value="138"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">50</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за апрель 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:138:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:139:_id429" title="Выбрать" type="checkbox" value="139"><input type="hidden" name="form:_id428:_us" value="139"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">53</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:139:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:140:_id429" title="Выбрать" type="checkbox" value="140"><input type="hidden" name="form:_id428:_us" value="140"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">54</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:140:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:141:_id429" title="Выбрать" type="checkbox" value="141"><input type="hidden" name="form:_id428:_us" value="141"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">Межрегиональное операционное УФК (КАЗНАЧЕЙСТВО РОССИИ) ИНН 7707083893<div></div><span style="white-space: nowrap;">47422 810 0 0000 9999900</span><div></div>БИК 044525225 ПАО СБЕРБАНК, г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">36 390.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">11.06.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">653364</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Государственная субсидия по поручению Президента России (постановление Правительства от 24.04.20 №576) по реестру №180 от 10.06.20)</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:141:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:142:_id429" title="Выбрать" type="checkbox" value="142"><input type="hidden" name="form:_id428:_us" value="142"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">29698330</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за июнь 2020 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:142:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:143:_id429" title="Выбрать" type="checkbox" value="143"><input type="hidden" name="form:_id428:_us" value="143"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ИП Зайцев Алексей Валентинович ИНН 760502274683<div></div><span style="white-space: nowrap;">40802 810 1 1068 0006915</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">27 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">60</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">оплата по счету за апрель, май, июнь Сумма 27000.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:143:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:144:_id429" title="Выбрать" type="checkbox" value="144"><input type="hidden" name="form:_id428:_us" value="144"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 783.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">58</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету 64 от 30 июня 2020 Сумма 1783.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:144:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:145:_id429" title="Выбрать" type="checkbox" value="145"><input type="hidden" name="form:_id428:_us" value="145"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Матадор" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 5 1068 0007313</span><div></div>БИК 042007855 ФИЛИАЛ N 3652 БАНКА ВТБ (ПАО) г. ВОРОНЕЖ</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">959.54</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">59</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 959.54, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:145:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:146:_id429" title="Выбрать" type="checkbox" value="146"><input type="hidden" name="form:_id428:_us" value="146"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">59</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:146:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:147:_id429" title="Выбрать" type="checkbox" value="147"><input type="hidden" name="form:_id428:_us" value="147"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">60</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:147:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:148:_id429" title="Выбрать" type="checkbox" value="148"><input type="hidden" name="form:_id428:_us" value="148"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">58</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:148:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:149:_id429" title="Выбрать" type="checkbox" value="149"><input type="hidden" name="form:_id428:_us" value="149"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">11 959.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">67</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Налог по УСНО 6% за 2019 года.   Сумма 11959.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:149:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:150:_id429" title="Выбрать" type="checkbox" value="150"><input type="hidden" name="form:_id428:_us" value="150"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 783.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">61</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету 64 от 30 июня 2020 Сумма 1783.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:150:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:151:_id429" title="Выбрать" type="checkbox" value="151"><input type="hidden" name="form:_id428:_us" value="151"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">63</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за май 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:151:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:152:_id429" title="Выбрать" type="checkbox" value="152"><input type="hidden" name="form:_id428:_us" value="152"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">65</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за май 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:152:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:153:_id429" title="Выбрать" type="checkbox" value="153"><input type="hidden" name="form:_id428:_us" value="153"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">62</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за июнь 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:153:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:154:_id429" title="Выбрать" type="checkbox" value="154"><input type="hidden" name="form:_id428:_us" value="154"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">64</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за июнь 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:154:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:155:_id429" title="Выбрать" type="checkbox" value="155"><input type="hidden" name="form:_id428:_us" value="155"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">100.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">66</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 2кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:155:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:156:_id429" title="Выбрать" type="checkbox" value="156"><input type="hidden" name="form:_id428:_us" value="156"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">14.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">61</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:156:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:157:_id429" title="Выбрать" type="checkbox" value="157"><input type="hidden" name="form:_id428:_us" value="157"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12 621.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">31.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">69</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 12621.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:157:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:158:_id429" title="Выбрать" type="checkbox" value="158"><input type="hidden" name="form:_id428:_us" value="158"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 731.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">31.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">68</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету Паевые взносы на оплату коммунальных платежей в соответсвии с письмом за Грибанова О.Г.  от 01.03.2019 за июль 2020 Сумма 1731.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:158:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:159:_id429" title="Выбрать" type="checkbox" value="159"><input type="hidden" name="form:_id428:_us" value="159"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">31.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">69</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:159:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:160:_id429" title="Выбрать" type="checkbox" value="160"><input type="hidden" name="form:_id428:_us" value="160"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">31.07.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">68</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:160:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:161:_id429" title="Выбрать" type="checkbox" value="161"><input type="hidden" name="form:_id428:_us" value="161"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">2 750.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">76</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОПС за 3 кв.2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:161:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:162:_id429" title="Выбрать" type="checkbox" value="162"><input type="hidden" name="form:_id428:_us" value="162"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">70</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за июль 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:162:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:163:_id429" title="Выбрать" type="checkbox" value="163"><input type="hidden" name="form:_id428:_us" value="163"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">813.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">72</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за июль 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:163:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:164:_id429" title="Выбрать" type="checkbox" value="164"><input type="hidden" name="form:_id428:_us" value="164"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">Управление Федерального Казначейства по Ярославской области (Межрайонная инспекция Федеральной налоговой службы №5 по Ярославской области) ИНН 7604016101 КПП 760401001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010010</span><div></div>БИК 047888001 ОТДЕЛЕНИЕ ЯРОСЛАВЛЬ г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">785.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">71</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">НДФЛ за август 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:164:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:165:_id429" title="Выбрать" type="checkbox" value="165"><input type="hidden" name="form:_id428:_us" value="165"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">637.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">75</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОМС за 3 кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:165:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:166:_id429" title="Выбрать" type="checkbox" value="166"><input type="hidden" name="form:_id428:_us" value="166"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">362.50</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">74</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОСС за 3кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:166:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:167:_id429" title="Выбрать" type="checkbox" value="167"><input type="hidden" name="form:_id428:_us" value="167"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">25.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">73</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 3кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:167:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:168:_id429" title="Выбрать" type="checkbox" value="168"><input type="hidden" name="form:_id428:_us" value="168"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ЗЕТТА СТРАХОВАНИЕ" ИНН 7710280644<div></div><span style="white-space: nowrap;">40701 810 0 0004 0000063</span><div></div>БИК 044525187 БАНК ВТБ (ПАО), г. Москва</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">2 638.69</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.08.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">115340</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">ВОЗНАГРАЖДЕНИЕ ПО ДОГОВОРУ №АГД-370-026332/14 СОГЛАСНО АКТА АВРР-370-2430687/20С УММА 2638-69БЕЗ НАЛОГА (НДС)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:168:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:168:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:169:_id429" title="Выбрать" type="checkbox" value="169"><input type="hidden" name="form:_id428:_us" value="169"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">1 731.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">77</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Паевые взносы на оплату коммунальных платежей в соответсвии с письмом за Грибанова   О.Г.  от 01.03.2019  за июль 2020 Сумма 1731.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:169:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:170:_id429" title="Выбрать" type="checkbox" value="170"><input type="hidden" name="form:_id428:_us" value="170"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">30312908</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за август 2020 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:170:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:171:_id429" title="Выбрать" type="checkbox" value="171"><input type="hidden" name="form:_id428:_us" value="171"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">77</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:171:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:172:_id429" title="Выбрать" type="checkbox" value="172"><input type="hidden" name="form:_id428:_us" value="172"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ГРИНВИЧ" ИНН 7707421824<div></div><span style="white-space: nowrap;">40702 810 4 0110 0016349</span><div></div>БИК 044525593 АО "АЛЬФА-БАНК", г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">85 689.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">15.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">447</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Возврат по Письму № 3 от 13.03.2020 за неиспользованные услуги по Заявке № PRG00313A1,  Сумма 85689-00 Без налога (НДС)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:172:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:172:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:173:_id429" title="Выбрать" type="checkbox" value="173"><input type="hidden" name="form:_id428:_us" value="173"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">5 454.90</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">16.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">79</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы на ОПС за 3 кв.2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:173:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:174:_id429" title="Выбрать" type="checkbox" value="174"><input type="hidden" name="form:_id428:_us" value="174"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 264.54</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">16.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">80</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОМС за 3 кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:174:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:175:_id429" title="Выбрать" type="checkbox" value="175"><input type="hidden" name="form:_id428:_us" value="175"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">812.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">16.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">78</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">НДФЛ за август 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:175:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:176:_id429" title="Выбрать" type="checkbox" value="176"><input type="hidden" name="form:_id428:_us" value="176"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">УФК по Ивановкой обл (Инспекция ФНС России по г. Иваново) ИНН 3728012590 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">719.05</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">16.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">82</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Страховые взносы на ОСС за 3кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:176:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:177:_id429" title="Выбрать" type="checkbox" value="177"><input type="hidden" name="form:_id428:_us" value="177"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">УФК по Ивановской области (Государственное учреждение - Ивановское региональное отделение Фонда социального страхования Российской Федерации) ИНН 3729009695 КПП 370201001<div></div><span style="white-space: nowrap;">40101 810 7 0000 0010001</span><div></div>БИК 042406001 ОТДЕЛЕНИЕ ИВАНОВО г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">24.59</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">16.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">81</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Страховые взносы травматизм за 3кв. 2020г. НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:177:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:178:_id429" title="Выбрать" type="checkbox" value="178"><input type="hidden" name="form:_id428:_us" value="178"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">АО Региональный Торговый Комплекс ИНН 3702555873 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0001716</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">20 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">21.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">83</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Аренда по договору 478-09/14-3Б Сумма 20000.00, в т.ч. НДС (20%) - 3333.33</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:178:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:179:_id429" title="Выбрать" type="checkbox" value="179"><input type="hidden" name="form:_id428:_us" value="179"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">ООО "Шкатулка" ИНН 4401078900 КПП 440101001<div></div><span style="white-space: nowrap;">40702 810 5 0000 0001690</span><div></div>БИК 043469720 ООО "КОСТРОМАСЕЛЬКОМБАНК" г. КОСТРОМА</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">2 137.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">21.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">84</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Оплата по счету Сумма 2137.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:179:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:180:_id429" title="Выбрать" type="checkbox" value="180"><input type="hidden" name="form:_id428:_us" value="180"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">21.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">83</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:180:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:181:_id429" title="Выбрать" type="checkbox" value="181"><input type="hidden" name="form:_id428:_us" value="181"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">21.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">84</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:181:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:182:_id429" title="Выбрать" type="checkbox" value="182"><input type="hidden" name="form:_id428:_us" value="182"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "МАТАДОР" ИНН 7604178399 КПП 760401001<div></div><span style="white-space: nowrap;">40702 810 3 1068 0007313</span><div></div>БИК 044525411 ФИЛИАЛ "ЦЕНТРАЛЬНЫЙ" БАНКА ВТБ (ПАО) г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 717.82</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">29.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">85</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">оплата по счету  Сумма 1717.82, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:182:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:183:_id429" title="Выбрать" type="checkbox" value="183"><input type="hidden" name="form:_id428:_us" value="183"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">29.09.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">85</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:183:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:184:_id429" title="Выбрать" type="checkbox" value="184"><input type="hidden" name="form:_id428:_us" value="184"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">01.10.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">30617124</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за сентябрь 2020 г.</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:184:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:185:_id429" title="Выбрать" type="checkbox" value="185"><input type="hidden" name="form:_id428:_us" value="185"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">АО "ТРЦ "СЕРЕБРЯНЫЙ ГОРОД" ИНН 3702230145 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0002087</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">15 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.10.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">88</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Аренда по договору Сумма 15000.00, в т.ч. НДС (20%) - 2500.00</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:185:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:186:_id429" title="Выбрать" type="checkbox" value="186"><input type="hidden" name="form:_id428:_us" value="186"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 802.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.10.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">87</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Паевые взносы на оплату коммунальных платежей в соответсвии с письмом за Грибанова О.Г. Сумма 1802.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:186:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:187:_id429" title="Выбрать" type="checkbox" value="187"><input type="hidden" name="form:_id428:_us" value="187"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">20.10.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">88</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:187:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:188:_id429" title="Выбрать" type="checkbox" value="188"><input type="hidden" name="form:_id428:_us" value="188"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">20.10.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">87</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:188:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:189:_id429" title="Выбрать" type="checkbox" value="189"><input type="hidden" name="form:_id428:_us" value="189"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;">АО "ТРЦ "СЕРЕБРЯНЫЙ ГОРОД" ИНН 3702230145 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 1 1700 0002087</span><div></div>БИК 042406608 ИВАНОВСКОЕ ОТДЕЛЕНИЕ N 8639 ПАО СБЕРБАНК, г. ИВАНОВО</div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;">15 757.24</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">10.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">434382</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Возврат излишне оплаченных ДС по ДА № 478-09/14-3Б от 12.09.14 г. Сумма 15757-24 В т.ч. НДС(20% / 120%) 2626-21</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:189:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:189:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:190:_id429" title="Выбрать" type="checkbox" value="190"><input type="hidden" name="form:_id428:_us" value="190"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 708.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">17.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">89</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Паевые взносы на оплату коммунальных платежей за Грибанова  Сумма 1708.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:190:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:191:_id429" title="Выбрать" type="checkbox" value="191"><input type="hidden" name="form:_id428:_us" value="191"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">17.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">89</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:191:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:192:_id429" title="Выбрать" type="checkbox" value="192"><input type="hidden" name="form:_id428:_us" value="192"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ЯРКОВА ЯНА ЮРЬЕВНА (ИП) ИНН 781415008707<div></div><span style="white-space: nowrap;">40802 810 9 9500 0005354</span><div></div>БИК 044525823 БАНК ГПБ (АО) г. МОСКВА</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">30 000.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">24.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">91</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по договору за аренду Сумма 30000.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:192:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:193:_id429" title="Выбрать" type="checkbox" value="193"><input type="hidden" name="form:_id428:_us" value="193"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">24.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">91</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:193:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:194:_id429" title="Выбрать" type="checkbox" value="194"><input type="hidden" name="form:_id428:_us" value="194"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ДАКРА" ИНН 3702733036 КПП 370201001<div></div><span style="white-space: nowrap;">40702 810 0 0200 0105618</span><div></div>БИК 047888760 ЯРОСЛАВСКИЙ Ф-Л ПАО "ПРОМСВЯЗЬБАНК" г. ЯРОСЛАВЛЬ</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">300.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">25.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">92</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Перевод денежных средств на другой счет организации.  Сумма 300.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:194:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:195:_id429" title="Выбрать" type="checkbox" value="195"><input type="hidden" name="form:_id428:_us" value="195"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">25.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">92</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:195:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:196:_id429" title="Выбрать" type="checkbox" value="196"><input type="hidden" name="form:_id428:_us" value="196"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">ООО "ЗЕТТА СТРАХОВАНИЕ" ИНН 7710280644<div></div><span style="white-space: nowrap;">40701 810 0 0004 0000063</span><div></div>БИК 044525187 БАНК ВТБ (ПАО), г. Москва</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;">1 510.86</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">30.11.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">169779</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">ВОЗНАГРАЖДЕНИЕ ПО ДОГОВОРУ №АГД-370-026332/14 СОГЛАСНО АКТА АВРР-370-1965895/19С УММА 1510-86БЕЗ НАЛОГА (НДС)</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:196:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="10"></td><td><a onclick="submitForm('form',1,{source:'form:_id428:196:_id462'});return false;" class="xl" href="#"><img title="Создать счет на оплату" alt="Создать счет на оплату" style="border-width:0.0px;" src="/clbAvn/images/edit_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:197:_id429" title="Выбрать" type="checkbox" value="197"><input type="hidden" name="form:_id428:_us" value="197"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2710202</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">900.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">01.12.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">31220701</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Комиссия за ведение банковского счета за ноябрь 2020 г.</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:197:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2t x62"><input name="form:_id428:_s" id="form:_id428:198:_id429" title="Выбрать" type="checkbox" value="198"><input type="hidden" name="form:_id428:_us" value="198"></td><td headers="form:_id428:_id430" class="x2r x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2n x62"><div class="columnData" style="width:200px;">СЭК "Девическая ,9" ИНН 3329033340 КПП 332901001<div></div><span style="white-space: nowrap;">40703 810 0 4100 0000103</span><div></div>БИК 041708772 ВЛАДИМИРСКИЙ РФ АО "РОССЕЛЬХОЗБАНК" г. ВЛАДИМИР</div></td><td headers="form:_id428:_id439" class="x2p x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2p x62" nowrap=""><span style="white-space: nowrap;">2 374.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2r x62">08.12.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2r x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">93</span></div></td><td headers="form:_id428:_id454" class="x2n x62"><div class="columnData" style="width:250px;">Оплата по счету 116 от 30 ноября 2020 Сумма 2374.00, НДС не облагается</div></td><td headers="form:_id428:_id457" class="x2r x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:198:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><td headers="_id0" class="x2w x62"><input name="form:_id428:_s" id="form:_id428:199:_id429" title="Выбрать" type="checkbox" value="199"><input type="hidden" name="form:_id428:_us" value="199"></td><td headers="form:_id428:_id430" class="x2u x62"><div class="columnData" style="width:150px;">ООО "ДАКРА"<div></div><span style="white-space: nowrap;">40702 810 0 0620 0028227</span></div></td><td headers="form:_id428:_id434" class="x2o x62"><div class="columnData" style="width:200px;"><div></div><span style="white-space: nowrap;">70601 810 8 0620 2740201</span></div></td><td headers="form:_id428:_id439" class="x2q x62" nowrap=""><span style="white-space: nowrap;"></span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id443" class="x2q x62" nowrap=""><span style="white-space: nowrap;">12.00</span><div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="90" height="1"></td><td headers="form:_id428:_id447" class="x2u x62">08.12.2020<div></div><img src="/clbAvn/adf/images/t.gif" alt="" width="70" height="1"></td><td headers="form:_id428:_id450" class="x2u x62"><div class="columnData" style="text-align:center;width:60px;"><span style="white-space: nowrap;">93</span></div></td><td headers="form:_id428:_id454" class="x2o x62"><div class="columnData" style="width:250px;">Плата за прием и обработку платежных документов</div></td><td headers="form:_id428:_id457" class="x2u x62"><table cellpadding="0" cellspacing="0" border="0" summary="" style="vertical-align:middle;text-align:center"><tbody><tr><td><a onclick="submitForm('form',0,{source:'form:_id428:199:_id459'});return false;" class="xl" href="#"><img title="Просмотр документа" alt="Просмотр документа" style="border-width:0.0px;" src="/clbAvn/images/view_enabled.gif" border="0" align="middle" height="24" width="24"></a></td></tr></tbody></table></td></tr><tr><th colspan="3" class="x32">Итого:</th><td headers="form:_id428:_id439" class="x34 x5o"><span style="font-weight: bold;font-size: 8pt;white-space: nowrap;">586 926.21</span></td><td headers="form:_id428:_id443" class="x34 x5o"><span style="font-weight: bold;font-size: 8pt;white-space: nowrap;">613 819.16</span></td><td headers="form:_id428:_id447" class="x35 x5o"></td><td headers="form:_id428:_id450" class="x35 x5o"></td><td headers="form:_id428:_id454" class="x35 x5o"></td><td headers="form:_id428:_id457" class="x35 x5o"></td></tr></tbody></table><table cellpadding="0" cellspacing="0" border="0" width="100%" summary=""></table><script>_uixt_form__id428=new CollectionComponent('form','form:_id428');</script><input type="hidden" name="form:_id428:rangeStart" value="0"></div>
-                </div>
-            <div class="panelFull panelDark" style="height:28px;">
-                    <div style="float: right; vertical-align:middle;"><a href="#" onclick="submitForm('form',1,{source:'form:_id640'});return false;"><img src="/clbAvn/adf/images/cache/ru/cd070b5dQ-1.gif" title="Назад" alt="Назад" border="0" align="absmiddle" width="54" height="16"></a>
-                    </div>
-            </div><div style="margin-top:5px"></div><input type="hidden" name="oracle.adf.faces.FORM" value="form"><span id="_form_Postscript"><input type="hidden" name="oracle.adf.faces.STATE_TOKEN" value="10"><input type="hidden" name="source"><input type="hidden" name="event"><input type="hidden" name="form:_id428:_sm"><script>var _resetformNames=["source","event","form:_id428:_sm"];</script><script>function _formValidator(){return true;}var form_SF={};</script></span><script>_submitFormCheck();</script></form>
-    """
-
-
-@pytest.fixture
-def payments_not_found_page() -> str:
-    return """<form id="form" name="form" style="margin:0px" onkeypress="return _submitOnEnter(event,'form');" method="POST" action="/clbAvn/faces/facelet-pages/con_acc_stat_v.jspx"><table cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr></tr></tbody></table>
-                <br>
-                <div class="pageTitle">
-                    Выписка консолидированная
-                </div><div style="margin-top:10px"></div>
-            <div class="panelFull panelDark" style="">
-                    <div style="float: right; vertical-align:middle;"><a href="#" onclick="submitForm('form',1,{source:'form:_id390'});return false;"><img src="/clbAvn/adf/images/cache/ru/cd070b5dQ-1.gif" title="Назад" alt="Назад" border="0" align="absmiddle" width="54" height="16"></a>
-                    </div><span style="font-weight:bold;">ПАО АКБ Авангард</span>
-                    <br><div style="margin-top:20px"></div>
-                    <div style="float: right; vertical-align:middle;text-align:right;">Входящий остаток:<img src="/clbAvn/adf/images/t.gif" alt="" width="5" height="1"><span style="font-weight: bold;">643.68</span>
-
-                        <br>Исходящий остаток:<img src="/clbAvn/adf/images/t.gif" alt="" width="5" height="1"><span style="font-weight: bold;">643.68</span><div style="margin-top:15px"></div><table id="form:selSort__xc_" cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr><td class="xe" valign="middle" nowrap=""><span class="xc"><label for="form:selSort">Сортировать по</label></span></td><td width="12"><img src="/clbAvn/adf/images/t.gif" alt="" width="12"></td><td valign="middle" nowrap=""><script>var _pprUpdateMode=false;function _adfspu(f,v,e,s,o){_pprUpdateMode=true;if(!o)o=new Object();o.event=(e)?e:'update';if(s)o.source=s;_submitPartialChange(f,v,o);}</script><select id="form:selSort" name="form:selSort" onchange="_adfspu('form',1,'form:selSort','form:selSort');return true;" class="x6"><option value="0">счету, дате, сумме</option><option value="1">счету, убывающей дате, сумме</option><option value="2" selected="">дате, сумме</option><option value="3">дате, возрастающей сумме</option><option value="4">убывающей дате, сумме</option><option value="5">контрагенту, дате, сумме</option><option value="6">контрагенту, убывающей дате, сумме</option></select></td></tr></tbody></table>
-                    </div>Консолидированная выписка по счетам:
-                    <br>
-                    <table cellspacing="0" cellpadding="0">
-                            <tbody><tr>
-                                <td><span style="font-weight:bold">40702 810 0 0620 0028227</span>
-                                </td>
-                                <td style="width:350px;"><span style="padding-right:5px;padding-left:5px;font-weight:bold">ООО "ДАКРА"</span>
-                                </td>
-                                <td>
-                                </td>
-                            </tr>
-                    </tbody></table><div style="margin-top:20px"></div><table cellpadding="0" cellspacing="0" border="0" summary=""><tbody><tr><td>С</td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td><span style="font-weight: bold;">10.10.2022</span></td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td>по</td><td><img src="/clbAvn/adf/images/t.gif" alt="" width="5"></td><td><span style="font-weight: bold;">10.10.2022</span></td></tr></tbody></table><table class="Error"></table>
-            </div><div style="margin-top:5px"></div>
-                <div style="padding:0px 0px 2px 0px;text-align:center;"><div id="form:_id428"><table cellpadding="0" cellspacing="0" border="0" width="100%" summary=""></table><table class="x2f" cellpadding="1" cellspacing="0" border="0" width="100%"><tbody><tr><th id="_id0" width="1%" nowrap="" class="x2z">Выбрать</th><th id="form:_id428:_id430" width="150" class="x2z x5o">Организация</th><th id="form:_id428:_id434" width="200" class="x2x x5o">Контрагент</th><th id="form:_id428:_id439" width="100" class="x2y x5o">Приход</th><th id="form:_id428:_id443" width="100" class="x2y x5o">Расход</th><th id="form:_id428:_id447" width="70" class="x2z x5o">Дата</th><th id="form:_id428:_id450" width="60" class="x2z x5o">№</th><th id="form:_id428:_id454" width="250" class="x2x x5o">Назначение платежа</th><th id="form:_id428:_id457" width="60px" class="x2z x5o"></th></tr><tr><td class="x2n x62"></td><td class="x2n x62">По запросу записей не найдено</td><td class="x2n x62"></td><td class="x2n x62" nowrap=""></td><td class="x2n x62" nowrap=""></td><td class="x2n x62"></td><td class="x2n x62"></td><td class="x2n x62"></td><td class="x2n x62"></td></tr><tr><th colspan="3" class="x32">Итого:</th><td headers="form:_id428:_id439" class="x34 x5o"><span style="font-weight: bold;font-size: 8pt;white-space: nowrap;">0.00</span></td><td headers="form:_id428:_id443" class="x34 x5o"><span style="font-weight: bold;font-size: 8pt;white-space: nowrap;">0.00</span></td><td headers="form:_id428:_id447" class="x35 x5o"></td><td headers="form:_id428:_id450" class="x35 x5o"></td><td headers="form:_id428:_id454" class="x35 x5o"></td><td headers="form:_id428:_id457" class="x35 x5o"></td></tr></tbody></table><table cellpadding="0" cellspacing="0" border="0" width="100%" summary=""></table><script>_uixt_form__id428=new CollectionComponent('form','form:_id428');</script><input type="hidden" name="form:_id428:rangeStart" value="0"></div>
-                </div>
-            <div class="panelFull panelDark" style="height:28px;">
-                    <div style="float: right; vertical-align:middle;"><a href="#" onclick="submitForm('form',1,{source:'form:_id640'});return false;"><img src="/clbAvn/adf/images/cache/ru/cd070b5dQ-1.gif" title="Назад" alt="Назад" border="0" align="absmiddle" width="54" height="16"></a>
-                    </div>
-            </div><div style="margin-top:5px"></div><input type="hidden" name="oracle.adf.faces.FORM" value="form"><span id="_form_Postscript"><input type="hidden" name="oracle.adf.faces.STATE_TOKEN" value="3"><input type="hidden" name="event"><input type="hidden" name="source"><script>var _resetformNames=["event","source"];</script><script>function _formValidator(){return true;}var form_SF={};</script></span><script>_submitFormCheck();</script></form>
-    """
+from app.avangard_parser import (
+    parse_income_payments,
+    parse_income_payments_stats,
+    _parse_invoice_number,
+    _parse_agent_inn,
+    _parse_payment_date,
+)
 
 
 async def test_parse_income_payments_happy_path(full_payments_page: str):
@@ -92,6 +24,22 @@ async def test_parse_income_payments_happy_path(full_payments_page: str):
     assert res[0].payment_number == 63
 
 
+async def test_parse_income_payments_bytes(full_payments_page: str):
+    res = parse_income_payments(full_payments_page.encode())
+
+    assert res == parse_income_payments(full_payments_page)
+
+
+async def test_parse_income_payments_stats(full_payments_page: str):
+    payments, skipped = parse_income_payments_stats(full_payments_page)
+
+    assert len(payments) == 8
+    assert skipped['non_income'] == 179
+    assert skipped['no_invoice'] == 13
+    assert skipped['no_inn'] == 0
+    assert skipped['invalid_columns'] > 0
+
+
 async def test_parse_income_payments_not_found(payments_not_found_page: str):
     res = parse_income_payments(payments_not_found_page)
 
@@ -124,3 +72,19 @@ def test_parse_agent_inn(payload: str, expected: int | None):
 
     assert res == expected
 
+
+@pytest.mark.parametrize('payload, expected', [
+    ('03.02.2020', datetime.date(year=2020, month=2, day=3)),
+    (' "31.12.2019"\n', datetime.date(year=2019, month=12, day=31)),
+    ('3.2.2020', datetime.date(year=2020, month=2, day=3)),
+])
+def test_parse_payment_date(payload: str, expected: datetime.date):
+    res = _parse_payment_date(payload)
+
+    assert res == expected
+
+
+@pytest.mark.parametrize('payload', ['', '31.02.2020', '2020-02-03'])
+def test_parse_payment_date_invalid(payload: str):
+    with pytest.raises(ValueError):
+        _parse_payment_date(payload)
@@ -0,0 +1,160 @@
+import asyncio
+import datetime
+import os
+
+import pytest
+
+from app.avangard_client import AvangardApi, UnauthorizedError
+from app.avangard_session import AvangardSession, process_tree_rss_mb
+from app.browser_pool import BrowserPool
+
+START_DATE = datetime.date(year=2020, month=1, day=1)
+END_DATE = datetime.date(year=2020, month=12, day=31)
+
+
+@pytest.fixture
+def client_mock(mocker):
+    client = mocker.AsyncMock(spec=AvangardApi)
+    client.login.return_value = True
+    client.get_income_payments.return_value = []
+    client.browser_pids = mocker.Mock(return_value={os.getpid()})
+    return client
+
+
+def _session(
+    client_mock,
+    max_iterations: int = 10,
+    max_rss_mb: float = 1024 * 1024,
+    browser_pool: BrowserPool | None = None,
+) -> AvangardSession:
+    return AvangardSession(
+        client_factory=lambda: client_mock,
+        login='login',
+        password='password',
+        max_iterations=max_iterations,
+        max_rss_mb=max_rss_mb,
+        browser_pool=browser_pool,
+    )
+
+
+async def test_get_income_payments_reuse_session(client_mock):
+    async with _session(client_mock) as session:
+        for _ in range(3):
+            res = await session.get_income_payments(START_DATE, END_DATE)
+            assert res == []
+
+    assert client_mock.setup_browser.call_count == 1
+    assert client_mock.login.call_count == 1
+    assert client_mock.get_income_payments.call_count == 3
+    assert client_mock.terminate.call_count == 1
+
+
+async def test_get_income_payments_relogin_expired(client_mock):
+    client_mock.get_income_payments.side_effect = [UnauthorizedError('Unauthorized'), []]
+
+    async with _session(client_mock) as session:
+        res = await session.get_income_payments(START_DATE, END_DATE)
+
+    assert res == []
+    assert client_mock.setup_browser.call_count == 1
+    assert client_mock.login.call_count == 2
+
+
+async def test_get_income_payments_login_failed(client_mock):
+    client_mock.login.return_value = False
+
+    async with _session(client_mock) as session:
+        with pytest.raises(UnauthorizedError):
+            await session.get_income_payments(START_DATE, END_DATE)
+
+    assert client_mock.get_income_payments.call_count == 0
+    assert client_mock.terminate.call_count == 1
+
+
+@pytest.mark.parametrize('session_kwargs', [
+    {'max_iterations': 2},
+    {'max_rss_mb': 0},
+])
+async def test_get_income_payments_recycle(client_mock, session_kwargs):
+    async with _session(client_mock, **session_kwargs) as session:
+        for _ in range(4):
+            await session.get_income_payments(START_DATE, END_DATE)
+
+    expected_recycles = 2 if 'max_iterations' in session_kwargs else 4
+    assert client_mock.setup_browser.call_count == expected_recycles
+    assert client_mock.terminate.call_count == expected_recycles
+
+
+def test_process_tree_rss_mb():
+    assert process_tree_rss_mb() > 0
+    assert process_tree_rss_mb([os.getpid()]) == process_tree_rss_mb()
+
+
+async def test_recycle_counts_own_browser_only(client_mock):
+    client_mock.browser_pids.return_value = set()
+
+    async with _session(client_mock, max_rss_mb=0) as session:
+        await session.get_income_payments(START_DATE, END_DATE)
+        await session.get_income_payments(START_DATE, END_DATE)
+
+    assert client_mock.setup_browser.call_count == 1
+
+
+async def test_get_income_payments_trace_next_call(client_mock):
+    async with _session(client_mock) as session:
+        session.trace_next_call('/tmp/trace.zip')
+        await session.get_income_payments(START_DATE, END_DATE)
+        await session.get_income_payments(START_DATE, END_DATE)
+
+    assert client_mock.start_tracing.call_count == 1
+    client_mock.stop_tracing.assert_called_once_with('/tmp/trace.zip')
+
+
+async def test_get_income_payments_failed_closes_client(client_mock):
+    client_mock.get_income_payments.side_effect = [RuntimeError('page crashed'), []]
+
+    async with _session(client_mock) as session:
+        with pytest.raises(RuntimeError):
+            await session.get_income_payments(START_DATE, END_DATE)
+        await session.get_income_payments(START_DATE, END_DATE)
+
+    assert client_mock.setup_browser.call_count == 2
+    assert client_mock.terminate.call_count == 2
+
+
+async def test_setup_failed_closes_client(client_mock):
+    client_mock.setup_browser.side_effect = RuntimeError('chromium crashed')
+
+    async with _session(client_mock) as session:
+        with pytest.raises(RuntimeError):
+            await session.get_income_payments(START_DATE, END_DATE)
+
+    assert client_mock.terminate.call_count == 1
+
+
+async def test_abort_kills_client(client_mock):
+    async with _session(client_mock) as session:
+        await session.get_income_payments(START_DATE, END_DATE)
+        await session.abort()
+
+    assert client_mock.kill.call_count == 1
+    assert client_mock.terminate.call_count == 0
+
+
+async def test_browser_slot_held_while_client_alive(client_mock):
+    async with BrowserPool(size=1) as pool:
+        first, second = _session(client_mock, browser_pool=pool), _session(client_mock, browser_pool=pool)
+        await first.get_income_payments(START_DATE, END_DATE)
+        waiting = asyncio.create_task(second.get_income_payments(START_DATE, END_DATE))
+        await asyncio.sleep(0.01)
+
+        assert not waiting.done()
+        assert pool.contended
+
+        await first.close()
+        await waiting
+        await second.abort()
+
+        assert not pool.contended
+        assert client_mock.setup_browser.call_count == 2
+        await asyncio.wait_for(pool.acquire(), 1)
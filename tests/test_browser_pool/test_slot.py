@@ -0,0 +1,26 @@
+import asyncio
+
+from app.browser_pool import BrowserPool
+
+
+async def test_slot_limits_browsers():
+    running = []
+    max_running = 0
+    contended = []
+
+    async def use_browser(pool: BrowserPool) -> None:
+        nonlocal max_running
+        async with pool.slot():
+            running.append(1)
+            max_running = max(max_running, len(running))
+            await asyncio.sleep(0.01)
+            contended.append(pool.contended)
+            running.pop()
+
+    async with BrowserPool(size=2) as pool:
+        await asyncio.gather(*[use_browser(pool) for _ in range(5)])
+
+    assert max_running == 2
+    assert contended[:3] == [True, True, True]
+    assert contended[-1] is False
+    assert not pool.contended
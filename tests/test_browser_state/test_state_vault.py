@@ -0,0 +1,56 @@
+import os
+import stat
+import time
+
+import pytest
+
+from app.browser_state import StateVault
+
+STATE = {'cookies': [{'name': 'JSESSIONID', 'value': 'secret-session', 'domain': 'corp.avangard.ru'}], 'origins': []}
+
+
+@pytest.fixture
+def state_path(tmp_path) -> str:
+    return str(tmp_path / 'state' / 'default.state')
+
+
+def test_save_load(state_path):
+    StateVault(state_path, 'secret').save(STATE)
+
+    with open(state_path, 'rb') as state_file:
+        assert b'secret-session' not in state_file.read()
+    assert stat.S_IMODE(os.stat(state_path).st_mode) == 0o600
+    assert StateVault(state_path, 'secret').load() == STATE
+
+
+def test_load_missing(state_path):
+    assert StateVault(state_path, 'secret').load() is None
+
+
+def test_load_wrong_secret(state_path):
+    StateVault(state_path, 'secret').save(STATE)
+
+    assert StateVault(state_path, 'other-secret').load() is None
+
+
+def test_load_tampered(state_path):
+    vault = StateVault(state_path, 'secret')
+    vault.save(STATE)
+    with open(state_path, 'r+b') as state_file:
+        state_file.seek(30)
+        original = state_file.read(1)
+        state_file.seek(30)
+        state_file.write(bytes([original[0] ^ 1]))
+
+    assert vault.load() is None
+
+
+def test_load_expired(state_path):
+    vault = StateVault(state_path, 'secret', max_age_hours=1)
+    vault.save(STATE)
+    two_hours_ago = time.time() - 2 * 60 * 60
+    os.utime(state_path, (two_hours_ago, two_hours_ago))
+
+    assert vault.load() is None
+    vault.clear()
+    assert not os.path.exists(state_path)
@@ -0,0 +1,39 @@
+import os
+
+from app.browser_state import trim_profile_dir
+
+
+def _write(path, size: int) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as profile_file:
+        profile_file.write(b'0' * size)
+
+
+def test_trim_profile_dir_small(tmp_path):
+    _write(tmp_path / 'Default' / 'Cache' / 'data_0', 1024)
+
+    assert trim_profile_dir(str(tmp_path), max_mb=1) == 0
+    assert (tmp_path / 'Default' / 'Cache' / 'data_0').exists()
+
+
+def test_trim_profile_dir_caches(tmp_path):
+    _write(tmp_path / 'Default' / 'Cache' / 'data_0', 600 * 1024)
+    _write(tmp_path / 'Default' / 'Service Worker' / 'CacheStorage' / 'index', 600 * 1024)
+    _write(tmp_path / 'Default' / 'Cookies', 1024)
+
+    freed = trim_profile_dir(str(tmp_path), max_mb=1)
+
+    assert freed == 1200 * 1024
+    assert not (tmp_path / 'Default' / 'Cache').exists()
+    assert not (tmp_path / 'Default' / 'Service Worker').exists()
+    assert (tmp_path / 'Default' / 'Cookies').exists()
+
+
+def test_trim_profile_dir_whole(tmp_path):
+    profile_dir = tmp_path / 'profile'
+    _write(profile_dir / 'Default' / 'History', 2 * 1024 * 1024)
+
+    freed = trim_profile_dir(str(profile_dir), max_mb=1)
+
+    assert freed == 2 * 1024 * 1024
+    assert not profile_dir.exists()
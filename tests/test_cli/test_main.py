@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from app.cli import main
+from tests.utils import PAGES_DIR
+
+
+def test_help_imports_no_heavy_modules():
+    check = 'import sys; from app import cli; cli.build_parser(); print(sorted(set(sys.modules) & {"playwright", "lxml", "pydantic", "app.settings"}))'
+
+    res = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True, env={})
+
+    assert res.stdout.strip() == '[]'
+
+
+def test_parse_file(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main([
+            'parse-file',
+            '--workers',
+            '1',
+            f'{PAGES_DIR}/full_payments_page.html',
+            f'{PAGES_DIR}/payments_not_found_page.html',
+            f'{PAGES_DIR}/full_payments_page.html',
+        ])
+
+    payments = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exc_info.value.code == 0
+    assert len(payments) == 8
+    assert payments[0]['income_amount'] == '9968.00'
+
+
+def test_fetch_once(mocker):
+    get_payments_mock = mocker.patch('app.sync_tool._get_income_payments', return_value=[])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(['fetch-once'])
+
+    assert exc_info.value.code == 0
+    assert get_payments_mock.call_count == 1
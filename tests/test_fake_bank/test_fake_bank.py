@@ -0,0 +1,56 @@
+import datetime
+import http.cookiejar
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from app.avangard_parser import parse_income_payments
+from app.statement_form import parse_statement_form
+from benchmarks.fake_bank import LOGIN_FORM_PATH, REPORTS_PATH, FakeBank
+from benchmarks.statement_generator import count_expected_payments
+
+
+@pytest.fixture
+def bank() -> FakeBank:
+    with FakeBank(rows=50) as fake_bank:
+        yield fake_bank
+
+
+@pytest.fixture
+def opener() -> urllib.request.OpenerDirector:
+    return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+
+def _post(opener, url: str, form: dict) -> str:
+    with opener.open(url, data=urllib.parse.urlencode(form).encode()) as response:
+        return response.read().decode()
+
+
+def test_login_and_statement(bank: FakeBank, opener):
+    main_page = _post(opener, f'{bank.base_url}{LOGIN_FORM_PATH}', {'login_v': 'login', 'passwd_v': 'password'})
+    assert 'Выписки и отчеты' in main_page
+
+    with opener.open(f'{bank.base_url}{REPORTS_PATH}') as response:
+        form = parse_statement_form(response.read().decode(), response.url)
+    assert form is not None
+    assert form.fields['source'] == 'docslist:main:_id95'
+
+    start_date = datetime.date(2020, 1, 1)
+    fields = form.with_dates(start_date, datetime.date(2020, 1, 31))
+    statement = _post(opener, form.action, fields)
+
+    assert len(parse_income_payments(statement)) == count_expected_payments(50, seed=start_date.toordinal())
+
+
+def test_login_failed(bank: FakeBank, opener):
+    login_page = _post(opener, f'{bank.base_url}{LOGIN_FORM_PATH}', {'login_v': 'login', 'passwd_v': 'invalid'})
+
+    assert 'Неверный логин или пароль' in login_page
+    assert not bank.sessions
+
+
+def test_unauthorized_redirects_to_login(bank: FakeBank, opener):
+    with opener.open(bank.main_page) as response:
+        assert response.url == bank.login_page
+        assert 'buttonLoginBank' in response.read().decode()
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.metrics import Registry
+
+
+@pytest.fixture
+def registry() -> Registry:
+    registry = Registry()
+    rows = registry.counter('parsed_rows', 'Parsed rows', ['result'])
+    rows.inc(8, result='income')
+    rows.inc(result='no_"inn"')
+    seconds = registry.histogram('parse_seconds', 'Parse duration', buckets=(0.1, 1))
+    seconds.observe(0.05)
+    seconds.observe(0.5)
+    seconds.observe(5)
+    return registry
+
+
+def test_render(registry: Registry):
+    res = registry.render()
+
+    assert res.splitlines() == [
+        '# HELP parsed_rows Parsed rows',
+        '# TYPE parsed_rows counter',
+        'parsed_rows_total{result="income"} 8',
+        r'parsed_rows_total{result="no_\"inn\""} 1',
+        '# HELP parse_seconds Parse duration',
+        '# TYPE parse_seconds histogram',
+        'parse_seconds_bucket{le="0.1"} 1',
+        'parse_seconds_bucket{le="1"} 2',
+        'parse_seconds_bucket{le="+Inf"} 3',
+        'parse_seconds_sum 5.55',
+        'parse_seconds_count 3',
+    ]
+
+
+def test_labels_mismatch(registry: Registry):
+    counter = registry.counter('calls', 'Calls', ['step'])
+
+    with pytest.raises(ValueError):
+        counter.inc(stage='login')
+    with pytest.raises(ValueError):
+        registry.counter('calls', 'Calls again')
+
+
+def test_histogram_time():
+    histogram = Registry().histogram('step_seconds', 'Step duration', ['step'])
+
+    with pytest.raises(RuntimeError):
+        with histogram.time(step='login'):
+            raise RuntimeError('failed step is measured too')
+
+    assert histogram.count(step='login') == 1
+
+
+def test_write_textfile(registry: Registry, tmp_path):
+    path = tmp_path / 'avangard.prom'
+
+    registry.write_textfile(str(path))
+
+    assert path.read_text() == registry.render()
+    assert [file.name for file in tmp_path.iterdir()] == ['avangard.prom']
+
+
+async def test_serve(registry: Registry):
+    server = await registry.serve('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n')
+    response = await reader.read()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    assert response.startswith(b'HTTP/1.1 200 OK\r\n')
+    assert response.endswith(registry.render().encode())
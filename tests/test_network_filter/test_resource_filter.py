@@ -0,0 +1,53 @@
+import pytest
+
+from app.network_filter import ResourceFilter
+
+
+@pytest.fixture
+def resource_filter() -> ResourceFilter:
+    return ResourceFilter()
+
+
+@pytest.mark.parametrize('resource_type, url, expected', [
+    ('document', 'https://corp.avangard.ru/clbAvn/faces/facelet-pages/iday_balance.jspx', False),
+    ('script', 'https://corp.avangard.ru/clbAvn/adf/jsLibs/Common.js', False),
+    ('stylesheet', 'https://login.avangard.ru/css/main.css', False),
+    ('image', 'https://login.avangard.ru/img/logo.png', True),
+    ('font', 'https://login.avangard.ru/fonts/pt-sans.woff2', True),
+    ('image', 'https://corp.avangard.ru/clbAvn/adf/images/t.gif', False),
+    ('script', 'https://mc.yandex.ru/metrika/tag.js', True),
+    ('script', 'https://www.googletagmanager.com/gtm.js?id=GTM-1', True),
+])
+def test_is_blocked(resource_filter: ResourceFilter, resource_type: str, url: str, expected: bool):
+    assert resource_filter.is_blocked(resource_type, url) is expected
+
+
+async def test_route(resource_filter: ResourceFilter, mocker):
+    blocked_route = mocker.AsyncMock()
+    blocked_route.request.resource_type = 'image'
+    blocked_route.request.url = 'https://login.avangard.ru/img/logo.png'
+    allowed_route = mocker.AsyncMock()
+    allowed_route.request.resource_type = 'document'
+    allowed_route.request.url = 'https://login.avangard.ru/'
+
+    await resource_filter._route(blocked_route)
+    await resource_filter._route(allowed_route)
+
+    assert blocked_route.abort.call_count == 1
+    assert blocked_route.continue_.call_count == 0
+    assert allowed_route.continue_.call_count == 1
+    assert resource_filter.stats.blocked == 1
+
+
+async def test_track(resource_filter: ResourceFilter, mocker):
+    request = mocker.AsyncMock()
+    request.sizes.return_value = {'responseHeadersSize': 100, 'responseBodySize': 900}
+    await resource_filter._on_request_finished(request)
+
+    with resource_filter.track('search') as step_stats:
+        await resource_filter._on_request_finished(request)
+        await resource_filter._on_request_finished(request)
+
+    assert step_stats.requests == 2
+    assert step_stats.bytes == 2000
+    assert resource_filter.stats.bytes == 3000
@@ -0,0 +1,86 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.moysklad_client import MoyskladClient
+
+STATES = [
+    {'name': 'Ожидает оплаты', 'meta': {'href': 'http://fake/states/wait', 'type': 'state'}},
+    {'name': 'Оплачен', 'meta': {'href': 'http://fake/states/paid', 'type': 'state'}},
+]
+
+
+def make_order(idx: int, name: str, inn: str, amount: int, payed: int = 0) -> dict:
+    return {
+        'meta': {'href': f'http://fake/entity/customerorder/{idx}', 'type': 'customerorder'},
+        'name': name,
+        'sum': amount,
+        'payedSum': payed,
+        'agent': {'name': f'agent {inn}', 'inn': inn},
+        'state': STATES[0],
+    }
+
+
+class FakeMoysklad(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeMoyskladHandler)
+        self.orders: list[dict] = []
+        self.requests: list[tuple[str, str, object]] = []
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class FakeMoyskladHandler(BaseHTTPRequestHandler):
+    server: FakeMoysklad
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append(('GET', url.path, parse_qs(url.query)))
+        if url.path.endswith('/metadata'):
+            return self._reply({'states': STATES})
+
+        query = parse_qs(url.query)
+        offset, limit = int(query['offset'][0]), int(query['limit'][0])
+        state_name = query['filter'][0].split('=', 1)[1]
+        orders = [order for order in self.server.orders if order['state']['name'] == state_name]
+        self._reply({'meta': {'size': len(orders), 'limit': limit, 'offset': offset}, 'rows': orders[offset:offset + limit]})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.requests.append(('POST', self.path, body))
+        assert self.headers['Authorization'] == 'Bearer secret'
+        for update in body:
+            order = next(order for order in self.server.orders if order['meta']['href'] == update['meta']['href'])
+            order['state'] = next(state for state in STATES if state['meta'] == update['state']['meta'])
+        self._reply(body)
+
+    def _reply(self, payload):
+        content = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def fake_moysklad() -> FakeMoysklad:
+    server = FakeMoysklad()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def moysklad_client(fake_moysklad: FakeMoysklad) -> MoyskladClient:
+    return MoyskladClient('secret', fake_moysklad.url, timeout_seconds=5)
@@ -0,0 +1,50 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import AvangardPayment
+from app.moysklad_client import MoyskladClient, MoyskladError
+from app.order_matching import OrderMatcher
+from tests.test_order_matching.conftest import FakeMoysklad, make_order
+
+
+def _payment(payment_number: int, invoice_number: str, amount: str) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=payment_number,
+        payment_date=datetime.date(year=2022, month=10, day=20),
+        agent_inn=7713264418,
+        invoice_number=invoice_number,
+        income_amount=Decimal(amount),
+        description=f'Оплата по счету №{invoice_number}',
+    )
+
+
+async def test_process_happy_path(fake_moysklad: FakeMoysklad, moysklad_client: MoyskladClient):
+    fake_moysklad.orders = [make_order(idx, f'{idx:05d}', '7713264418', 100 * idx) for idx in range(1, 251)]
+    matcher = OrderMatcher(moysklad_client, 'Ожидает оплаты', 'Оплачен', batch_size=2)
+    payments = [_payment(1, '00010', '10'), _payment(2, '00020', '20'), _payment(3, '00030', '30'), _payment(4, '00005', '7')]
+
+    res = await matcher.process(payments)
+
+    assert [match.status for match in res] == ['matched', 'matched', 'matched', 'amount_mismatch']
+    assert [order['state']['name'] for order in fake_moysklad.orders[9:30:10]] == ['Оплачен'] * 3
+    requests = [(method, path) for method, path, _ in fake_moysklad.requests]
+    assert requests.count(('GET', '/entity/customerorder')) == 3
+    assert requests.count(('GET', '/entity/customerorder/metadata')) == 1
+    assert requests.count(('POST', '/entity/customerorder')) == 2
+
+
+async def test_process_no_payments(fake_moysklad: FakeMoysklad, moysklad_client: MoyskladClient):
+    res = await OrderMatcher(moysklad_client, 'Ожидает оплаты', 'Оплачен').process([])
+
+    assert res == []
+    assert fake_moysklad.requests == []
+
+
+async def test_process_unknown_state(fake_moysklad: FakeMoysklad, moysklad_client: MoyskladClient):
+    fake_moysklad.orders = [make_order(1, '1', '7713264418', 100)]
+    matcher = OrderMatcher(moysklad_client, 'Ожидает оплаты', 'Закрыт')
+
+    with pytest.raises(MoyskladError):
+        await matcher.process([_payment(1, '1', '1')])
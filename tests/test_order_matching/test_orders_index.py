@@ -0,0 +1,79 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import AvangardPayment
+from app.moysklad_client import MoyskladOrder, normalize_invoice_number
+from app.order_matching import OrdersIndex
+
+
+def _order(name: str, inn: int | None, sum_kopecks: int, payed_kopecks: int = 0) -> MoyskladOrder:
+    return MoyskladOrder(
+        href=f'http://fake/{name}',
+        name=name,
+        invoice_number=normalize_invoice_number(name),
+        agent_inn=inn,
+        sum_kopecks=sum_kopecks,
+        payed_kopecks=payed_kopecks,
+    )
+
+
+def _payment(invoice_number: str, inn: int, amount: str) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=1,
+        payment_date=datetime.date(year=2022, month=10, day=20),
+        agent_inn=inn,
+        invoice_number=invoice_number,
+        income_amount=Decimal(amount),
+        description=f'Оплата по счету №{invoice_number}',
+    )
+
+
+@pytest.fixture
+def orders_index() -> OrdersIndex:
+    return OrdersIndex([
+        _order('01110', 7713264418, 996800),
+        _order('1111', 7713264418, 500000, payed_kopecks=100000),
+        _order('2000', None, 1050),
+        _order('3000', 4401078900, 700000),
+        _order('3001', 4401078900, 700000),
+        _order('4000', 3728012590, 120000),
+    ])
+
+
+@pytest.mark.parametrize('payment, status, order_name', [
+    (_payment('01110', 7713264418, '9968'), 'matched', '01110'),
+    (_payment('1110', 7713264418, '9968'), 'matched', '01110'),
+    (_payment('1111', 7713264418, '4000.00'), 'matched', '1111'),
+    (_payment('1111', 7713264418, '5000'), 'amount_mismatch', '1111'),
+    (_payment('2000', 1234567890, '10.50'), 'matched', '2000'),
+    (_payment('01110', 1234567890, '9968'), 'inn_mismatch', '01110'),
+    (_payment('999', 4401078900, '7000'), 'ambiguous', '3000'),
+    (_payment('999', 3728012590, '1200'), 'matched', '4000'),
+    (_payment('999', 3728012590, '1300'), 'not_found', None),
+])
+def test_match(orders_index: OrdersIndex, payment, status, order_name):
+    res = orders_index.match(payment)
+
+    assert res.status == status
+    assert (res.order.name if res.order else None) == order_name
+
+
+def test_match_order_once(orders_index: OrdersIndex):
+    first = orders_index.match(_payment('4000', 3728012590, '1200'))
+    second = orders_index.match(_payment('4000', 3728012590, '1200'))
+
+    assert first.status == 'matched'
+    assert second.status == 'not_found'
+    assert len(orders_index) == 5
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('01110', '01110'),
+    (' 00 12 ', '0012'),
+    ('СЧ-0042/1', '0042'),
+    ('без номера', ''),
+])
+def test_normalize_invoice_number(source, expected):
+    assert normalize_invoice_number(source) == expected
@@ -0,0 +1,69 @@
+import datetime
+import os
+
+from app.page_archive import PageArchive, statement_digest
+from tests.utils import read_page
+
+WINDOW = (datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+
+
+def _archived_pages(root_dir) -> list[str]:
+    return [
+        os.path.join(root, filename)
+        for root, _, files in os.walk(root_dir / 'pages')
+        for filename in files
+    ]
+
+
+def test_store_same_page_once(tmp_path):
+    archive = PageArchive(str(tmp_path))
+    html_source = read_page('full_payments_page')
+
+    first = archive.store(WINDOW, html_source)
+    second = archive.store(WINDOW, html_source)
+
+    pages = _archived_pages(tmp_path)
+    assert first == second
+    assert len(pages) == 1
+    assert archive.load(os.path.basename(pages[0]).split('.')[0]) == html_source
+    index_files = [filename for filename in os.listdir(tmp_path) if filename.startswith('index-')]
+    with open(tmp_path / index_files[0], encoding='utf-8') as index_file:
+        assert len(index_file.readlines()) == 2
+
+
+def test_cached_payments(tmp_path):
+    archive = PageArchive(str(tmp_path))
+    statement = archive.store(WINDOW, read_page('full_payments_page'))
+
+    assert archive.cached_payments(WINDOW, statement) is None
+    archive.remember(WINDOW, statement, [])
+    assert archive.cached_payments(WINDOW, statement) == []
+    assert archive.cached_payments(WINDOW, statement_digest(read_page('payments_not_found_page'))) is None
+    assert archive.cached_payments((WINDOW[0], WINDOW[0]), statement) is None
+
+
+def test_statement_digest_ignores_page_around_table():
+    html_source = read_page('full_payments_page')
+    changed_row = html_source.replace('Оплата', 'Оплатa', 1)
+
+    assert statement_digest(html_source) == statement_digest(html_source.replace('</form>', '<input></form>'))
+    assert statement_digest(html_source) != statement_digest(changed_row)
+
+
+def test_prune(tmp_path):
+    archive = PageArchive(str(tmp_path), max_age_days=1, max_mb=0.02)
+    old_page = tmp_path / 'pages' / 'aa' / 'old.html.gz'
+    old_page.parent.mkdir(parents=True)
+    old_page.write_bytes(b'0')
+    week_ago = (datetime.datetime.now() - datetime.timedelta(days=7)).timestamp()
+    os.utime(old_page, (week_ago, week_ago))
+    archive.store(WINDOW, read_page('full_payments_page'))
+    assert not old_page.exists()
+    archive.store(WINDOW, read_page('payments_not_found_page'))
+    assert len(_archived_pages(tmp_path)) == 2
+
+    removed = archive.prune()
+
+    assert len(removed) == 1
+    assert _archived_pages(tmp_path) != removed
+    assert len(_archived_pages(tmp_path)) == 1
@@ -0,0 +1,46 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import parse_income_payments, payment_key
+from app.payment_batch import CompactPayment, PaymentBatch, from_kopecks, to_kopecks
+from tests.utils import read_page
+
+
+@pytest.fixture
+def parsed_payments():
+    return parse_income_payments(read_page('full_payments_page'))
+
+
+def test_payment_batch_roundtrip(parsed_payments):
+    batch = PaymentBatch.from_payments(parsed_payments)
+
+    assert len(batch) == len(parsed_payments) == 8
+    assert list(batch) == parsed_payments
+    assert batch[0] == parsed_payments[0]
+    assert list(batch.keys()) == [payment_key(payment) for payment in parsed_payments]
+    assert batch.columns()['amount_kopecks'][0] == 996800
+
+
+def test_compact_payment_roundtrip(parsed_payments):
+    compact = [CompactPayment.from_payment(payment) for payment in parsed_payments]
+
+    assert [payment.to_payment() for payment in compact] == parsed_payments
+    assert compact[0].payment_date_ordinal == datetime.date(year=2020, month=2, day=3).toordinal()
+    assert len(set(compact + compact)) == len(parsed_payments)
+
+
+@pytest.mark.parametrize('amount, kopecks', [
+    (Decimal('9968'), 996800),
+    (Decimal('14000.50'), 1400050),
+    (Decimal('0.01'), 1),
+])
+def test_kopecks(amount: Decimal, kopecks: int):
+    assert to_kopecks(amount) == kopecks
+    assert from_kopecks(kopecks) == amount
+
+
+def test_kopecks_fraction():
+    with pytest.raises(ValueError):
+        to_kopecks(Decimal('0.001'))
@@ -0,0 +1,85 @@
+import asyncio
+
+from app.pipeline import Pipeline, Stage
+
+
+async def test_pipeline_passes_results_to_next_stage():
+    collected = []
+
+    async def double(number):
+        return number * 2
+
+    async def collect(number):
+        collected.append(number)
+
+    async with Pipeline('test', [Stage('double', double), Stage('collect', collect)]) as pipeline:
+        for number in range(5):
+            await pipeline.put(number)
+        drained = await pipeline.close(drain_timeout=1)
+
+    assert drained
+    assert collected == [0, 2, 4, 6, 8]
+
+
+async def test_pipeline_backpressure():
+    release = asyncio.Event()
+
+    async def slow(number):
+        await release.wait()
+
+    async with Pipeline('test', [Stage('slow', slow, queue_size=1)]) as pipeline:
+        await pipeline.put(1)
+        await pipeline.put(2)
+        # first entry is in worker, second is queued: third put waits for free place
+        blocked_put = asyncio.create_task(pipeline.put(3))
+        await asyncio.sleep(0.01)
+        assert not blocked_put.done()
+
+        release.set()
+        await asyncio.wait_for(blocked_put, 1)
+        assert await pipeline.close(drain_timeout=1)
+
+
+async def test_pipeline_stage_failure_does_not_stop_workers():
+    collected = []
+
+    async def check(number):
+        if number == 1:
+            raise ValueError('bad entry')
+        collected.append(number)
+
+    async with Pipeline('test', [Stage('check', check, concurrency=2)]) as pipeline:
+        for number in range(3):
+            await pipeline.put(number)
+        await pipeline.close(drain_timeout=1)
+
+    assert sorted(collected) == [0, 2]
+    assert pipeline.failures == {'check': 1}
+
+
+async def test_pipeline_drain_timeout():
+    async def hang(number):
+        await asyncio.sleep(10)
+
+    async with Pipeline('test', [Stage('hang', hang)]) as pipeline:
+        await pipeline.put(1)
+        drained = await pipeline.close(drain_timeout=0.01)
+
+    assert not drained
+
+
+async def test_pipeline_stage_deadline():
+    collected = []
+
+    async def collect(delay):
+        await asyncio.sleep(delay)
+        collected.append(delay)
+
+    async with Pipeline('test', [Stage('collect', collect, deadline=0.05)]) as pipeline:
+        await pipeline.put(10)
+        await pipeline.put(0)
+        drained = await pipeline.close(drain_timeout=1)
+
+    assert drained
+    assert collected == [0]
+    assert pipeline.stuck == {'collect': 1}
@@ -0,0 +1,63 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import AvangardPayment
+from app.processed_payments import ProcessedPayments
+
+TODAY = datetime.datetime.utcnow().date()
+
+
+def _payment(payment_number: int, days_ago: int = 0, agent_inn: int = 7713264418) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=payment_number,
+        payment_date=TODAY - datetime.timedelta(days=days_ago),
+        agent_inn=agent_inn,
+        invoice_number='1110',
+        income_amount=Decimal('9968'),
+        description='Оплата по счету №1110',
+    )
+
+
+@pytest.fixture
+def processed_payments(sync_db_path: str) -> ProcessedPayments:
+    with ProcessedPayments(sync_db_path, retention_days=30) as index:
+        yield index
+
+
+def test_filter_unseen_happy_path(processed_payments: ProcessedPayments):
+    processed_payments.mark_processed([_payment(1), _payment(2)])
+
+    res = processed_payments.filter_unseen([
+        _payment(1),
+        _payment(2, agent_inn=3728012590),
+        _payment(3),
+        _payment(3),
+        _payment(4, days_ago=31),
+    ])
+
+    assert [(payment.payment_number, payment.agent_inn) for payment in res] == [(2, 3728012590), (3, 7713264418)]
+    assert _payment(1) in processed_payments
+    assert _payment(3) not in processed_payments
+
+
+def test_filter_unseen_persisted(processed_payments: ProcessedPayments, sync_db_path: str):
+    processed_payments.mark_processed([_payment(1), _payment(1)])
+
+    with ProcessedPayments(sync_db_path, retention_days=30) as reopened:
+        res = reopened.filter_unseen([_payment(1), _payment(2)])
+
+    assert [payment.payment_number for payment in res] == [2]
+
+
+def test_compact(sync_db_path: str):
+    with ProcessedPayments(sync_db_path, retention_days=60) as index:
+        index.mark_processed([_payment(1, days_ago=10), _payment(2, days_ago=45)])
+
+    with ProcessedPayments(sync_db_path, retention_days=30) as index:
+        assert len(index) == 1
+        assert index.compact() == 0
+
+    with ProcessedPayments(sync_db_path, retention_days=60) as index:
+        assert len(index) == 1
@@ -0,0 +1,67 @@
+import os
+import pstats
+import time
+
+import pytest
+
+from app.profiling import IterationProfiler
+
+
+def _busy_loop(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_profile_not_requested(tmp_path):
+    profiler = IterationProfiler(str(tmp_path / 'profiles'))
+
+    with profiler.profile('sync'):
+        _busy_loop(0.01)
+
+    assert not os.path.exists(tmp_path / 'profiles')
+
+
+def test_profile_cprofile_requested_once(tmp_path):
+    profiler = IterationProfiler(str(tmp_path))
+    traces = []
+
+    profiler.request()
+    with profiler.profile('sync', trace=traces.append):
+        _busy_loop(0.01)
+    with profiler.profile('sync', trace=traces.append):
+        _busy_loop(0.01)
+
+    dumps = os.listdir(tmp_path)
+    assert len(dumps) == 1
+    assert dumps[0].endswith('-sync.pstats')
+    assert pstats.Stats(str(tmp_path / dumps[0])).total_calls > 0
+    assert len(traces) == 1
+    assert traces[0].endswith('-sync-trace.zip')
+
+
+def test_profile_sampling(tmp_path):
+    profiler = IterationProfiler(str(tmp_path), mode='sampling', playwright_trace=False, always=True)
+
+    with pytest.raises(RuntimeError):
+        with profiler.profile('sync', trace=pytest.fail):
+            _busy_loop(0.1)
+            raise RuntimeError('failed iteration is saved too')
+
+    dumps = os.listdir(tmp_path)
+    assert len(dumps) == 1
+    assert dumps[0].endswith('-sync.folded')
+    assert '_busy_loop' in (tmp_path / dumps[0]).read_text()
+
+
+def test_rotate(tmp_path):
+    profiler = IterationProfiler(str(tmp_path), max_files=3, max_mb=1)
+    for idx in range(5):
+        dump_path = tmp_path / f'dump{idx}'
+        dump_path.write_bytes(b'0' * 1024 * 300)
+        os.utime(dump_path, (idx, idx))
+
+    res = profiler.rotate()
+
+    assert sorted(os.path.basename(path) for path in res) == ['dump0', 'dump1']
+    assert sorted(os.listdir(tmp_path)) == ['dump2', 'dump3', 'dump4']
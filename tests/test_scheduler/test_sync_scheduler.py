@@ -0,0 +1,88 @@
+import asyncio
+import datetime
+
+import pytest
+
+from app.scheduler import SyncScheduler, serve_trigger_socket
+
+WORKDAY_NOON = datetime.datetime(year=2022, month=10, day=20, hour=12)
+WORKDAY_NIGHT = datetime.datetime(year=2022, month=10, day=20, hour=3)
+SUNDAY_NOON = datetime.datetime(year=2022, month=10, day=23, hour=12)
+HOLIDAY_NOON = datetime.datetime(year=2022, month=11, day=4, hour=12)
+
+
+@pytest.fixture
+def scheduler() -> SyncScheduler:
+    return SyncScheduler(
+        base_interval=100,
+        min_interval=10,
+        max_interval=1000,
+        holidays=[HOLIDAY_NOON.date()],
+        jitter=0,
+    )
+
+
+@pytest.mark.parametrize('now, expected', [
+    (WORKDAY_NOON, 100),
+    (WORKDAY_NIGHT, 400),
+    (SUNDAY_NOON, 400),
+    (HOLIDAY_NOON, 400),
+])
+def test_next_interval_calendar(scheduler: SyncScheduler, now, expected):
+    assert scheduler.next_interval(now) == expected
+
+
+def test_next_interval_arrival_rate(scheduler: SyncScheduler):
+    for _ in range(10):
+        scheduler.record_success(new_payments=3)
+
+    assert 25 < scheduler.next_interval(WORKDAY_NOON) < 30
+
+    for _ in range(20):  # noqa: WPS440
+        scheduler.record_success(new_payments=0)
+
+    assert scheduler.next_interval(WORKDAY_NOON) > 99
+
+
+def test_next_interval_backoff(scheduler: SyncScheduler):
+    intervals = []
+    for _ in range(5):
+        scheduler.record_failure()
+        intervals.append(scheduler.next_interval(WORKDAY_NOON))
+
+    assert intervals == [200, 400, 800, 1000, 1000]
+
+    scheduler.record_success(new_payments=0)
+    assert scheduler.next_interval(WORKDAY_NOON) == 100
+
+
+def test_next_interval_jitter():
+    scheduler = SyncScheduler(base_interval=100, min_interval=10, max_interval=1000, jitter=0.1)
+
+    intervals = {scheduler.next_interval(WORKDAY_NOON) for _ in range(20)}
+
+    assert len(intervals) > 1
+    assert all(90 <= interval <= 110 for interval in intervals)
+
+
+async def test_wait_trigger(scheduler: SyncScheduler):
+    assert await scheduler.wait(0.01) is False
+
+    asyncio.get_running_loop().call_later(0.01, scheduler.trigger)
+
+    assert await scheduler.wait(10) is True
+    assert await scheduler.wait(0.01) is False
+
+
+async def test_serve_trigger_socket(scheduler: SyncScheduler, tmp_path):
+    socket_path = str(tmp_path / 'sync.sock')
+    server = await serve_trigger_socket(socket_path, scheduler.trigger)
+
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    res = await reader.readline()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    assert res == b'ok\n'
+    assert await scheduler.wait(0.01) is True
@@ -0,0 +1,169 @@
+import asyncio
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from app.avangard_parser import AvangardPayment
+from app.sinks import JsonlSink, PaymentSink, SinkError, SpoolSink, SqliteSink, WebhookSink, create_sink
+
+
+def _payment(payment_number: int) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=payment_number,
+        payment_date=datetime.date(2022, 10, 20),
+        agent_inn=7713264418,
+        invoice_number='1110',
+        income_amount=Decimal('9968'),
+        description='Оплата по счету №1110',
+    )
+
+
+class FlakySink(PaymentSink):
+    kind = 'flaky'
+
+    def __init__(self, failures: int, **options):
+        super().__init__('test', retry_delay=0, **options)
+        self.failures = failures
+        self.batches = []
+
+    async def _write(self, records):
+        if self.failures:
+            self.failures -= 1
+            raise OSError('connection reset')
+        self.batches.append([record['idempotency_key'] for record in records])
+
+
+async def test_sink_batches_by_size():
+    sink = FlakySink(failures=0, batch_size=2)
+
+    assert await sink.send([_payment(1)]) == 0
+    assert await sink.send([_payment(2), _payment(3)]) == 3
+    assert sink.batches == [
+        ['1-2022-10-20-7713264418', '2-2022-10-20-7713264418'],
+        ['3-2022-10-20-7713264418'],
+    ]
+
+
+async def test_sink_flushes_by_time():
+    sink = FlakySink(failures=0, flush_seconds=0)
+
+    assert await sink.send([_payment(1)]) == 1
+    assert sink.batches == [['1-2022-10-20-7713264418']]
+
+
+async def test_sink_flushes_by_time_in_background():
+    sink = FlakySink(failures=0, flush_seconds=0.01)
+    sink.start()
+
+    assert await sink.send([_payment(1)]) == 0
+    await asyncio.sleep(0.05)
+    assert sink.batches == [['1-2022-10-20-7713264418']]
+
+    await sink.close()
+    assert sink.batches == [['1-2022-10-20-7713264418']]
+
+
+async def test_sink_retries_write():
+    sink = FlakySink(failures=2, batch_size=1, retries=3)
+
+    assert await sink.send([_payment(1)]) == 1
+    assert len(sink.batches) == 1
+
+
+async def test_sink_keeps_failed_batch():
+    sink = FlakySink(failures=2, batch_size=1, retries=2)
+
+    with pytest.raises(SinkError):
+        await sink.send([_payment(1)])
+    assert await sink.flush() == 1
+    assert sink.batches == [['1-2022-10-20-7713264418']]
+
+
+async def test_jsonl_sink(tmp_path):
+    path = tmp_path / 'payments.jsonl'
+    sink = JsonlSink(str(path), 'test')
+
+    await sink.send([_payment(1), _payment(2)])
+    await sink.close()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record['payment_number'] for record in records] == [1, 2]
+    assert records[0]['account'] == 'test'
+    assert records[0]['income_amount'] == '9968'
+
+
+async def test_sqlite_sink_ignores_repeated_payments(tmp_path):
+    db_path = str(tmp_path / 'sink.sqlite3')
+    sink = SqliteSink(db_path, 'test', batch_size=1)
+
+    await sink.send([_payment(1)])
+    await sink.send([_payment(1), _payment(2)])
+    await sink.close()
+
+    with sqlite3.connect(db_path) as connection:
+        keys = [row[0] for row in connection.execute('SELECT idempotency_key FROM sink_payments ORDER BY 1')]
+    assert keys == ['1-2022-10-20-7713264418', '2-2022-10-20-7713264418']
+
+
+async def test_spool_sink_replaces_retried_batch(tmp_path):
+    sink = SpoolSink(str(tmp_path), 'test')
+
+    await sink.send([_payment(1)])
+    await sink.flush()
+    await sink.send([_payment(1)])
+    await sink.flush()
+
+    messages = os.listdir(tmp_path / 'new')
+    assert len(messages) == 1
+    message = json.loads((tmp_path / 'new' / messages[0]).read_text())
+    assert message['account'] == 'test'
+    assert message['payments'][0]['payment_number'] == 1
+
+
+async def test_webhook_sink():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            received.append((self.headers['Idempotency-Key'], json.loads(body)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sink = WebhookSink(f'http://127.0.0.1:{server.server_port}/payments', 'test')
+    try:
+        await sink.send([_payment(1)])
+        await sink.flush()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(received) == 1
+    idempotency_key, message = received[0]
+    assert len(idempotency_key) == 64
+    assert message['payments'][0]['idempotency_key'] == '1-2022-10-20-7713264418'
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('jsonl:/tmp/{account}.jsonl', JsonlSink),
+    ('spool:/tmp/{account}', SpoolSink),
+    ('https://example.com/payments', WebhookSink),
+])
+def test_create_sink(url, expected):
+    assert isinstance(create_sink(url, 'first', timeout_seconds=5), expected)
+
+
+def test_create_sink_unknown():
+    with pytest.raises(ValueError):
+        create_sink('kafka://localhost', 'first')
@@ -0,0 +1,66 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.statement_batch import iter_statement_files, parse_statement_files, unique_payments, write_payments
+from tests.utils import read_page
+
+
+@pytest.fixture
+def statements_dir(tmp_path):
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'a.html').write_text(read_page('full_payments_page'), encoding='utf-8')
+    (tmp_path / 'nested' / 'b.html.gz').write_bytes(gzip.compress(read_page('full_payments_page').encode()))
+    (tmp_path / 'nested' / 'c.html').write_text(read_page('payments_not_found_page'), encoding='utf-8')
+    (tmp_path / 'nested' / 'notes.txt').write_text('skip me')
+    return tmp_path
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_statement_files(statements_dir, workers: int):
+    paths = list(iter_statement_files([str(statements_dir)]))
+
+    res = list(parse_statement_files(paths, workers))
+
+    assert [file_result.path for file_result in res] == [
+        str(statements_dir / 'a.html'),
+        str(statements_dir / 'nested' / 'b.html.gz'),
+        str(statements_dir / 'nested' / 'c.html'),
+    ]
+    assert [len(file_result.payments) for file_result in res] == [8, 8, 0]
+    assert res[0].skipped == res[1].skipped
+    assert res[0].skipped['no_invoice'] > 0
+    assert len(list(unique_payments(res))) == 8
+
+
+def test_parse_statement_files_broken(tmp_path):
+    broken_path = tmp_path / 'broken.html.gz'
+    broken_path.write_bytes(gzip.compress(b'<html>')[:12])
+
+    res = list(parse_statement_files([str(broken_path), str(tmp_path / 'missing.html')]))
+
+    assert all(file_result.error for file_result in res)
+    assert not list(unique_payments(res))
+
+
+@pytest.mark.parametrize('output_format', ['jsonl', 'csv', 'columns'])
+def test_write_payments(statements_dir, output_format):
+    payments = list(unique_payments(parse_statement_files([str(statements_dir / 'a.html')])))
+    stream = io.StringIO()
+
+    count = write_payments(payments, stream, output_format)
+
+    stream.seek(0)
+    if output_format == 'jsonl':
+        records = [json.loads(line) for line in stream]
+    elif output_format == 'csv':
+        records = list(csv.DictReader(stream))
+    else:
+        columns = json.load(stream)
+        records = [dict(zip(columns, row_values)) for row_values in zip(*columns.values())]
+    assert count == len(records) == 8
+    assert records[0]['income_amount'] == '9968.00'
+    assert records[0]['payment_date'] == '2020-02-03'
@@ -0,0 +1,37 @@
+import datetime
+
+from app.statement_form import parse_statement_form
+from tests.utils import read_page
+
+PAGE_URL = 'https://corp.avangard.ru/clbAvn/faces/facelet-pages/iday_balance.jspx'
+
+
+def test_parse_statement_form_happy_path():
+    form = parse_statement_form(read_page('reports_page'), PAGE_URL)
+
+    assert form.action == 'https://corp.avangard.ru/clbAvn/faces/facelet-pages/docs_list.jspx'
+    assert form.fields == {
+        'docslist:main:startdate': '01.01.2020',
+        'docslist:main:finishdate': '31.01.2020',
+        'docslist:main:acc': '1',
+        'docslist:main:cons': 't',
+        'oracle.adf.faces.FORM': 'docslist',
+        'oracle.adf.faces.STATE_TOKEN': '7',
+        'event': '',
+        'source': 'docslist:main:_id95',
+    }
+
+
+def test_parse_statement_form_with_dates():
+    form = parse_statement_form(read_page('reports_page'), PAGE_URL)
+
+    res = form.with_dates(datetime.date(2021, 3, 1), datetime.date(2021, 3, 7))
+
+    assert res['docslist:main:startdate'] == '01.03.2021'
+    assert res['docslist:main:finishdate'] == '07.03.2021'
+    assert res['source'] == 'docslist:main:_id95'
+    assert form.fields['docslist:main:startdate'] == '01.01.2020'
+
+
+def test_parse_statement_form_not_found():
+    assert parse_statement_form(read_page('full_payments_page'), PAGE_URL) is None
@@ -0,0 +1,62 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import AvangardPayment
+from app.sync_state import SyncState
+
+TODAY = datetime.date(year=2022, month=10, day=20)
+
+
+@pytest.fixture
+def sync_state(sync_db_path: str) -> SyncState:
+    with SyncState(sync_db_path, overlap_days=1, backfill_days=20, backfill_chunk_days=7) as state:
+        yield state
+
+
+def _payment(payment_date: datetime.date, payment_number: int) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=payment_number,
+        payment_date=payment_date,
+        agent_inn=7713264418,
+        invoice_number='1110',
+        income_amount=Decimal('9968'),
+        description='Оплата по счету №1110',
+    )
+
+
+def test_fetch_windows_cold_start(sync_state: SyncState):
+    res = sync_state.fetch_windows(TODAY)
+
+    assert sync_state.get_mark() is None
+    assert res == [
+        (datetime.date(2022, 9, 30), datetime.date(2022, 10, 6)),
+        (datetime.date(2022, 10, 7), datetime.date(2022, 10, 13)),
+        (datetime.date(2022, 10, 14), datetime.date(2022, 10, 20)),
+    ]
+
+
+def test_fetch_windows_by_mark(sync_state: SyncState):
+    sync_state.update_mark(datetime.date(2022, 10, 18), [])
+
+    res = sync_state.fetch_windows(TODAY)
+
+    assert res == [(datetime.date(2022, 10, 17), TODAY)]
+
+
+def test_update_mark_persisted(sync_state: SyncState, sync_db_path: str):
+    sync_state.update_mark(datetime.date(2022, 10, 18), [
+        _payment(datetime.date(2022, 10, 17), 12),
+        _payment(datetime.date(2022, 10, 18), 3),
+        _payment(datetime.date(2022, 10, 18), 5),
+        _payment(datetime.date(2022, 10, 16), 40),
+    ])
+    sync_state.update_mark(datetime.date(2022, 10, 15), [])
+
+    with SyncState(sync_db_path, overlap_days=1, backfill_days=20, backfill_chunk_days=7) as reopened:
+        mark = reopened.get_mark()
+
+    assert mark.synced_until == datetime.date(2022, 10, 18)
+    assert mark.last_payment_date == datetime.date(2022, 10, 18)
+    assert mark.last_payment_number == 5
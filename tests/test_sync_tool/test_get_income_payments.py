@@ -1,11 +1,15 @@
-from app.sync_tool import _get_income_payments
+import datetime
+
+from app.sync_tool import _create_avangard_session, _get_income_payments
 
 
 async def test_get_income_payments_happy_path(mocker):
     login_mock = mocker.patch('app.sync_tool.AvangardApi.login')
     get_payments_mock = mocker.patch('app.sync_tool.AvangardApi.get_income_payments', return_value=[])
+    windows = [(datetime.date(year=2020, month=1, day=1), datetime.date(year=2020, month=1, day=7))]
 
-    res = await _get_income_payments()
+    async with _create_avangard_session() as avangard_session:
+        res = await _get_income_payments(avangard_session, windows)
 
     assert len(res) == 0
     assert login_mock.call_count == 1
@@ -1,3 +1,11 @@
+import asyncio
+import datetime
+import json
+import os
+from decimal import Decimal
+
+from app.avangard_parser import AvangardPayment
+from app.settings import AvangardAccount, app_settings
 from app.sync_tool import main
 
 
@@ -10,3 +18,56 @@ async def test_main_happy_path(mocker):
     assert res['iteration'] == 2
     assert res['fails'] == 0
     assert get_payments_mock.call_count == 2
+
+
+async def test_main_many_accounts(mocker, monkeypatch, sync_db_path):
+    get_payments_mock = mocker.patch('app.sync_tool._get_income_payments', return_value=[])
+    monkeypatch.setattr(app_settings, 'avangard_browser_pool_size', 1)
+    monkeypatch.setattr(app_settings, 'avangard_accounts', [
+        AvangardAccount(name='first', login='first', password='secret'),
+        AvangardAccount(name='second', login='second', password='secret'),
+    ])
+
+    res = await main(throttling_max_time=0.1, max_iterations=2)
+
+    assert res['success'] == 4
+    assert res['iteration'] == 4
+    assert res['fails'] == 0
+    assert get_payments_mock.call_count == 4
+    assert os.path.exists(sync_db_path.replace('.sqlite3', '_first.sqlite3'))
+    assert os.path.exists(sync_db_path.replace('.sqlite3', '_second.sqlite3'))
+
+
+async def test_main_writes_new_payments_to_sinks(mocker, monkeypatch, tmp_path):
+    payment = AvangardPayment(
+        payment_number=1,
+        payment_date=datetime.date.today(),
+        agent_inn=7713264418,
+        invoice_number='1110',
+        income_amount=Decimal('9968'),
+        description='Оплата по счету №1110',
+    )
+    mocker.patch('app.sync_tool._get_income_payments', return_value=[payment])
+    monkeypatch.setattr(app_settings, 'sync_sinks', [f'jsonl:{tmp_path}/{{account}}.jsonl'])
+
+    await main(throttling_max_time=0.1, max_iterations=2)
+
+    lines = (tmp_path / 'default.jsonl').read_text().splitlines()
+    assert [json.loads(line)['payment_number'] for line in lines] == [1]
+
+
+async def test_main_stuck_fetch_recovered(mocker, monkeypatch):
+    async def get_payments(*args):
+        if get_payments_mock.call_count == 1:
+            await asyncio.sleep(10)
+        return []
+
+    get_payments_mock = mocker.patch('app.sync_tool._get_income_payments', side_effect=get_payments)
+    monkeypatch.setattr(app_settings, 'sync_cycle_deadline', 0.05)
+
+    res = await main(throttling_max_time=0.1, max_iterations=2)
+
+    assert res['stuck'] == 1
+    assert res['recovered'] == 1
+    assert res['fails'] == 1
+    assert res['success'] == 1
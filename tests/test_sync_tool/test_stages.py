@@ -0,0 +1,76 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.avangard_parser import AvangardPayment, payment_key
+from app.sync_state import SyncState
+from app.sync_tool import FetchedBatch, _dedup_stage, _update_stage  # noqa: WPS450
+
+WINDOW = (datetime.date(2022, 10, 1), datetime.date(2022, 10, 2))
+
+
+def _payment(payment_number: int) -> AvangardPayment:
+    return AvangardPayment(
+        payment_number=payment_number,
+        payment_date=WINDOW[0],
+        agent_inn=7713264418,
+        invoice_number='1110',
+        income_amount=Decimal('9968'),
+        description='Оплата по счету №1110',
+    )
+
+
+@pytest.fixture
+def sync_account(mocker):
+    account = mocker.Mock(in_flight=set(), order_matcher=None, updating=[], failed_updates=0)
+    account.name = 'test'
+    account.processed_payments.filter_unseen.side_effect = list
+    return account
+
+
+async def test_dedup_skips_payments_in_flight(sync_account):
+    payments = [_payment(1), _payment(2)]
+    first = await _dedup_stage(sync_account, FetchedBatch([WINDOW], payments[:1]))
+
+    second = await _dedup_stage(sync_account, FetchedBatch([WINDOW], payments))
+
+    assert first.new_payments == payments[:1]
+    assert second.new_payments == payments[1:]
+    assert sync_account.in_flight == set(map(payment_key, payments))
+
+
+async def test_failed_update_releases_in_flight(sync_account):
+    payments = [_payment(1)]
+    batch = await _dedup_stage(sync_account, FetchedBatch([WINDOW], payments))
+    sync_account.processed_payments.mark_processed.side_effect = RuntimeError('db is locked')
+
+    with pytest.raises(RuntimeError):
+        await _update_stage(sync_account, batch)
+
+    assert not sync_account.in_flight
+
+
+async def test_failed_update_keeps_sync_mark(sync_account, sync_db_path):
+    # both batches fetched the same backfill window, second one skips payment of first as in flight
+    backfill_window = (WINDOW[0], WINDOW[0] + datetime.timedelta(days=7))
+    sync_account.sync_state = SyncState(sync_db_path, overlap_days=1, backfill_days=7, backfill_chunk_days=7)
+    sync_account.sync_state.update_mark(WINDOW[0], [])
+    payments = [_payment(1), _payment(2)]
+    first = await _dedup_stage(sync_account, FetchedBatch([backfill_window], payments[:1]))
+    second = await _dedup_stage(sync_account, FetchedBatch([backfill_window], payments))
+    sync_account.processed_payments.mark_processed.side_effect = [RuntimeError('db is locked'), None, None]
+
+    with pytest.raises(RuntimeError):
+        await _update_stage(sync_account, first)
+    await _update_stage(sync_account, second)
+
+    assert sync_account.sync_state.get_mark().synced_until == WINDOW[0]
+    next_windows = sync_account.sync_state.fetch_windows(backfill_window[1])
+    assert next_windows[0][0] <= payments[0].payment_date
+
+    retry = await _dedup_stage(sync_account, FetchedBatch(next_windows, payments))
+    await _update_stage(sync_account, retry)
+
+    assert retry.new_payments == payments
+    assert sync_account.sync_state.get_mark().synced_until == backfill_window[1]
@@ -0,0 +1,50 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from app.watchdog import (
+    DeadlineError,
+    browser_marker,
+    find_marked_pids,
+    kill_process_tree,
+    process_tree,
+    read_proc_stats,
+    run_with_deadline,
+)
+
+SPAWN_CHILD = (
+    'import subprocess, sys, time;'
+    'subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"]);'
+    'time.sleep(30)'
+)
+
+
+async def test_run_with_deadline():
+    assert await run_with_deadline(asyncio.sleep(0, result=1), 1, 'fast') == 1
+
+    with pytest.raises(DeadlineError, match='slow'):
+        await run_with_deadline(asyncio.sleep(1), 0.01, 'slow')
+
+
+def test_process_tree():
+    proc_stats = {1: (0, 0), 10: (1, 0), 11: (10, 0), 12: (11, 0), 20: (1, 0)}
+
+    assert process_tree([10, 99], proc_stats) == {10, 11, 12}
+
+
+async def test_kill_process_tree():
+    marker = browser_marker()
+    process = subprocess.Popen([sys.executable, '-c', SPAWN_CHILD, marker])
+    deadline = time.monotonic() + 5
+    while len(process_tree([process.pid], read_proc_stats())) < 2 and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+
+    assert find_marked_pids(marker) == {process.pid}
+    killed = await kill_process_tree(find_marked_pids(marker), grace_seconds=1)
+
+    assert len(killed) == 2
+    assert process.poll() is not None
+    assert not find_marked_pids(marker)
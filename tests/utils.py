@@ -1,5 +1,23 @@
+import functools
+import os
+
+from playwright.sync_api import sync_playwright
+
 from app.settings import app_settings
 
+PAGES_DIR = os.path.join(os.path.dirname(__file__), 'test_avangard_parser', 'pages')
+
 
 def avangard_client_configured() -> bool:
     return app_settings.avangard_login and app_settings.avangard_password
+
+
+def read_page(name: str) -> str:
+    with open(os.path.join(PAGES_DIR, f'{name}.html'), encoding='utf-8') as page_file:
+        return page_file.read()
+
+
+@functools.lru_cache
+def chromium_installed() -> bool:
+    with sync_playwright() as playwright:
+        return os.path.exists(playwright.chromium.executable_path)